@@ -5,6 +5,7 @@ Demonstrates ChatbotAgent, FrustrationAgent, and QualityAgent working together
 Optimized processing logic with early escalation detection
 """
 
+import atexit
 import json
 import logging
 import time
@@ -71,6 +72,7 @@ def initialize_system():
         # Use configuration files as intended - no hardcoded overrides
         # Initialize context manager  
         context_manager = SQLiteContextProvider(config_manager=config_manager)
+        atexit.register(context_manager.close)
         
         # Initialize agents
         context_manager_agent = ContextManagerAgentNode(config_manager, context_manager)
@@ -727,10 +729,6 @@ def process_user_input_with_realtime_updates(message: str, history: List[Dict],
         final_history = new_history + [{'role': 'assistant', 'content': response}]
         logs_state.append(f"[{datetime.now().strftime('%H:%M:%S')}] ✅ Processing complete")
         
-        # Keep logs manageable
-        if len(logs_state) > 50:
-            logs_state = logs_state[-50:]
-        
     except Exception as e:
         error_msg = f"I apologize, but I encountered an error processing your request: {str(e)}"
         final_history = new_history + [{'role': 'assistant', 'content': error_msg}]
@@ -743,6 +741,9 @@ def process_user_input_with_realtime_updates(message: str, history: List[Dict],
         selected_agent = None
         response = error_msg
     
+    # Keep logs manageable; trim in place so the session's log state stays bounded
+    del logs_state[:-50]
+    
     # Format displays
     logs_display = format_logs_display(logs_state)
     frustration_display = format_analysis_display(frustration_analysis, "😠 Frustration Analysis", "frustration_agent")
@@ -5,9 +5,11 @@ Handles loading and managing configuration for the new agent-centric structure
 with support for shared configs, environment overrides, and hot reloading.
 """
 
+import copy
 import logging
 import os
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from threading import Lock
 from typing import Any
@@ -15,6 +17,22 @@ from typing import Any
 import yaml
 
 
+@lru_cache(maxsize=256)
+def _parse_yaml(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a YAML file once per (modification time, size) revision"""
+    with open(path) as f:
+        return yaml.safe_load(f)
+
+
+def _load_yaml(path: Path) -> Any:
+    """Load a YAML file, reusing the parse while the file is unchanged
+
+    Returns a deep copy because environment overrides mutate what is loaded.
+    """
+    stat = path.stat()
+    return copy.deepcopy(_parse_yaml(str(path), stat.st_mtime_ns, stat.st_size))
+
+
 class ConfigLoadError(Exception):
     """Raised when configuration loading fails"""
     pass
@@ -188,34 +206,31 @@ class AgentConfigManager:
         # Load system config
         system_file = shared_dir / "system.yaml"
         if system_file.exists():
-            with open(system_file) as f:
-                system_data = yaml.safe_load(f) or {}
-                self._system_config = SystemConfig(
-                    name=system_data.get('system', {}).get('name', 'Modular LangGraph Hybrid System'),
-                    version=system_data.get('system', {}).get('version', '1.0.0'),
-                    environment=self.environment,
-                    thresholds=system_data.get('thresholds', {}),
-                    providers=system_data.get('providers', {}),
-                    monitoring=system_data.get('monitoring', {}),
-                    security=system_data.get('security', {}),
-                    performance=system_data.get('performance', {})
-                )
+            system_data = _load_yaml(system_file) or {}
+            self._system_config = SystemConfig(
+                name=system_data.get('system', {}).get('name', 'Modular LangGraph Hybrid System'),
+                version=system_data.get('system', {}).get('version', '1.0.0'),
+                environment=self.environment,
+                thresholds=system_data.get('thresholds', {}),
+                providers=system_data.get('providers', {}),
+                monitoring=system_data.get('monitoring', {}),
+                security=system_data.get('security', {}),
+                performance=system_data.get('performance', {})
+            )
         else:
             self._system_config = SystemConfig(environment=self.environment)
 
         # Load models config
         models_file = shared_dir / "models.yaml"
         if models_file.exists():
-            with open(models_file) as f:
-                self._models_config = yaml.safe_load(f) or {}
-                # Load model aliases
-                self._model_aliases = self._models_config.get('model_aliases', {})
+            self._models_config = _load_yaml(models_file) or {}
+            # Load model aliases
+            self._model_aliases = self._models_config.get('model_aliases', {})
 
         # Load providers config
         providers_file = shared_dir / "providers.yaml"
         if providers_file.exists():
-            with open(providers_file) as f:
-                self._providers_config = yaml.safe_load(f) or {}
+            self._providers_config = _load_yaml(providers_file) or {}
 
     def _load_agent_configs(self) -> None:
         """Load all agent configurations"""
@@ -243,20 +258,17 @@ class AgentConfigManager:
             # Load main config
             config_file = agent_dir / "config.yaml"
             if config_file.exists():
-                with open(config_file) as f:
-                    config_data = yaml.safe_load(f) or {}
+                config_data = _load_yaml(config_file) or {}
 
             # Load prompts
             prompts_file = agent_dir / "prompts.yaml"
             if prompts_file.exists():
-                with open(prompts_file) as f:
-                    prompts_data = yaml.safe_load(f) or {}
+                prompts_data = _load_yaml(prompts_file) or {}
 
             # Load models
             models_file = agent_dir / "models.yaml"
             if models_file.exists():
-                with open(models_file) as f:
-                    models_data = yaml.safe_load(f) or {}
+                models_data = _load_yaml(models_file) or {}
 
             # Use only models.yaml for model configuration (config.yaml models section removed)
             merged_models = models_data
@@ -316,8 +328,7 @@ class AgentConfigManager:
             return
 
         try:
-            with open(env_file) as f:
-                env_data = yaml.safe_load(f) or {}
+            env_data = _load_yaml(env_file) or {}
 
             # Apply system-level overrides
             if 'system' in env_data and self._system_config:
@@ -3,7 +3,12 @@ Context management for storing and retrieving conversation context
 """
 
 import json
+import os
+import queue
 import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from typing import Any
 
@@ -11,6 +16,15 @@ from ..core.logging import get_logger
 from ..interfaces.core.context import ContextEntry, ContextProvider
 from .database_config import DatabaseConfig
 
+# Applied to every pooled connection when it is opened
+_CONNECTION_PRAGMAS = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA busy_timeout=5000;
+    PRAGMA cache_size=-20000;
+    PRAGMA temp_store=MEMORY;
+"""
+
 
 class SQLiteContextProvider(ContextProvider):
     """SQLite-based context provider with connection pooling"""
@@ -32,6 +46,15 @@ class SQLiteContextProvider(ContextProvider):
         else:
             self.db_path = self.db_config.get_db_path()
 
+        # Read-only connections are opened lazily up to one per core; all
+        # writes share a single connection so they never contend for the lock
+        self._read_pool: queue.Queue[sqlite3.Connection] = queue.Queue()
+        self._read_pool_size = os.cpu_count() or 1
+        self._read_conns_opened = 0
+        self._read_pool_lock = threading.Lock()
+        self._write_conn: sqlite3.Connection | None = None
+        self._write_lock = threading.Lock()
+
         self.logger = get_logger(__name__)
         self.logger.info(
             "SQLite context provider initialized",
@@ -43,6 +66,86 @@ class SQLiteContextProvider(ContextProvider):
         )
         self._init_database()
 
+    def _open_connection(self, read_only: bool) -> sqlite3.Connection:
+        """Open a tuned connection that may be handed between threads"""
+        # Writers take the database lock up front so transactions never fail to upgrade
+        conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            isolation_level=None if read_only else "IMMEDIATE",
+        )
+        conn.executescript(_CONNECTION_PRAGMAS)
+        if read_only:
+            conn.execute("PRAGMA query_only=ON")
+        return conn
+
+    @contextmanager
+    def _reader(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a read-only connection from the pool"""
+        try:
+            conn = self._read_pool.get_nowait()
+        except queue.Empty:
+            with self._read_pool_lock:
+                can_open = self._read_conns_opened < self._read_pool_size
+                if can_open:
+                    self._read_conns_opened += 1
+            conn = self._open_connection(read_only=True) if can_open else self._read_pool.get()
+        try:
+            yield conn
+        finally:
+            self._read_pool.put(conn)
+
+    @contextmanager
+    def _writer(self) -> Iterator[sqlite3.Connection]:
+        """Hold the single write connection and run the block as one transaction"""
+        with self._write_lock:
+            if self._write_conn is None:
+                self._write_conn = self._open_connection(read_only=False)
+            with self._write_conn as conn:
+                yield conn
+
+    def configure_for_simulation(self, pool_size: int = 1) -> None:
+        """Cap the read pool at pool_size connections for a simulation run
+
+        Connections are pooled and tuned by default; simulations sized for a
+        known number of concurrent cycles use this to bound how many readers
+        are opened. Writes always share the single write connection.
+        """
+        with self._read_pool_lock:
+            self._read_pool_size = max(1, pool_size)
+
+        self.logger.info(
+            "SQLite context provider configured for simulation",
+            extra={
+                "db_path": self.db_path,
+                "pool_size": pool_size,
+                "operation": "configure_for_simulation"
+            }
+        )
+
+    @contextmanager
+    def acquire_conn(self) -> Iterator[sqlite3.Connection]:
+        """Borrow the write connection and run the block as a single transaction"""
+        with self._writer() as conn:
+            yield conn
+
+    def __enter__(self) -> "SQLiteContextProvider":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close all pooled connections; later calls reopen them as needed"""
+        with self._write_lock:
+            if self._write_conn is not None:
+                self._write_conn.close()
+                self._write_conn = None
+        with self._read_pool_lock:
+            while not self._read_pool.empty():
+                self._read_pool.get_nowait().close()
+            self._read_conns_opened = 0
+
     def _init_database(self):
         """Initialize the database with required tables and optimizations"""
         with sqlite3.connect(self.db_path) as conn:
@@ -90,9 +193,7 @@ class SQLiteContextProvider(ContextProvider):
     def save_context_entry(self, entry: ContextEntry) -> bool:
         """Save a context entry to the database"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                # Enable optimizations for this connection
-                conn.execute("PRAGMA synchronous=NORMAL")
+            with self._writer() as conn:
                 conn.execute(
                     """
                     INSERT OR REPLACE INTO context_entries 
@@ -126,7 +227,7 @@ class SQLiteContextProvider(ContextProvider):
     def get_context_summary(self, user_id: str, session_id: str) -> dict[str, Any]:
         """Get context summary for user/session"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._reader() as conn:
                 # Get basic counts
                 cursor = conn.execute(
                     """
@@ -154,16 +255,17 @@ class SQLiteContextProvider(ContextProvider):
 
                 recent_queries = [row[0] for row in cursor.fetchall()]
 
-                # Get escalation count
-                escalation_count = type_counts.get("escalation", 0)
+            # Get escalation count
+            escalation_count = type_counts.get("escalation", 0)
 
-                return {
-                    "entries_count": sum(type_counts.values()),
-                    "type_breakdown": type_counts,
-                    "recent_queries": recent_queries,
-                    "escalation_count": escalation_count,
-                    "last_activity": self._get_last_activity(user_id, session_id),
-                }
+            # Looked up after releasing the connection so a full pool cannot deadlock
+            return {
+                "entries_count": sum(type_counts.values()),
+                "type_breakdown": type_counts,
+                "recent_queries": recent_queries,
+                "escalation_count": escalation_count,
+                "last_activity": self._get_last_activity(user_id, session_id),
+            }
         except Exception as e:
             self.logger.error(
                 "Failed to get context summary",
@@ -223,7 +325,7 @@ class SQLiteContextProvider(ContextProvider):
                     query += " OFFSET ?"
                     params.append(offset)
 
-            with sqlite3.connect(self.db_path) as conn:
+            with self._reader() as conn:
                 cursor = conn.execute(query, params)
 
                 entries = []
@@ -268,7 +370,7 @@ class SQLiteContextProvider(ContextProvider):
     ) -> list[ContextEntry]:
         """Get recent context entries"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._reader() as conn:
                 cursor = conn.execute(
                     """
                     SELECT entry_id, user_id, session_id, timestamp, entry_type, content, metadata
@@ -310,7 +412,7 @@ class SQLiteContextProvider(ContextProvider):
     def _get_last_activity(self, user_id: str, session_id: str) -> datetime | None:
         """Get timestamp of last activity"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._reader() as conn:
                 cursor = conn.execute(
                     """
                     SELECT timestamp
@@ -342,7 +444,7 @@ class SQLiteContextProvider(ContextProvider):
         """Clean up old context entries"""
         cutoff_date = datetime.now() - timedelta(days=days)
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._writer() as conn:
                 conn.execute(
                     """
                     DELETE FROM context_entries
@@ -372,7 +474,7 @@ class SQLiteContextProvider(ContextProvider):
     def get_context_metrics(self) -> dict[str, Any]:
         """Get context metrics and statistics"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._reader() as conn:
                 cursor = conn.cursor()
 
                 # Total queries
@@ -225,6 +225,10 @@ class AppLogger:
         for key in keys:
             self._context.pop(key, None)
 
+    def is_enabled_for(self, level: int) -> bool:
+        """Check whether a message at this level would be handled"""
+        return self._logger.isEnabledFor(level)
+
     def _log_with_context(self, level: int, msg: str, *args, **kwargs) -> None:
         """Log message with automatic context injection"""
         # Merge persistent context with message-specific context
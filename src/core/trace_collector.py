@@ -9,6 +9,7 @@ and system decision information.
 import json
 import csv
 import io
+import threading
 import uuid
 from datetime import datetime, timedelta
 from typing import Any, Optional
@@ -46,6 +47,10 @@ class TraceCollector(TraceCollectorInterface):
         
         # Track next sequence numbers for agent interactions
         self._interaction_counters: dict[str, int] = {}
+
+        # Guards moving traces to completed_traces and evicting old ones when
+        # traces are finalized from several threads
+        self._completion_lock = threading.Lock()
         
         self.logger.info(
             "TraceCollector initialized",
@@ -254,16 +259,17 @@ class TraceCollector(TraceCollectorInterface):
         # Calculate performance metrics
         trace.performance_metrics = self._calculate_performance_metrics(trace)
         
-        # Move to completed traces
-        self.completed_traces[trace_id] = trace
-        del self.active_traces[trace_id]
-        
-        # Clean up interaction counter
-        if trace_id in self._interaction_counters:
-            del self._interaction_counters[trace_id]
-        
-        # Manage memory usage
-        self._manage_memory()
+        with self._completion_lock:
+            # Move to completed traces
+            self.completed_traces[trace_id] = trace
+            del self.active_traces[trace_id]
+            
+            # Clean up interaction counter
+            if trace_id in self._interaction_counters:
+                del self._interaction_counters[trace_id]
+            
+            # Manage memory usage
+            self._manage_memory()
         
         self.logger.info(
             "Trace finalized",
@@ -3,7 +3,10 @@ LLM provider abstractions supporting both cloud and local models
 Uses configuration files for model management
 """
 
+import asyncio
+import inspect
 import os
+import threading
 import time
 from functools import wraps
 from pathlib import Path
@@ -35,55 +38,96 @@ from ..core.config.agent_config_manager import AgentConfigManager
 from ..core.logging import ModelError, ModelInferenceError, get_logger
 
 
+# Cloud clients are shared by every provider with the same model configuration,
+# so all nodes using a model reuse one client and its HTTP connection pool.
+# Local models are not shared: llama.cpp instances are not safe to call from
+# concurrent nodes.
+_SHARED_CLIENT_TYPES = frozenset({"openai", "anthropic", "gemini", "deepinfra"})
+_shared_clients: dict[tuple[str, str], Any] = {}
+_shared_clients_lock = threading.Lock()
+
+
+def _log_retry(func_name: str, error: Exception, attempt: int, max_retries: int, delay: float) -> bool:
+    """Log a failed attempt; return whether another attempt follows"""
+    logger = get_logger("llm_provider.retry")
+    if attempt < max_retries - 1:
+        # Log the retry attempt
+        logger.warning(
+            f"Attempt {attempt + 1} failed, retrying in {delay}s",
+            extra={
+                "function": func_name,
+                "attempt": attempt + 1,
+                "max_retries": max_retries,
+                "delay": delay,
+                "error": str(error),
+            },
+        )
+        return True
+
+    # Log final failure
+    logger.error(
+        f"All {max_retries} attempts failed",
+        extra={
+            "function": func_name,
+            "max_retries": max_retries,
+            "final_error": str(error),
+        },
+    )
+    return False
+
+
 def retry_on_failure(max_retries: int = 3, delay: float = 1.0, backoff: float = 2.0):
-    """Decorator to retry function calls on failure with exponential backoff"""
+    """Decorator to retry function calls on failure with exponential backoff
+
+    Coroutine functions are retried with asyncio.sleep so the event loop keeps running.
+    """
 
     def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                current_delay = delay
+                for attempt in range(max_retries):
+                    try:
+                        return await func(*args, **kwargs)
+                    except Exception as e:
+                        if not _log_retry(func.__name__, e, attempt, max_retries, current_delay):
+                            raise
+                    await asyncio.sleep(current_delay)
+                    current_delay *= backoff
+
+            return async_wrapper
+
         @wraps(func)
         def wrapper(*args, **kwargs):
-            last_exception = None
             current_delay = delay
-
             for attempt in range(max_retries):
                 try:
                     return func(*args, **kwargs)
                 except Exception as e:
-                    last_exception = e
-                    if attempt < max_retries - 1:
-                        # Log the retry attempt
-                        logger = get_logger("llm_provider.retry")
-                        logger.warning(
-                            f"Attempt {attempt + 1} failed, retrying in {current_delay}s",
-                            extra={
-                                "function": func.__name__,
-                                "attempt": attempt + 1,
-                                "max_retries": max_retries,
-                                "delay": current_delay,
-                                "error": str(e),
-                            },
-                        )
-                        time.sleep(current_delay)
-                        current_delay *= backoff
-                    else:
-                        # Log final failure
-                        logger = get_logger("llm_provider.retry")
-                        logger.error(
-                            f"All {max_retries} attempts failed",
-                            extra={
-                                "function": func.__name__,
-                                "max_retries": max_retries,
-                                "final_error": str(e),
-                            },
-                        )
-
-            # Re-raise the last exception if all retries failed
-            raise last_exception
+                    if not _log_retry(func.__name__, e, attempt, max_retries, current_delay):
+                        raise
+                time.sleep(current_delay)
+                current_delay *= backoff
 
         return wrapper
 
     return decorator
 
 
+def _generation_metadata(self, prompt: str, system_prompt: str = "") -> dict[str, Any]:
+    """LangSmith metadata for a response generation call"""
+    return {
+        "model_name": self.model_name,
+        "model_type": self.provider_type,
+        "temperature": self.model_config.get("temperature", 0.7),
+        "max_tokens": self.model_config.get("max_tokens", 2000),
+        "is_local": self.provider_type in ["llama", "local"],
+        "prompt_length": len(prompt),
+        "has_system_prompt": bool(system_prompt),
+    }
+
+
 class LLMProvider:
     """Abstract LLM provider supporting cloud and local models"""
 
@@ -103,7 +147,7 @@ class LLMProvider:
         )
 
         try:
-            self.client = self._initialize_client()
+            self.client = self._shared_client()
             self.logger.info(
                 "LLM provider initialized successfully",
                 extra={"model_name": self.model_name},
@@ -120,6 +164,18 @@ class LLMProvider:
                 model_type=self.provider_type,
             ) from e
 
+    def _shared_client(self) -> BaseChatModel:
+        """Reuse the client of an identically configured cloud provider"""
+        if self.provider_type not in _SHARED_CLIENT_TYPES:
+            return self._initialize_client()
+
+        key = (self.provider_type, repr(sorted(self.model_config.items())))
+        with _shared_clients_lock:
+            client = _shared_clients.get(key)
+            if client is None:
+                client = _shared_clients[key] = self._initialize_client()
+        return client
+
     def _initialize_client(self) -> BaseChatModel:
         """Initialize the LLM client based on model configuration"""
         if self.provider_type == "openai":
@@ -314,24 +370,28 @@ class LLMProvider:
 
         return formatted_prompt
 
-    @retry_on_failure(max_retries=3, delay=1.0, backoff=2.0)
-    @traceable(
-        run_type="llm",
-        name="LLM Response Generation",
-        metadata=lambda self, prompt, system_prompt="": {
-            "model_name": self.model_name,
-            "model_type": self.provider_type,
-            "temperature": self.model_config.get("temperature", 0.7),
-            "max_tokens": self.model_config.get("max_tokens", 2000),
-            "is_local": self.provider_type in ["llama", "local"],
-            "prompt_length": len(prompt),
-            "has_system_prompt": bool(system_prompt),
-        },
-    )
-    def generate_response(self, prompt: str, system_prompt: str = "") -> str:
-        """Generate response using LLM with proper prompt formatting for local models"""
-        start_time = time.time()
+    def _build_llm_input(self, prompt: str, system_prompt: str = "") -> str | list:
+        """Build the client input in the form this provider type expects"""
+        # Check if this is a local model that needs special formatting
+        if self.provider_type in ["llama", "local", "mistral"]:
+            # Format the prompt specifically for local models
+            return self._format_prompt_for_local_model(prompt, system_prompt)
 
+        if self.provider_type == "deepinfra":
+            # DeepInfra uses string-based prompts but handles system prompts differently
+            if system_prompt:
+                return f"{system_prompt}\n\nUser: {prompt}\nAssistant:"
+            return f"User: {prompt}\nAssistant:"
+
+        # Use message-based approach for cloud models (OpenAI, Anthropic)
+        messages = []
+        if system_prompt:
+            messages.append(SystemMessage(content=system_prompt))
+        messages.append(HumanMessage(content=prompt))
+        return messages
+
+    def _log_call_start(self, prompt: str, system_prompt: str) -> float:
+        """Log the start of an LLM call and return its start time"""
         # Add prominent LLM call logging
         self.logger.info(
             "🤖 INVOKING LLM",
@@ -352,90 +412,93 @@ class LLMProvider:
                 "has_system_prompt": bool(system_prompt),
             },
         )
+        return time.time()
 
-        try:
-            # Check if this is a local model that needs special formatting
-            is_local_model = self.provider_type in ["llama", "local", "mistral"]
-            is_deepinfra_model = self.provider_type == "deepinfra"
-
-            if is_local_model:
-                # Format the prompt specifically for local models
-                formatted_prompt = self._format_prompt_for_local_model(prompt, system_prompt)
-                response = self.client.invoke(formatted_prompt)
-            elif is_deepinfra_model:
-                # DeepInfra uses string-based prompts but handles system prompts differently
-                if system_prompt:
-                    full_prompt = f"{system_prompt}\n\nUser: {prompt}\nAssistant:"
-                else:
-                    full_prompt = f"User: {prompt}\nAssistant:"
-                response = self.client.invoke(full_prompt)
-            else:
-                # Use message-based approach for cloud models (OpenAI, Anthropic)
-                messages = []
-                if system_prompt:
-                    messages.append(SystemMessage(content=system_prompt))
-                messages.append(HumanMessage(content=prompt))
-                response = self.client.invoke(messages)
-            duration = time.time() - start_time
-
-            # Handle different response types (some return strings, others objects)
-            if hasattr(response, 'content'):
-                response_text = response.content
-            else:
-                response_text = str(response)
+    def _completed_response(self, response: Any, prompt: str, start_time: float, operation: str) -> str:
+        """Extract the response text and log the completed call"""
+        duration = time.time() - start_time
 
-            # Add prominent completion logging
-            self.logger.info(
-                "✅ LLM RESPONSE COMPLETED",
-                extra={
-                    "model_name": self.model_name,
-                    "provider_type": self.provider_type,
-                    "duration": duration,
-                    "prompt_length": len(prompt),
-                    "response_length": len(response_text),
-                    "operation": "llm_call_completed"
-                },
-            )
+        # Handle different response types (some return strings, others objects)
+        if hasattr(response, 'content'):
+            response_text = response.content
+        else:
+            response_text = str(response)
 
-            self.logger.model_call(
-                model_name=self.model_name,
-                operation="generate_response",
-                duration=duration,
-                prompt_length=len(prompt),
-                response_length=len(response_text),
-            )
+        # Add prominent completion logging
+        self.logger.info(
+            "✅ LLM RESPONSE COMPLETED",
+            extra={
+                "model_name": self.model_name,
+                "provider_type": self.provider_type,
+                "duration": duration,
+                "prompt_length": len(prompt),
+                "response_length": len(response_text),
+                "operation": "llm_call_completed"
+            },
+        )
+
+        self.logger.model_call(
+            model_name=self.model_name,
+            operation=operation,
+            duration=duration,
+            prompt_length=len(prompt),
+            response_length=len(response_text),
+        )
+
+        return response_text
+
+    def _inference_error(self, error: Exception, prompt: str, start_time: float) -> ModelInferenceError:
+        """Log a failed call and build the error to raise for it"""
+        duration = time.time() - start_time
+        # Add prominent failure logging
+        self.logger.error(
+            "❌ LLM CALL FAILED",
+            extra={
+                "model_name": self.model_name,
+                "provider_type": self.provider_type,
+                "duration": duration,
+                "error": str(error),
+                "operation": "llm_call_failed"
+            },
+        )
+        self.logger.error(
+            "Response generation failed",
+            exc_info=error,
+            extra={
+                "model_name": self.model_name,
+                "duration": duration,
+                "error": str(error),
+            },
+        )
 
-            return response_text
+        return ModelInferenceError(
+            f"Failed to generate response with {self.model_name}",
+            model_name=self.model_name,
+            model_type=self.provider_type,
+            context={"prompt_length": len(prompt), "duration": duration},
+        )
 
+    @retry_on_failure(max_retries=3, delay=1.0, backoff=2.0)
+    @traceable(run_type="llm", name="LLM Response Generation", metadata=_generation_metadata)
+    def generate_response(self, prompt: str, system_prompt: str = "") -> str:
+        """Generate response using LLM with proper prompt formatting for local models"""
+        start_time = self._log_call_start(prompt, system_prompt)
+        try:
+            response = self.client.invoke(self._build_llm_input(prompt, system_prompt))
         except Exception as e:
-            duration = time.time() - start_time
-            # Add prominent failure logging
-            self.logger.error(
-                "❌ LLM CALL FAILED",
-                extra={
-                    "model_name": self.model_name,
-                    "provider_type": self.provider_type,
-                    "duration": duration,
-                    "error": str(e),
-                    "operation": "llm_call_failed"
-                },
-            )
-            self.logger.error(
-                "Response generation failed",
-                exc_info=True,
-                extra={
-                    "model_name": self.model_name,
-                    "duration": duration,
-                    "error": str(e),
-                },
-            )
+            raise self._inference_error(e, prompt, start_time) from e
+        return self._completed_response(response, prompt, start_time, "generate_response")
 
-            raise ModelInferenceError(
-                f"Failed to generate response with {self.model_name}",
-                model_name=self.model_name,
-                model_type=self.provider_type,
-                context={"prompt_length": len(prompt), "duration": duration},
-            ) from e
+    @retry_on_failure(max_retries=3, delay=1.0, backoff=2.0)
+    @traceable(run_type="llm", name="LLM Response Generation", metadata=_generation_metadata)
+    async def agenerate_response(self, prompt: str, system_prompt: str = "") -> str:
+        """Async generate_response; awaits the provider without holding a thread"""
+        start_time = self._log_call_start(prompt, system_prompt)
+        try:
+            response = await self.client.ainvoke(self._build_llm_input(prompt, system_prompt))
+        except Exception as e:
+            raise self._inference_error(e, prompt, start_time) from e
+        return self._completed_response(response, prompt, start_time, "agenerate_response")
 
     @traceable(
         run_type="llm",
@@ -812,11 +875,8 @@ class LLMProviderWithFallback:
             return self.current_provider.provider_type
         return "unknown"
 
-    def generate_response(self, prompt: str, system_prompt: str = "") -> str:
-        """Generate response with automatic fallback on failure"""
-        last_exception = None
-
-        # Log the start of fallback chain
+    def _log_chain_start(self, prompt: str) -> None:
+        """Log the start of a call through the fallback chain"""
         self.logger.info(
             "🔗 STARTING FALLBACK CHAIN",
             extra={
@@ -827,32 +887,26 @@ class LLMProviderWithFallback:
             }
         )
 
-        while self.current_provider and self.current_model_index < len(self.model_chain):
-            try:
-                # Try current provider (this will do its own retries)
-                response = self.current_provider.generate_response(prompt, system_prompt)
-                return response
+    def _fall_back(self, error: Exception) -> bool:
+        """Log a failed model and switch to the next one; False when the chain is exhausted"""
+        current_model = self.model_chain[self.current_model_index] if self.current_model_index < len(self.model_chain) else "unknown"
 
-            except (ModelInferenceError, Exception) as e:
-                last_exception = e
-                current_model = self.model_chain[self.current_model_index] if self.current_model_index < len(self.model_chain) else "unknown"
-
-                self.logger.error(
-                    f"🔄 FALLBACK: Model {current_model} failed after retries, attempting fallback",
-                    extra={
-                        "error": str(e), 
-                        "model_index": self.current_model_index,
-                        "failed_model": current_model,
-                        "operation": "fallback_attempt"
-                    }
-                )
+        self.logger.error(
+            f"🔄 FALLBACK: Model {current_model} failed after retries, attempting fallback",
+            extra={
+                "error": str(error),
+                "model_index": self.current_model_index,
+                "failed_model": current_model,
+                "operation": "fallback_attempt"
+            }
+        )
 
-                # Try to switch to next provider
-                if not self._try_next_provider():
-                    break
+        # Try to switch to next provider
+        return self._try_next_provider()
 
-        # If we get here, all models in the chain have been exhausted
-        raise ModelInferenceError(
+    def _chain_exhausted(self, last_exception: Exception | None) -> ModelInferenceError:
+        """Error raised once every model in the chain has failed"""
+        return ModelInferenceError(
             f"All models in fallback chain failed. Chain: {self.model_chain}",
             model_name="fallback_chain",
             model_type="fallback",
@@ -862,6 +916,38 @@ class LLMProviderWithFallback:
             }
         )
 
+    def generate_response(self, prompt: str, system_prompt: str = "") -> str:
+        """Generate response with automatic fallback on failure"""
+        last_exception = None
+        self._log_chain_start(prompt)
+
+        while self.current_provider and self.current_model_index < len(self.model_chain):
+            try:
+                # Try current provider (this will do its own retries)
+                return self.current_provider.generate_response(prompt, system_prompt)
+            except (ModelInferenceError, Exception) as e:
+                last_exception = e
+                if not self._fall_back(e):
+                    break
+
+        # If we get here, all models in the chain have been exhausted
+        raise self._chain_exhausted(last_exception)
+
+    async def agenerate_response(self, prompt: str, system_prompt: str = "") -> str:
+        """Async generate_response with automatic fallback on failure"""
+        last_exception = None
+        self._log_chain_start(prompt)
+
+        while self.current_provider and self.current_model_index < len(self.model_chain):
+            try:
+                return await self.current_provider.agenerate_response(prompt, system_prompt)
+            except (ModelInferenceError, Exception) as e:
+                last_exception = e
+                if not self._fall_back(e):
+                    break
+
+        raise self._chain_exhausted(last_exception)
+
     def evaluate_response(self, query: str, response: str) -> dict[str, Any]:
         """Evaluate response using current provider"""
         if self.current_provider:
@@ -69,7 +69,29 @@ class ChatbotAgentNode:
         Enhanced for the human-in-the-loop system with customer service focus
         """
         start_time = time.time()
+        system_prompt, context_prompt, customer_analysis = self._prepare_response(state)
 
+        # Generate customer service response
+        ai_response = self._generate_customer_service_response(
+            state["query"], context_prompt, system_prompt, customer_analysis
+        )
+
+        return self._complete_response(state, ai_response, context_prompt, customer_analysis, start_time)
+
+    @traceable(run_type="llm", name="Chatbot Agent")
+    async def ainvoke(self, state: HybridSystemState) -> HybridSystemState:
+        """Async __call__ that awaits the LLM instead of blocking a thread on it"""
+        start_time = time.time()
+        system_prompt, context_prompt, customer_analysis = self._prepare_response(state)
+
+        ai_response = await self._agenerate_customer_service_response(
+            state["query"], context_prompt, system_prompt, customer_analysis
+        )
+
+        return self._complete_response(state, ai_response, context_prompt, customer_analysis, start_time)
+
+    def _prepare_response(self, state: HybridSystemState) -> tuple[str, str, dict]:
+        """Return the system prompt, context prompt and customer analysis for a query"""
         # Get configuration from agent config
         system_prompt = (
             self.agent_config.get_prompt("system")
@@ -83,11 +105,17 @@ class ChatbotAgentNode:
         # Detect customer urgency and tone
         customer_analysis = self._analyze_customer_state(state)
 
-        # Generate customer service response
-        ai_response = self._generate_customer_service_response(
-            state["query"], context_prompt, system_prompt, customer_analysis
-        )
+        return system_prompt, context_prompt, customer_analysis
 
+    def _complete_response(
+        self,
+        state: HybridSystemState,
+        ai_response: str,
+        context_prompt: str,
+        customer_analysis: dict,
+        start_time: float,
+    ) -> HybridSystemState:
+        """Record a generated response and return the updated state"""
         # Calculate actual response time
         response_time = time.time() - start_time
 
@@ -192,23 +220,8 @@ class ChatbotAgentNode:
             return self._get_error_template("technical_difficulties")
 
         try:
-            # Build customer service focused prompt
-            full_prompt = self._build_customer_service_prompt(
-                query, context_prompt, customer_analysis
-            )
-
-            # Log the LLM call at agent level
-            self.logger.info(
-                "Chatbot Agent calling LLM",
-                extra={
-                    "agent": "chatbot_agent",
-                    "model_name": self.llm_provider.model_name,
-                    "provider_type": self.llm_provider.provider_type,
-                    "prompt_length": len(full_prompt),
-                    "system_prompt_length": len(system_prompt),
-                    "customer_tone": customer_analysis.get("tone", "unknown"),
-                    "operation": "agent_llm_call"
-                }
+            full_prompt = self._customer_service_llm_prompt(
+                query, context_prompt, system_prompt, customer_analysis
             )
 
             # Generate response using LLM with customer service system prompt
@@ -217,24 +230,81 @@ class ChatbotAgentNode:
             )
 
             # Post-process response for customer service standards
-            response = self._enhance_customer_service_response(
+            return self._enhance_customer_service_response(
                 response, customer_analysis
             )
 
-            return response
-
         except Exception as e:
-            self.logger.error(
-                "Error generating customer service response",
-                extra={
-                    "error": str(e),
-                    "query_length": len(query),
-                    "has_context": bool(context_prompt),
-                    "customer_analysis": customer_analysis,
-                    "operation": "generate_customer_service_response",
-                },
+            return self._generation_failed(e, query, context_prompt, customer_analysis)
+
+    async def _agenerate_customer_service_response(
+        self,
+        query: str,
+        context_prompt: str,
+        system_prompt: str,
+        customer_analysis: dict,
+    ) -> str:
+        """Async _generate_customer_service_response"""
+        if not self.llm_provider:
+            return self._get_error_template("technical_difficulties")
+
+        try:
+            full_prompt = self._customer_service_llm_prompt(
+                query, context_prompt, system_prompt, customer_analysis
+            )
+            response = await self.llm_provider.agenerate_response(
+                prompt=full_prompt, system_prompt=system_prompt
             )
-            return self._get_error_template("service_failure")
+            return self._enhance_customer_service_response(
+                response, customer_analysis
+            )
+
+        except Exception as e:
+            return self._generation_failed(e, query, context_prompt, customer_analysis)
+
+    def _customer_service_llm_prompt(
+        self,
+        query: str,
+        context_prompt: str,
+        system_prompt: str,
+        customer_analysis: dict,
+    ) -> str:
+        """Build the customer service prompt and log the upcoming LLM call"""
+        # Build customer service focused prompt
+        full_prompt = self._build_customer_service_prompt(
+            query, context_prompt, customer_analysis
+        )
+
+        # Log the LLM call at agent level
+        self.logger.info(
+            "Chatbot Agent calling LLM",
+            extra={
+                "agent": "chatbot_agent",
+                "model_name": self.llm_provider.model_name,
+                "provider_type": self.llm_provider.provider_type,
+                "prompt_length": len(full_prompt),
+                "system_prompt_length": len(system_prompt),
+                "customer_tone": customer_analysis.get("tone", "unknown"),
+                "operation": "agent_llm_call"
+            }
+        )
+        return full_prompt
+
+    def _generation_failed(
+        self, error: Exception, query: str, context_prompt: str, customer_analysis: dict
+    ) -> str:
+        """Log a failed generation and return the fallback reply"""
+        self.logger.error(
+            "Error generating customer service response",
+            extra={
+                "error": str(error),
+                "query_length": len(query),
+                "has_context": bool(context_prompt),
+                "customer_analysis": customer_analysis,
+                "operation": "generate_customer_service_response",
+            },
+        )
+        return self._get_error_template("service_failure")
 
     def _save_interaction_context(
         self, state: HybridSystemState, response: str, metadata: dict | None = None
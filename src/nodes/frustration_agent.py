@@ -74,6 +74,18 @@ class FrustrationAgentNode:
         # Analyze current query for frustration
         current_analysis = self._analyze_query_frustration(customer_query)
 
+        return self._complete_frustration_analysis(state, current_analysis)
+
+    @traceable(name="Frustration Agent")
+    async def ainvoke(self, state: HybridSystemState) -> HybridSystemState:
+        """Async __call__ that awaits the LLM instead of blocking a thread on it"""
+        current_analysis = await self._aanalyze_query_frustration(state.get("query", ""))
+        return self._complete_frustration_analysis(state, current_analysis)
+
+    def _complete_frustration_analysis(
+        self, state: HybridSystemState, current_analysis: dict[str, Any]
+    ) -> HybridSystemState:
+        """Combine the current query's analysis with history and return the updated state"""
         # Analyze interaction history for escalating frustration
         current_llm_score = current_analysis.get("current_query_score", 0.0)
         history_analysis = self._analyze_interaction_history(state, current_llm_score)
@@ -105,8 +117,6 @@ class FrustrationAgentNode:
     def _analyze_query_frustration(self, query: str) -> dict[str, Any]:
         """Analyze the current query for frustration indicators"""
 
-        query_lower = query.lower()
-
         # Check if running in compact mode (for Streamlit performance optimization)
         compact_mode = self._should_use_compact_mode()
 
@@ -116,16 +126,37 @@ class FrustrationAgentNode:
             try:
                 llm_analysis = self._llm_frustration_analysis(query, compact=compact_mode)
             except Exception as e:
-                self.logger.error(
-                    "LLM frustration analysis failed",
-                    extra={
-                        "error": str(e),
-                        "query_length": len(query),
-                        "operation": "llm_frustration_analysis",
-                        "compact_mode": compact_mode,
-                    },
-                )
+                self._log_llm_analysis_failure(e, query, compact_mode)
+
+        return self._query_frustration_result(llm_analysis)
+
+    async def _aanalyze_query_frustration(self, query: str) -> dict[str, Any]:
+        """Async _analyze_query_frustration"""
+        compact_mode = self._should_use_compact_mode()
+
+        llm_analysis = None
+        if self.llm_provider:
+            try:
+                llm_analysis = await self._allm_frustration_analysis(query, compact=compact_mode)
+            except Exception as e:
+                self._log_llm_analysis_failure(e, query, compact_mode)
+
+        return self._query_frustration_result(llm_analysis)
+
+    def _log_llm_analysis_failure(self, error: Exception, query: str, compact_mode: bool) -> None:
+        """Log a failed LLM frustration analysis"""
+        self.logger.error(
+            "LLM frustration analysis failed",
+            extra={
+                "error": str(error),
+                "query_length": len(query),
+                "operation": "llm_frustration_analysis",
+                "compact_mode": compact_mode,
+            },
+        )
 
+    def _query_frustration_result(self, llm_analysis: dict[str, Any] | None) -> dict[str, Any]:
+        """Build the current query's analysis from the LLM result, if any"""
         # Use LLM score or fallback
         if llm_analysis:
             combined_score = llm_analysis["score"]
@@ -153,6 +184,26 @@ class FrustrationAgentNode:
 
     def _llm_frustration_analysis(self, query: str, compact: bool = True) -> dict[str, Any]:
         """Use LLM to analyze frustration in the query"""
+        analysis_query, system_prompt = self._frustration_llm_request(query, compact)
+
+        llm_response = self.llm_provider.generate_response(
+            prompt=analysis_query,
+            system_prompt=system_prompt
+        )
+        return self._parse_frustration_response(llm_response, compact)
+
+    async def _allm_frustration_analysis(self, query: str, compact: bool = True) -> dict[str, Any]:
+        """Async _llm_frustration_analysis"""
+        analysis_query, system_prompt = self._frustration_llm_request(query, compact)
+
+        llm_response = await self.llm_provider.agenerate_response(
+            prompt=analysis_query,
+            system_prompt=system_prompt
+        )
+        return self._parse_frustration_response(llm_response, compact)
+
+    def _frustration_llm_request(self, query: str, compact: bool) -> tuple[str, str]:
+        """Build the analysis prompt and system prompt, and log the upcoming LLM call"""
 
         # Use compact prompt for faster responses
         prompt_key = "frustration_analysis_compact" if compact else "frustration_analysis"
@@ -174,11 +225,10 @@ class FrustrationAgentNode:
                 "operation": "agent_llm_call"
             }
         )
+        return analysis_query, system_prompt
 
-        llm_response = self.llm_provider.generate_response(
-            prompt=analysis_query,
-            system_prompt=system_prompt
-        )
+    def _parse_frustration_response(self, llm_response: str, compact: bool) -> dict[str, Any]:
+        """Parse the LLM's frustration score, confidence and reasoning"""
 
         # Parse compact format: [score]|[confidence]|[brief reason]
         if compact:
@@ -70,22 +70,45 @@ class QualityAgentNode:
         customer_query = state.get("query", "")
 
         if not chatbot_response:
-            return {
-                **state,
-                "quality_assessment": {
-                    "decision": QualityDecision.HUMAN_INTERVENTION.value,
-                    "confidence": 0.0,
-                    "reasoning": "No chatbot response to assess",
-                    "adjustment_needed": False,
-                },
-                "next_action": "human_intervention",
-            }
+            return self._no_response_assessment(state)
 
         # Perform quality assessment
         quality_assessment = self._assess_response_quality(
             customer_query, chatbot_response, state
         )
 
+        return self._complete_quality_assessment(state, quality_assessment)
+
+    @traceable(name="Quality Agent")
+    async def ainvoke(self, state: HybridSystemState) -> HybridSystemState:
+        """Async __call__ that awaits the LLM instead of blocking a thread on it"""
+        chatbot_response = state.get("ai_response", "")
+        if not chatbot_response:
+            return self._no_response_assessment(state)
+
+        quality_assessment = await self._aassess_response_quality(
+            state.get("query", ""), chatbot_response, state
+        )
+
+        return self._complete_quality_assessment(state, quality_assessment)
+
+    def _no_response_assessment(self, state: HybridSystemState) -> HybridSystemState:
+        """State for a turn with no chatbot response to assess"""
+        return {
+            **state,
+            "quality_assessment": {
+                "decision": QualityDecision.HUMAN_INTERVENTION.value,
+                "confidence": 0.0,
+                "reasoning": "No chatbot response to assess",
+                "adjustment_needed": False,
+            },
+            "next_action": "human_intervention",
+        }
+
+    def _complete_quality_assessment(
+        self, state: HybridSystemState, quality_assessment: dict[str, Any]
+    ) -> HybridSystemState:
+        """Flag, log and record a finished assessment on the state"""
         # Flag if adjustment is needed (but don't actually adjust)
         if quality_assessment["decision"] == QualityDecision.NEEDS_ADJUSTMENT.value:
             quality_assessment["flag_reason"] = quality_assessment["reasoning"]
@@ -110,39 +133,74 @@ class QualityAgentNode:
     ) -> dict[str, Any]:
         """Assess the quality of the chatbot response"""
 
-        # Get quality thresholds from config
-        thresholds = self.agent_config.settings.get("quality_thresholds", {
-            "adequate_score": 7.0,
-            "adjustment_score": 5.0,
-        })
-
         # Check if running in compact mode (for Streamlit performance optimization)
         compact_mode = self._should_use_compact_mode()
 
         # Use LLM for quality assessment if available
+        llm_score = None
         if self.llm_provider:
             try:
                 llm_assessment = self._llm_quality_assessment(query, response, compact=compact_mode)
-                overall_score = llm_assessment["overall_score"]
-                reasoning = llm_assessment["reasoning"]
+                llm_score = self._score_llm_assessment(llm_assessment, state)
+            except Exception as e:
+                self._log_llm_assessment_failure(e, query, response)
+
+        return self._quality_result(query, response, llm_score)
 
-                # Apply context-based adjustments
-                context_adjustment = self._calculate_context_adjustment(state)
-                final_score = max(1.0, overall_score + context_adjustment)
+    async def _aassess_response_quality(
+        self, query: str, response: str, state: HybridSystemState
+    ) -> dict[str, Any]:
+        """Async _assess_response_quality"""
+        compact_mode = self._should_use_compact_mode()
 
+        llm_score = None
+        if self.llm_provider:
+            try:
+                llm_assessment = await self._allm_quality_assessment(query, response, compact=compact_mode)
+                llm_score = self._score_llm_assessment(llm_assessment, state)
             except Exception as e:
-                self.logger.error(
-                    "LLM quality assessment failed",
-                    extra={
-                        "error": str(e),
-                        "query_length": len(query),
-                        "response_length": len(response),
-                        "operation": "llm_quality_assessment",
-                    },
-                )
-                # Fallback to rule-based assessment
-                final_score, reasoning = self._rule_based_assessment(query, response)
+                self._log_llm_assessment_failure(e, query, response)
+
+        return self._quality_result(query, response, llm_score)
+
+    def _log_llm_assessment_failure(self, error: Exception, query: str, response: str) -> None:
+        """Log a failed LLM quality assessment"""
+        self.logger.error(
+            "LLM quality assessment failed",
+            extra={
+                "error": str(error),
+                "query_length": len(query),
+                "response_length": len(response),
+                "operation": "llm_quality_assessment",
+            },
+        )
+
+    def _score_llm_assessment(
+        self, llm_assessment: dict[str, Any], state: HybridSystemState
+    ) -> tuple[float, str]:
+        """Final score and reasoning from an LLM assessment; raises if it is unusable"""
+        overall_score = llm_assessment["overall_score"]
+        reasoning = llm_assessment["reasoning"]
+
+        # Apply context-based adjustments
+        context_adjustment = self._calculate_context_adjustment(state)
+        return max(1.0, overall_score + context_adjustment), reasoning
+
+    def _quality_result(
+        self, query: str, response: str, llm_score: tuple[float, str] | None
+    ) -> dict[str, Any]:
+        """Decide from the LLM score, or from a rule-based assessment when there is none"""
+
+        # Get quality thresholds from config
+        thresholds = self.agent_config.settings.get("quality_thresholds", {
+            "adequate_score": 7.0,
+            "adjustment_score": 5.0,
+        })
+
+        if llm_score is not None:
+            final_score, reasoning = llm_score
         else:
+            # Fallback to rule-based assessment
             final_score, reasoning = self._rule_based_assessment(query, response)
 
         # Make decision based on score
@@ -159,6 +217,26 @@ class QualityAgentNode:
 
     def _llm_quality_assessment(self, query: str, response: str, compact: bool = True) -> dict[str, Any]:
         """Use LLM to assess response quality"""
+        evaluation_query, system_prompt = self._quality_llm_request(query, response, compact)
+
+        llm_response = self.llm_provider.generate_response(
+            prompt=evaluation_query,
+            system_prompt=system_prompt
+        )
+        return self._parse_quality_response(llm_response, query, response, compact)
+
+    async def _allm_quality_assessment(self, query: str, response: str, compact: bool = True) -> dict[str, Any]:
+        """Async _llm_quality_assessment"""
+        evaluation_query, system_prompt = self._quality_llm_request(query, response, compact)
+
+        llm_response = await self.llm_provider.agenerate_response(
+            prompt=evaluation_query,
+            system_prompt=system_prompt
+        )
+        return self._parse_quality_response(llm_response, query, response, compact)
+
+    def _quality_llm_request(self, query: str, response: str, compact: bool) -> tuple[str, str]:
+        """Build the assessment prompt and system prompt, and log the upcoming LLM call"""
 
         # Use compact prompt for faster responses
         prompt_key = "quality_assessment_compact" if compact else "quality_assessment"
@@ -183,11 +261,12 @@ class QualityAgentNode:
                 "operation": "agent_llm_call"
             }
         )
+        return evaluation_query, system_prompt
 
-        llm_response = self.llm_provider.generate_response(
-            prompt=evaluation_query,
-            system_prompt=system_prompt
-        )
+    def _parse_quality_response(
+        self, llm_response: str, query: str, response: str, compact: bool
+    ) -> dict[str, Any]:
+        """Parse the LLM's quality score and reasoning"""
 
         # Parse compact format: [score]|[confidence]|[brief assessment]
         if compact:
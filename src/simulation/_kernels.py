@@ -0,0 +1,68 @@
+"""
+Simulation Kernels
+Optional Numba-compiled kernels for large simulation metric reductions
+"""
+
+import os
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; callers fall back to NumPy
+    njit = None
+
+USE_NUMBA = njit is not None and os.getenv("SIMULATION_USE_NUMBA", "true").lower() != "false"
+
+
+# Decision logs smaller than this reduce faster with plain NumPy expressions
+NUMBA_MIN_DECISIONS = 5000
+
+# Quality decision codes stored in the metrics collector's int8 column
+QUALITY_ADEQUATE = 0
+QUALITY_NEEDS_ADJUSTMENT = 1
+QUALITY_HUMAN_INTERVENTION = 2
+QUALITY_UNKNOWN = -1
+
+
+def _quality_accuracy_count(scores: np.ndarray, confidences: np.ndarray, codes: np.ndarray) -> int:
+    """Count confident quality decisions whose outcome agrees with the score"""
+    count = 0
+    for i in range(scores.shape[0]):
+        if confidences[i] > 0.7:
+            code = codes[i]
+            if scores[i] >= 7.0:
+                if code == QUALITY_ADEQUATE:
+                    count += 1
+            elif code == QUALITY_NEEDS_ADJUSTMENT or code == QUALITY_HUMAN_INTERVENTION:
+                count += 1
+    return count
+
+
+def _frustration_intervention_counts(scores: np.ndarray, interventions: np.ndarray) -> tuple[int, int]:
+    """Return (interventions, interventions with a frustration score above 6)"""
+    total = 0
+    correct = 0
+    for i in range(scores.shape[0]):
+        if interventions[i]:
+            total += 1
+            if scores[i] > 6.0:
+                correct += 1
+    return total, correct
+
+
+def _routing_success_count(match_scores: np.ndarray, confidences: np.ndarray) -> int:
+    """Count routes with a strong skill match and confident routing"""
+    count = 0
+    for i in range(match_scores.shape[0]):
+        if match_scores[i] >= 0.8 and confidences[i] >= 0.7:
+            count += 1
+    return count
+
+
+if USE_NUMBA:
+    quality_accuracy_count = njit(cache=True, fastmath=True)(_quality_accuracy_count)
+    frustration_intervention_counts = njit(cache=True, fastmath=True)(_frustration_intervention_counts)
+    routing_success_count = njit(cache=True, fastmath=True)(_routing_success_count)
+else:
+    quality_accuracy_count = frustration_intervention_counts = routing_success_count = None
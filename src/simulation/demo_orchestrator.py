@@ -6,7 +6,12 @@ Coordinates simulation of customer/chatbot/employee interactions for demonstrati
 import asyncio
 import json
 import random
+import time
+import uuid
+from bisect import bisect_right
 from datetime import datetime, timedelta
+from enum import StrEnum
+from functools import cached_property
 from typing import Any, Optional
 
 from ..core.config import ConfigManager
@@ -29,6 +34,69 @@ from ..nodes.human_routing_agent import HumanRoutingAgentNode
 from ..interfaces.core.state_schema import HybridSystemState
 
 
+class EventType(StrEnum):
+    """Demo log event types; values are shared by every log entry"""
+
+    CUSTOMER_QUERY = "customer_query"
+    CHATBOT_RESPONSE = "chatbot_response"
+    QUALITY_ASSESSMENT = "quality_assessment"
+    FRUSTRATION_ANALYSIS = "frustration_analysis"
+    AUTOMATION_CHECK = "automation_check"
+    AUTOMATION_RESPONSE = "automation_response"
+    ROUTING_DECISION = "routing_decision"
+    HUMAN_AGENT_RESPONSE = "human_agent_response"
+    CUSTOMER_RESPONSE_TO_HUMAN = "customer_response_to_human"
+    RESOLUTION = "resolution"
+
+
+class Stage(StrEnum):
+    """Demo workflow stages tracked in ``current_stage``"""
+
+    INITIAL_QUERY = "initial_query"
+    CHATBOT_RESPONDED = "chatbot_responded"
+    QUALITY_ASSESSED = "quality_assessed"
+    AUTOMATION_CHECKED = "automation_checked"
+    AUTOMATION_COMPLETED = "automation_completed"
+    ROUTED_TO_HUMAN = "routed_to_human"
+    HUMAN_AGENT_HANDLING = "human_agent_handling"
+    CUSTOMER_RESPONDED_TO_HUMAN = "customer_responded_to_human"
+    RESOLVED = "resolved"
+
+
+# Events that are also recorded as system decisions
+_SYSTEM_DECISION_EVENTS = frozenset(
+    {
+        EventType.QUALITY_ASSESSMENT.value,
+        EventType.FRUSTRATION_ANALYSIS.value,
+        EventType.ROUTING_DECISION.value,
+    }
+)
+
+# Score thresholds (inclusive lower bounds) and the labels they select
+_FRUSTRATION_THRESHOLDS = (3.0, 6.0, 8.0)
+_FRUSTRATION_LABELS = ("low", "moderate", "high", "critical")
+
+_QUALITY_THRESHOLDS = (5.0, 7.0)
+_QUALITY_DECISIONS = (
+    ("human_intervention", "escalate_to_human"),
+    ("needs_adjustment", "adjust_response"),
+    ("adequate", "respond_to_customer"),
+)
+
+
+def _fast_iso(ns: int) -> str:
+    """Format an epoch-nanosecond timestamp like ``datetime.now().isoformat()``
+
+    Avoids allocating a datetime object for every logged demo event.
+    """
+    seconds, remainder = divmod(ns, 1_000_000_000)
+    tm = time.localtime(seconds)
+    return (
+        f"{tm.tm_year:04d}-{tm.tm_mon:02d}-{tm.tm_mday:02d}T"
+        f"{tm.tm_hour:02d}:{tm.tm_min:02d}:{tm.tm_sec:02d}.{remainder // 1000:06d}"
+    )
+
+
 class DemoOrchestrator:
     """Orchestrates demonstration scenarios of the human-in-the-loop system"""
 
@@ -177,7 +245,7 @@ class DemoOrchestrator:
             ]
             customer_interaction["initial_query"] = random.choice(automation_queries)
 
-        demo_id = f"demo_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{random.randint(100, 999)}"
+        demo_id = f"demo_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
 
         demo_session = {
             "demo_id": demo_id,
@@ -185,7 +253,7 @@ class DemoOrchestrator:
             "customer_interaction": customer_interaction,
             "conversation_log": [],
             "system_decisions": [],
-            "current_stage": "initial_query",
+            "current_stage": Stage.INITIAL_QUERY.value,
             "start_time": datetime.now(),
             "chatbot_responses": [],
             "escalation_data": None,
@@ -221,8 +289,8 @@ class DemoOrchestrator:
                 "scenario": customer_interaction["scenario"],
             }
         }
-        self._log_demo_event(demo_id, "customer_query", event_data)
-        self._save_to_context(demo_id, "customer_query", event_data)
+        self._log_demo_event(demo_id, EventType.CUSTOMER_QUERY.value, event_data)
+        self._save_to_context(demo_id, EventType.CUSTOMER_QUERY.value, event_data)
 
         return {
             "demo_id": demo_id,
@@ -267,15 +335,15 @@ class DemoOrchestrator:
             )
 
         demo["chatbot_responses"].append(chatbot_response)
-        demo["current_stage"] = "chatbot_responded"
+        demo["current_stage"] = Stage.CHATBOT_RESPONDED.value
 
         response_data = {
             "response": chatbot_response["response"],
             "quality_level": scenario.get("chatbot_quality", "unknown"),
             "confidence": chatbot_response.get("confidence", 0.0),
         }
-        self._log_demo_event(demo_id, "chatbot_response", response_data)
-        self._save_to_context(demo_id, "chatbot_response", response_data)
+        self._log_demo_event(demo_id, EventType.CHATBOT_RESPONSE.value, response_data)
+        self._save_to_context(demo_id, EventType.CHATBOT_RESPONSE.value, response_data)
         
         # Record workflow stage
         self._record_workflow_stage_trace(demo_id, "chatbot_response_complete")
@@ -301,19 +369,21 @@ class DemoOrchestrator:
         scenario = demo["scenario"]
         chatbot_response = demo["chatbot_responses"][-1]
         customer_interaction = demo["customer_interaction"]
+        query = customer_interaction["initial_query"]
+        last_resp = chatbot_response["response"]
 
         if show_progress:
             print(f"🔍 Starting quality assessment...")
-            print(f"❓ Original query: '{customer_interaction['initial_query']}'")
-            print(f"💬 Response to assess: '{chatbot_response['response'][:100]}{'...' if len(chatbot_response['response']) > 100 else ''}'")
+            print(f"❓ Original query: '{query}'")
+            print(f"💬 Response to assess: '{last_resp[:100]}{'...' if len(last_resp) > 100 else ''}'")
 
         if self.use_real_agents and self.quality_agent:
             if show_progress:
                 print("🤖 Using real LLM quality agent...")
             # Use real LLM quality agent
             quality_assessment = self._perform_real_quality_assessment(
-                customer_interaction["initial_query"],
-                chatbot_response["response"],
+                query,
+                last_resp,
                 demo_id
             )
         else:
@@ -321,15 +391,15 @@ class DemoOrchestrator:
                 print("🎭 Using simulated quality assessment...")
             # Fallback to simulated assessment
             quality_assessment = self._simulate_quality_agent_decision(
-                customer_interaction["initial_query"],
-                chatbot_response["response"],
+                query,
+                last_resp,
                 scenario["chatbot_quality"]
             )
 
-        demo["current_stage"] = "quality_assessed"
+        demo["current_stage"] = Stage.QUALITY_ASSESSED.value
 
-        self._log_demo_event(demo_id, "quality_assessment", quality_assessment)
-        self._save_to_context(demo_id, "quality_assessment", quality_assessment)
+        self._log_demo_event(demo_id, EventType.QUALITY_ASSESSMENT.value, quality_assessment)
+        self._save_to_context(demo_id, EventType.QUALITY_ASSESSMENT.value, quality_assessment)
         
         # Record workflow stage
         self._record_workflow_stage_trace(demo_id, "quality_assessment_complete")
@@ -414,8 +484,8 @@ class DemoOrchestrator:
                 confidence=frustration_analysis.get("confidence", None)
             )
 
-        self._log_demo_event(demo_id, "frustration_analysis", frustration_analysis)
-        self._save_to_context(demo_id, "frustration_analysis", frustration_analysis)
+        self._log_demo_event(demo_id, EventType.FRUSTRATION_ANALYSIS.value, frustration_analysis)
+        self._save_to_context(demo_id, EventType.FRUSTRATION_ANALYSIS.value, frustration_analysis)
 
         if show_progress:
             print(f"✅ Frustration analysis complete!")
@@ -476,10 +546,10 @@ class DemoOrchestrator:
         # Record workflow stage
         self._record_workflow_stage_trace(demo_id, "automation_agent_complete", end_time)
         
-        demo["current_stage"] = "automation_checked"
+        demo["current_stage"] = Stage.AUTOMATION_CHECKED.value
         
-        self._log_demo_event(demo_id, "automation_check", automation_result)
-        self._save_to_context(demo_id, "automation_check", automation_result)
+        self._log_demo_event(demo_id, EventType.AUTOMATION_CHECK.value, automation_result)
+        self._save_to_context(demo_id, EventType.AUTOMATION_CHECK.value, automation_result)
         
         return {
             "demo_id": demo_id,
@@ -527,11 +597,11 @@ class DemoOrchestrator:
             }
         )
         
-        demo["current_stage"] = "automation_completed"
+        demo["current_stage"] = Stage.AUTOMATION_COMPLETED.value
         demo["automation_response"] = automation_response
         
-        self._log_demo_event(demo_id, "automation_response", automation_response)
-        self._save_to_context(demo_id, "automation_response", automation_response)
+        self._log_demo_event(demo_id, EventType.AUTOMATION_RESPONSE.value, automation_response)
+        self._save_to_context(demo_id, EventType.AUTOMATION_RESPONSE.value, automation_response)
         
         # Record workflow stage
         self._record_workflow_stage_trace(demo_id, "automation_response_complete")
@@ -557,10 +627,10 @@ class DemoOrchestrator:
         )
 
         demo["escalation_data"] = routing_decision
-        demo["current_stage"] = "routed_to_human"
+        demo["current_stage"] = Stage.ROUTED_TO_HUMAN.value
 
-        self._log_demo_event(demo_id, "routing_decision", routing_decision)
-        self._save_to_context(demo_id, "routing_decision", routing_decision)
+        self._log_demo_event(demo_id, EventType.ROUTING_DECISION.value, routing_decision)
+        self._save_to_context(demo_id, EventType.ROUTING_DECISION.value, routing_decision)
 
         return {
             "demo_id": demo_id,
@@ -593,19 +663,39 @@ class DemoOrchestrator:
             raise ValueError("No routing decision found")
 
         # Use employee simulator to handle the case
-        employee_response = self.employee_simulator.handle_escalated_case(
-            assigned_employee_id=routing_decision["assigned_employee"]["id"],
-            customer_context=customer_interaction,
-            escalation_reason=routing_decision.get("escalation_reason", "Quality/Frustration escalation"),
-            customer_query=customer_interaction["initial_query"],
-            chatbot_response=demo["chatbot_responses"][-1]["response"] if demo["chatbot_responses"] else None
-        )
+        employee_response = self._hand_off_to_employee(demo, routing_decision)
+
+        if not employee_response["escalation_handled"]:
+            # The assigned employee filled up after routing; try one other employee
+            rerouted = self._simulate_routing_agent_decision(
+                customer_interaction, demo["scenario"]["expected_outcome"]
+            )
+            if "assigned_employee" in rerouted:
+                demo["escalation_data"] = routing_decision = rerouted
+                employee_response = self._hand_off_to_employee(demo, routing_decision)
+
+        if not employee_response["escalation_handled"]:
+            # Nobody could take the case; queue it like a routing decision with no free agent
+            demo["escalation_data"] = {
+                "status": "queued",
+                "estimated_wait_time": employee_response.get("estimated_wait_time", 15),
+                "queue_position": employee_response.get("queue_position", 1),
+                "escalation_reason": routing_decision.get("escalation_reason"),
+            }
+            self._log_demo_event(demo_id, EventType.ROUTING_DECISION.value, demo["escalation_data"])
+            self._save_to_context(demo_id, EventType.ROUTING_DECISION.value, demo["escalation_data"])
+            return {
+                "demo_id": demo_id,
+                "employee_response": employee_response,
+                "escalation_message": self._generate_escalation_message(demo["escalation_data"]),
+                "next_step": "resolution",
+            }
 
         demo["employee_interaction"] = employee_response
-        demo["current_stage"] = "human_agent_handling"
+        demo["current_stage"] = Stage.HUMAN_AGENT_HANDLING.value
 
-        self._log_demo_event(demo_id, "human_agent_response", employee_response)
-        self._save_to_context(demo_id, "human_agent_response", employee_response)
+        self._log_demo_event(demo_id, EventType.HUMAN_AGENT_RESPONSE.value, employee_response)
+        self._save_to_context(demo_id, EventType.HUMAN_AGENT_RESPONSE.value, employee_response)
 
         return {
             "demo_id": demo_id,
@@ -613,12 +703,29 @@ class DemoOrchestrator:
             "next_step": "customer_response_to_human",
         }
 
+    def _hand_off_to_employee(self, demo: dict[str, Any], routing_decision: dict[str, Any]) -> dict[str, Any]:
+        """Ask the routed employee to take the case; escalation_handled is False if they cannot"""
+        customer_interaction = demo["customer_interaction"]
+        responses = demo["chatbot_responses"]
+        last_resp = responses[-1]["response"] if responses else None
+
+        return self.employee_simulator.handle_escalated_case(
+            assigned_employee_id=routing_decision["assigned_employee"]["id"],
+            customer_context=customer_interaction,
+            escalation_reason=routing_decision.get("escalation_reason", "Quality/Frustration escalation"),
+            customer_query=customer_interaction["initial_query"],
+            chatbot_response=last_resp
+        )
+
     def simulate_customer_response_to_human(self, demo_id: str) -> dict[str, Any]:
         """Simulate customer response to human agent"""
 
         demo = self.active_demonstrations[demo_id]
         employee_response = demo["employee_interaction"]
 
+        if not employee_response:
+            raise ValueError("No human agent is handling this case")
+
         # Customer simulator evaluates human agent response
         customer_response = self.customer_simulator.respond_to_chatbot(
             employee_response["employee_response"],
@@ -629,10 +736,10 @@ class DemoOrchestrator:
         customer_response["satisfaction_with_response"] = min(10, customer_response["satisfaction_with_response"] + 2)
         customer_response["wants_escalation"] = False  # Assume human agents resolve issues
 
-        demo["current_stage"] = "customer_responded_to_human"
+        demo["current_stage"] = Stage.CUSTOMER_RESPONDED_TO_HUMAN.value
 
-        self._log_demo_event(demo_id, "customer_response_to_human", customer_response)
-        self._save_to_context(demo_id, "customer_response_to_human", customer_response)
+        self._log_demo_event(demo_id, EventType.CUSTOMER_RESPONSE_TO_HUMAN.value, customer_response)
+        self._save_to_context(demo_id, EventType.CUSTOMER_RESPONSE_TO_HUMAN.value, customer_response)
 
         return {
             "demo_id": demo_id,
@@ -665,11 +772,11 @@ class DemoOrchestrator:
             }
 
         demo["final_outcome"] = resolution_result
-        demo["current_stage"] = "resolved"
+        demo["current_stage"] = Stage.RESOLVED.value
         demo["end_time"] = datetime.now()
 
-        self._log_demo_event(demo_id, "resolution", resolution_result)
-        self._save_to_context(demo_id, "resolution", resolution_result)
+        self._log_demo_event(demo_id, EventType.RESOLUTION.value, resolution_result)
+        self._save_to_context(demo_id, EventType.RESOLUTION.value, resolution_result)
         
         # Finalize trace collection
         outcome_data = {
@@ -719,6 +826,11 @@ class DemoOrchestrator:
             for scenario in self.demo_scenarios
         ]
 
+    @cached_property
+    def scenario_names(self) -> tuple[str, ...]:
+        """Names of all demonstration scenarios, in definition order"""
+        return tuple(scenario["name"] for scenario in self.demo_scenarios)
+
     def get_active_demos(self) -> list[str]:
         """Get list of active demonstration IDs"""
         return list(self.active_demonstrations.keys())
@@ -1021,15 +1133,7 @@ class DemoOrchestrator:
 
         score = quality_scores.get(expected_quality, 7.0)
 
-        if score >= 7.0:
-            decision = "adequate"
-            next_action = "respond_to_customer"
-        elif score >= 5.0:
-            decision = "needs_adjustment"
-            next_action = "adjust_response"
-        else:
-            decision = "human_intervention"
-            next_action = "escalate_to_human"
+        decision, next_action = _QUALITY_DECISIONS[bisect_right(_QUALITY_THRESHOLDS, score)]
 
         return {
             "decision": decision,
@@ -1057,14 +1161,7 @@ class DemoOrchestrator:
         # Determine intervention need
         intervention_needed = frustration_score > 6.0
 
-        if frustration_score >= 8.0:
-            level = "critical"
-        elif frustration_score >= 6.0:
-            level = "high"
-        elif frustration_score >= 3.0:
-            level = "moderate"
-        else:
-            level = "low"
+        level = _FRUSTRATION_LABELS[bisect_right(_FRUSTRATION_THRESHOLDS, frustration_score)]
 
         return {
             "overall_score": frustration_score,
@@ -1129,7 +1226,7 @@ class DemoOrchestrator:
         demo = self.active_demonstrations[demo_id]
 
         log_entry = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _fast_iso(time.time_ns()),
             "event_type": event_type,
             "data": event_data,
         }
@@ -1137,7 +1234,7 @@ class DemoOrchestrator:
         demo["conversation_log"].append(log_entry)
 
         # Also log system decisions separately
-        if event_type in ["quality_assessment", "frustration_analysis", "routing_decision"]:
+        if event_type in _SYSTEM_DECISION_EVENTS:
             demo["system_decisions"].append(log_entry)
 
     def _save_to_context(self, demo_id: str, event_type: str, event_data: dict[str, Any]):
@@ -1371,6 +1468,8 @@ async def main():
     print(f"Demo duration: {log['duration_seconds']:.2f} seconds")
     print(f"Current stage: {log['current_stage']}")
 
+    orchestrator.context_provider.close()
+
 
 if __name__ == "__main__":
     asyncio.run(main())
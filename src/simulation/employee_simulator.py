@@ -4,17 +4,82 @@ Simulates human employees (agents) handling escalated customer interactions
 """
 
 import asyncio
+import itertools
 import random
+import re
+import secrets
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from typing import Any, Optional
 
+try:
+    import hyperscan
+except ImportError:  # hyperscan is optional; fall back to stdlib re
+    hyperscan = None
+
 from ..core.logging import get_logger
 from ..interfaces.human_agents import HumanAgent, HumanAgentRepository, HumanAgentService, Specialization
 from ..data.human_agents_repository import SQLiteHumanAgentRepository
 from ..services.human_agent_service import DefaultHumanAgentService
 
 
+_LOGGER = get_logger(__name__)
+
+# Repository coroutines are driven from synchronous simulator calls on a private
+# event loop per thread, so cycles running in worker threads still reach the database
+_thread_loops = threading.local()
+
+# Every loop opened by _run_blocking, so close_thread_loops can close the loops
+# of worker threads that have already exited
+_opened_loops: list[asyncio.AbstractEventLoop] = []
+_opened_loops_lock = threading.Lock()
+
+
+def _in_running_loop() -> bool:
+    """Whether this thread is already running an event loop (which cannot block)"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def _run_blocking(coro):
+    """Run a coroutine to completion on this thread's private event loop"""
+    loop = getattr(_thread_loops, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = _thread_loops.loop = asyncio.new_event_loop()
+        with _opened_loops_lock:
+            _opened_loops.append(loop)
+    return loop.run_until_complete(coro)
+
+
+def _run_or_schedule(coro) -> None:
+    """Schedule a coroutine on the running loop, or run it to completion on this thread's loop"""
+    if _in_running_loop():
+        asyncio.create_task(coro)
+    else:
+        _run_blocking(coro)
+
+
+def close_thread_loops() -> None:
+    """Close the private event loops opened for synchronous simulator calls
+
+    Call once simulation work has finished; loops still running in another
+    thread are left open, and a thread that needs a loop again opens a new one.
+    """
+    with _opened_loops_lock:
+        running = [loop for loop in _opened_loops if loop.is_running()]
+        idle = [loop for loop in _opened_loops if not loop.is_running()]
+        _opened_loops[:] = running
+    for loop in idle:
+        loop.close()
+
+
 class EmployeeType(Enum):
     JUNIOR_SUPPORT = "junior_support"
     SENIOR_SUPPORT = "senior_support"
@@ -42,19 +107,217 @@ class EmployeePersonality(Enum):
     PATIENT = "patient"
 
 
+# Resolution-time multipliers used by _calculate_resolution_metrics
+_COMPLEXITY_TIME_FACTOR = {"low": 1.0, "medium": 1.2, "high": 1.5}
+_SKILL_LEVEL_TIME_FACTOR = {"senior": 0.8, "intermediate": 1.0, "junior": 1.4}
+
+# Satisfaction adjustment applied in _resolve_case
+_SATISFACTION_COMPLEXITY_ADJUSTMENT = {"low": 0.1, "medium": 0.0, "high": -0.2}
+
+
+def _effort_for(complexity: str, many_skills: bool, needs_technical: bool) -> str:
+    """Reference effort rule used to build _EFFORT_TABLE"""
+    if complexity == "high" or many_skills:
+        return "high"
+    if complexity == "medium" or needs_technical:
+        return "medium"
+    return "low"
+
+
+# (complexity, more than two skills, technical skill required) -> effort
+_EFFORT_TABLE = {
+    (complexity, many_skills, needs_technical): _effort_for(complexity, many_skills, needs_technical)
+    for complexity in ("low", "medium", "high")
+    for many_skills in (False, True)
+    for needs_technical in (False, True)
+}
+
+
+def _minute_of_day(hhmm: str) -> int:
+    """Convert an ``HH:MM`` string to minutes since midnight"""
+    hours, minutes = hhmm.split(":")
+    return int(hours) * 60 + int(minutes)
+
+
+def _precompute_employee_fields(employee: dict[str, Any]) -> dict[str, Any]:
+    """Attach derived per-employee values used on the case-handling hot path"""
+    employee["_skills_set"] = frozenset(employee["skills"])
+    employee["_skill_level_factor"] = _SKILL_LEVEL_TIME_FACTOR.get(employee["skill_level"], 1.0)
+    employee["_experience_factor"] = 0.8 + 0.2 * (employee["years_experience"] / 10)
+    employee["_inv_max"] = 1.0 / employee["max_concurrent"]
+    employee["_start_min"] = _minute_of_day(employee["working_hours"]["start"])
+    employee["_end_min"] = _minute_of_day(employee["working_hours"]["end"])
+    employee["_type_value"] = employee["type"].value
+    return employee
+
+
+# Keyword sets for the single-pass classification in _analyze_case
+_WORD_RE = re.compile(r"[a-z]+")
+_QUERY_SKILL_KEYWORDS = (
+    (frozenset({"technical", "api"}), "technical"),
+    (frozenset({"billing", "payment", "payments"}), "billing"),
+    (frozenset({"policy", "coverage"}), "policy"),
+    (frozenset({"claim", "claims"}), "claims"),
+)
+_ESCALATION_KEYWORDS = frozenset({"frustrated", "angry"})
+_URGENT_KEYWORDS = frozenset({"urgent", "critical"})
+
+# Customer phrases that signal a case can be closed
+_RESOLUTION_PHRASES = (
+    "thank you", "that worked", "perfect", "solved", "fixed",
+    "resolved", "that's great", "excellent",
+)
+_RESOLUTION_RE = re.compile("|".join(map(re.escape, _RESOLUTION_PHRASES)), re.IGNORECASE)
+
+
+def _compile_resolution_database() -> Optional["hyperscan.Database"]:
+    """Compile the resolution phrases into a Hyperscan database if available"""
+    if hyperscan is None:
+        return None
+    database = hyperscan.Database()
+    database.compile(
+        expressions=[re.escape(phrase).encode() for phrase in _RESOLUTION_PHRASES],
+        ids=list(range(len(_RESOLUTION_PHRASES))),
+        elements=len(_RESOLUTION_PHRASES),
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(_RESOLUTION_PHRASES),
+    )
+    return database
+
+
+_RESOLUTION_DB = _compile_resolution_database()
+
+# Hyperscan scratch space may only be used by one scan at a time, so each
+# thread scanning the shared database allocates its own
+_resolution_scratch = threading.local()
+
+
+def _stop_on_first_match(match_id: int, start: int, end: int, flags: int, context: Any) -> bool:
+    """Hyperscan match handler that terminates the scan at the first hit"""
+    return True
+
+
+def _thread_scratch() -> "hyperscan.Scratch":
+    """Return this thread's scratch space for _RESOLUTION_DB"""
+    scratch = getattr(_resolution_scratch, "scratch", None)
+    if scratch is None:
+        scratch = _resolution_scratch.scratch = hyperscan.Scratch(_RESOLUTION_DB)
+    return scratch
+
+
+def _contains_resolution_phrase(text: str) -> bool:
+    """Check text for any resolution phrase with Hyperscan, else stdlib re"""
+    if _RESOLUTION_DB is None:
+        return _RESOLUTION_RE.search(text) is not None
+    try:
+        _RESOLUTION_DB.scan(text.encode(), match_event_handler=_stop_on_first_match, scratch=_thread_scratch())
+    except hyperscan.ScanTerminated:
+        return True
+    except hyperscan.error:
+        return _RESOLUTION_RE.search(text) is not None
+    return False
+
+
+_SHORT_ACKNOWLEDGMENTS = frozenset({"ok", "okay", "thanks", "got it"})
+
+
+# Response templates for _generate_employee_response, keyed on personality/type
+_GREETING_BY_PERSONALITY = {
+    EmployeePersonality.EMPATHETIC: "Hi, I'm {name} and I'm here to help you today. I can see you've been having some difficulties, and I want to make sure we get this resolved for you.",
+    EmployeePersonality.DIRECT: "Hello, this is {name}. I've reviewed your case and I'm ready to help resolve this issue.",
+    EmployeePersonality.PATIENT: "Hi there, I'm {name}. I understand this has been frustrating, and I'm going to take all the time needed to work through this with you.",
+}
+_DEFAULT_GREETING = "Hello, I'm {name} from the support team. Let me help you with this issue."
+
+_EMPATHY_BY_PERSONALITY = {
+    EmployeePersonality.EMPATHETIC: " I sincerely apologize for the frustration you've experienced so far. Your concerns are completely valid, and I'm committed to making this right.",
+}
+_DEFAULT_EMPATHY = " I apologize for any inconvenience you've experienced. Let's focus on getting this resolved quickly."
+
+_CHATBOT_ACKNOWLEDGMENT = " I can see you've already been working with our chatbot. Let me review what's been discussed and take it from here."
+
+_APPROACH_BY_TYPE = {
+    EmployeeType.TECHNICAL_SPECIALIST: " I'm going to take a detailed look at the technical aspects of this issue and walk you through a comprehensive solution.",
+    EmployeeType.BILLING_SPECIALIST: " Let me review your account and billing details to resolve this billing concern for you.",
+    EmployeeType.MANAGER: " As a manager, I have additional tools and authority to resolve this issue. Let me see what options we have available.",
+}
+_APPROACH_BY_COMPLEXITY = {
+    "high": " This looks like it might need some specialized attention. I may need to coordinate with our technical team, but I'll stay with you throughout the process.",
+}
+_DEFAULT_APPROACH = " I should be able to help you resolve this directly. Let me work through this step by step."
+
+# Checked in order; the first entry with a keyword in the query wins
+_NEXT_STEPS_BY_KEYWORDS = (
+    (("technical", "api"), " First, let me gather some technical details about your setup so I can provide the most accurate solution."),
+    (("billing",), " I'm going to review your account details right now to understand exactly what happened with your billing."),
+    (("access", "login"), " Let me check your account status and walk you through getting your access restored."),
+)
+_DEFAULT_NEXT_STEPS = " Can you provide me with a few more details about exactly what you're experiencing?"
+
+_CLOSING_BY_PERSONALITY = {
+    EmployeePersonality.PATIENT: " Please take your time explaining, and don't hesitate to ask if anything isn't clear.",
+    EmployeePersonality.EFFICIENT: " I'll work to get this resolved as quickly as possible while ensuring it's done right.",
+    EmployeePersonality.THOROUGH: " I want to make sure we address not just the immediate issue, but also prevent it from happening again.",
+}
+
+
+# Follow-up templates for _generate_follow_up_response, keyed on message tag
+# (and personality for acknowledgments; None is the fallback)
+_FOLLOW_UP_ACK = {
+    ("frustrated", EmployeePersonality.EMPATHETIC): "I can hear that this is really frustrating for you, and I completely understand. ",
+    ("frustrated", None): "I understand your frustration. ",
+    ("thanks", None): "You're very welcome! ",
+    (None, None): "I see. ",
+}
+
+# Checked in order; the first tag with a keyword in the message wins
+_FOLLOW_UP_SOLUTION_KEYWORDS = (
+    ("not_working", ("still not working",)),
+    ("question", ("question", "?")),
+    ("fixed", ("works", "fixed")),
+)
+_FOLLOW_UP_SOLUTION = {
+    "not_working": "Let me try a different approach. I'm going to escalate this internally to get additional technical resources involved.",
+    "question": "Great question. Let me explain that in more detail and make sure it's clear.",
+    "fixed": "Excellent! I'm glad we got that resolved. Let me just confirm everything is working as expected.",
+    None: "Based on what you've shared, let me provide you with the next steps to resolve this.",
+}
+
+
+@dataclass(slots=True)
+class _CaseRecord:
+    """An escalated case currently being handled by an employee"""
+
+    employee_id: str
+    customer_context: dict[str, Any]
+    start_time: datetime
+    start_monotonic: float
+    case_analysis: dict[str, Any]
+
+
 class EmployeeSimulator:
     """Simulates human employee responses to escalated customer cases"""
 
-    def __init__(self, repository: Optional[HumanAgentRepository] = None, agent_service: Optional[HumanAgentService] = None):
-        self.logger = get_logger(__name__)
-        
+    def __init__(self, repository: Optional[HumanAgentRepository] = None, agent_service: Optional[HumanAgentService] = None, seed: Optional[int] = None):
         # Use provided repository or create default
         self.repository = repository or SQLiteHumanAgentRepository()
         self.agent_service = agent_service or DefaultHumanAgentService(self.repository)
         
         # Fallback employees for simulation when database is empty
         self.fallback_employees = self._create_employee_roster()
-        self.active_cases = {}
+        self._by_id = {emp["id"]: emp for emp in self.fallback_employees}
+        self.active_cases: dict[str, _CaseRecord] = {}
+        self._cases_per_employee = Counter()
+
+        # Guards workload and active-case bookkeeping; cycles may run in worker threads
+        self._lock = threading.Lock()
+
+        # Private RNG so simulations can be seeded reproducibly per instance
+        self._rng = random.Random(seed)
+
+        # Case ids are a per-instance prefix plus a monotonic sequence; the random
+        # token keeps ids unique across instances
+        self._case_prefix = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{secrets.token_hex(2)}"
+        self._case_counter = itertools.count(1)
         
         # Initialize database agents on first use
         self._db_initialized = False
@@ -145,7 +408,7 @@ class EmployeeSimulator:
             },
         ]
 
-        return employees
+        return [_precompute_employee_fields(emp) for emp in employees]
 
     async def _ensure_database_agents(self):
         """Ensure database has agents for simulation"""
@@ -158,12 +421,12 @@ class EmployeeSimulator:
             
             # If database is empty or has very few agents, we might want to add some
             # But we'll respect existing data and only log what we find
-            self.logger.info(f"Found {len(existing_agents)} agents in database for simulation")
+            _LOGGER.info(f"Found {len(existing_agents)} agents in database for simulation")
             
             self._db_initialized = True
             
         except Exception as e:
-            self.logger.warning(f"Could not check database agents: {e}")
+            _LOGGER.warning(f"Could not check database agents: {e}")
             self._db_initialized = True  # Don't retry on errors
 
     async def get_database_agents(self) -> list[HumanAgent]:
@@ -172,12 +435,12 @@ class EmployeeSimulator:
         try:
             return await self.repository.get_all()
         except Exception as e:
-            self.logger.warning(f"Could not get database agents: {e}")
+            _LOGGER.warning(f"Could not get database agents: {e}")
             return []
 
     def _convert_to_simulation_format(self, agent: HumanAgent) -> dict[str, Any]:
         """Convert HumanAgent to simulation format"""
-        return {
+        return _precompute_employee_fields({
             "id": agent.id,
             "name": agent.name,
             "type": self._map_specialization_to_type(agent.specializations),
@@ -192,7 +455,7 @@ class EmployeeSimulator:
             "max_concurrent": agent.max_concurrent_conversations,
             "working_hours": {"start": agent.shift_start or "09:00", "end": agent.shift_end or "17:00"},
             "timezone": "PST",  # Default
-        }
+        })
 
     def _map_specialization_to_type(self, specializations: list[Specialization]) -> EmployeeType:
         """Map specializations to employee type"""
@@ -229,6 +492,13 @@ class EmployeeSimulator:
         if not employee:
             return self._handle_employee_not_available(customer_context)
 
+        # Reserve a conversation slot atomically, skipping response generation
+        # entirely when the employee cannot take the case
+        with self._lock:
+            if employee["current_workload"] >= employee["max_concurrent"]:
+                return self._handle_employee_at_capacity(employee)
+            self._update_employee_workload(employee["id"], 1)
+
         # Analyze the case
         case_analysis = self._analyze_case(customer_context, escalation_reason, customer_query)
 
@@ -240,25 +510,26 @@ class EmployeeSimulator:
         # Calculate resolution metrics
         resolution_metrics = self._calculate_resolution_metrics(employee, case_analysis)
 
-        # Update employee workload (both simulation and database)
-        self._update_employee_workload(employee["id"], 1)
-        
         # Try to update database workload too
         try:
-            asyncio.create_task(self.agent_service.assign_conversation(
+            _run_or_schedule(self.agent_service.assign_conversation(
                 assigned_employee_id, 
                 customer_context.get("session_id", f"sim_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
             ))
         except Exception as e:
-            self.logger.warning(f"Could not update database workload: {e}")
-
-        case_id = f"case_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{random.randint(100, 999)}"
-        self.active_cases[case_id] = {
-            "employee_id": assigned_employee_id,
-            "customer_context": customer_context,
-            "start_time": datetime.now(),
-            "case_analysis": case_analysis,
-        }
+            _LOGGER.warning(f"Could not update database workload: {e}")
+
+        case_id = f"case_{self._case_prefix}_{next(self._case_counter):06d}"
+        case = _CaseRecord(
+            employee_id=assigned_employee_id,
+            customer_context=customer_context,
+            start_time=datetime.now(),
+            start_monotonic=time.monotonic(),
+            case_analysis=case_analysis,
+        )
+        with self._lock:
+            self.active_cases[case_id] = case
+            self._cases_per_employee[assigned_employee_id] += 1
 
         return {
             "case_id": case_id,
@@ -275,11 +546,11 @@ class EmployeeSimulator:
     ) -> dict[str, Any]:
         """Continue conversation between employee and customer"""
 
-        if case_id not in self.active_cases:
+        case = self.active_cases.get(case_id)
+        if case is None:
             return {"error": "Case not found"}
 
-        case = self.active_cases[case_id]
-        employee = self._get_employee(case["employee_id"])
+        employee = self._get_employee(case.employee_id)
 
         # Generate follow-up response
         follow_up_response = self._generate_follow_up_response(
@@ -305,53 +576,46 @@ class EmployeeSimulator:
 
     def _get_employee(self, employee_id: str) -> dict[str, Any]:
         """Get employee by ID from database or fallback roster"""
-        # Try database first
+        # Try database first; inside a running event loop we can't block, so use fallback
         try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # If already in an async context, we can't await, so use fallback
-                return next((emp for emp in self.fallback_employees if emp["id"] == employee_id), None)
-            else:
-                # Run async call
-                agent = loop.run_until_complete(self.repository.get_by_id(employee_id))
+            if not _in_running_loop():
+                agent = _run_blocking(self.repository.get_by_id(employee_id))
                 if agent:
                     return self._convert_to_simulation_format(agent)
         except Exception as e:
-            self.logger.warning(f"Could not get agent from database: {e}")
+            _LOGGER.warning(f"Could not get agent from database: {e}")
         
         # Fallback to simulation roster
-        return next((emp for emp in self.fallback_employees if emp["id"] == employee_id), None)
+        return self._by_id.get(employee_id)
 
     def _analyze_case(
         self, customer_context: dict[str, Any], escalation_reason: str, customer_query: str
     ) -> dict[str, Any]:
         """Analyze the escalated case"""
 
+        # Tokenize once; keyword checks below are set membership tests
+        query_words = set(_WORD_RE.findall(customer_query.lower()))
+        reason_words = set(_WORD_RE.findall(escalation_reason.lower()))
+
         # Determine case complexity
         complexity = "low"
-        if "technical" in escalation_reason.lower() or "api" in customer_query.lower():
+        if "technical" in reason_words or "api" in query_words:
             complexity = "high"
-        elif "billing" in escalation_reason.lower() or "frustrated" in escalation_reason.lower():
+        elif "billing" in reason_words or "frustrated" in reason_words:
             complexity = "medium"
 
         # Determine required skills using current specializations
-        required_skills = []
-        if "technical" in customer_query.lower() or "api" in customer_query.lower():
-            required_skills.append("technical")
-        if "billing" in customer_query.lower() or "payment" in customer_query.lower():
-            required_skills.append("billing")
-        if "policy" in customer_query.lower() or "coverage" in customer_query.lower():
-            required_skills.append("policy")
-        if "claim" in customer_query.lower():
-            required_skills.append("claims")
-        if "frustrated" in escalation_reason.lower() or "angry" in escalation_reason.lower():
+        required_skills = [
+            skill for keywords, skill in _QUERY_SKILL_KEYWORDS if not keywords.isdisjoint(query_words)
+        ]
+        if not _ESCALATION_KEYWORDS.isdisjoint(reason_words):
             required_skills.append("escalation")
         if not required_skills:
             required_skills.append("general_support")
 
         # Determine urgency
         urgency = "medium"
-        if "urgent" in customer_query.lower() or "critical" in customer_query.lower():
+        if not _URGENT_KEYWORDS.isdisjoint(query_words):
             urgency = "high"
         elif customer_context.get("frustration_level", 0) > 7:
             urgency = "high"
@@ -370,12 +634,7 @@ class EmployeeSimulator:
     def _estimate_effort(self, complexity: str, required_skills: list[str]) -> str:
         """Estimate effort required for case"""
 
-        if complexity == "high" or len(required_skills) > 2:
-            return "high"
-        elif complexity == "medium" or "technical" in required_skills:
-            return "medium"
-        else:
-            return "low"
+        return _EFFORT_TABLE[(complexity, len(required_skills) > 2, "technical" in required_skills)]
 
     def _generate_employee_response(
         self,
@@ -391,97 +650,63 @@ class EmployeeSimulator:
         employee_type = employee["type"]
 
         # Base greeting and acknowledgment
-        if personality == EmployeePersonality.EMPATHETIC:
-            greeting = f"Hi, I'm {employee['name']} and I'm here to help you today. I can see you've been having some difficulties, and I want to make sure we get this resolved for you."
-        elif personality == EmployeePersonality.DIRECT:
-            greeting = f"Hello, this is {employee['name']}. I've reviewed your case and I'm ready to help resolve this issue."
-        elif personality == EmployeePersonality.PATIENT:
-            greeting = f"Hi there, I'm {employee['name']}. I understand this has been frustrating, and I'm going to take all the time needed to work through this with you."
-        else:
-            greeting = f"Hello, I'm {employee['name']} from the support team. Let me help you with this issue."
+        parts = [_GREETING_BY_PERSONALITY.get(personality, _DEFAULT_GREETING).format(name=employee["name"])]
 
         # Address escalation reason if customer is frustrated
         if case_analysis["customer_frustration"] > 6:
-            if personality == EmployeePersonality.EMPATHETIC:
-                empathy = " I sincerely apologize for the frustration you've experienced so far. Your concerns are completely valid, and I'm committed to making this right."
-            else:
-                empathy = " I apologize for any inconvenience you've experienced. Let's focus on getting this resolved quickly."
-            greeting += empathy
+            parts.append(_EMPATHY_BY_PERSONALITY.get(personality, _DEFAULT_EMPATHY))
 
         # Acknowledge chatbot interaction if present
         if chatbot_response:
-            ack_chatbot = " I can see you've already been working with our chatbot. Let me review what's been discussed and take it from here."
-            greeting += ack_chatbot
+            parts.append(_CHATBOT_ACKNOWLEDGMENT)
 
         # Provide solution approach based on employee type and case
-        if employee_type == EmployeeType.TECHNICAL_SPECIALIST:
-            approach = " I'm going to take a detailed look at the technical aspects of this issue and walk you through a comprehensive solution."
-        elif employee_type == EmployeeType.BILLING_SPECIALIST:
-            approach = " Let me review your account and billing details to resolve this billing concern for you."
-        elif employee_type == EmployeeType.MANAGER:
-            approach = " As a manager, I have additional tools and authority to resolve this issue. Let me see what options we have available."
-        else:
-            if case_analysis["complexity"] == "high":
-                approach = " This looks like it might need some specialized attention. I may need to coordinate with our technical team, but I'll stay with you throughout the process."
-            else:
-                approach = " I should be able to help you resolve this directly. Let me work through this step by step."
+        approach = _APPROACH_BY_TYPE.get(employee_type)
+        if approach is None:
+            approach = _APPROACH_BY_COMPLEXITY.get(case_analysis["complexity"], _DEFAULT_APPROACH)
 
         # Add specific next steps based on the query
-        if "technical" in customer_query.lower() or "api" in customer_query.lower():
-            next_steps = " First, let me gather some technical details about your setup so I can provide the most accurate solution."
-        elif "billing" in customer_query.lower():
-            next_steps = " I'm going to review your account details right now to understand exactly what happened with your billing."
-        elif "access" in customer_query.lower() or "login" in customer_query.lower():
-            next_steps = " Let me check your account status and walk you through getting your access restored."
-        else:
-            next_steps = " Can you provide me with a few more details about exactly what you're experiencing?"
-
-        # Combine all parts
-        full_response = greeting + approach + next_steps
+        q = customer_query.lower()
+        next_steps = next(
+            (steps for keywords, steps in _NEXT_STEPS_BY_KEYWORDS if any(kw in q for kw in keywords)),
+            _DEFAULT_NEXT_STEPS,
+        )
+        parts.append(approach)
+        parts.append(next_steps)
 
         # Add personality-specific closing
-        if personality == EmployeePersonality.PATIENT:
-            full_response += " Please take your time explaining, and don't hesitate to ask if anything isn't clear."
-        elif personality == EmployeePersonality.EFFICIENT:
-            full_response += " I'll work to get this resolved as quickly as possible while ensuring it's done right."
-        elif personality == EmployeePersonality.THOROUGH:
-            full_response += " I want to make sure we address not just the immediate issue, but also prevent it from happening again."
+        parts.append(_CLOSING_BY_PERSONALITY.get(personality, ""))
 
-        return full_response
+        return "".join(parts)
 
     def _generate_follow_up_response(
         self,
         employee: dict[str, Any],
         customer_message: str,
         customer_frustration: int,
-        case: dict[str, Any]
+        case: _CaseRecord
     ) -> str:
         """Generate follow-up response from employee"""
 
         personality = employee["personality"]
+        msg = customer_message.lower()
 
         # Acknowledge customer message
         if customer_frustration > 7:
-            if personality == EmployeePersonality.EMPATHETIC:
-                acknowledgment = "I can hear that this is really frustrating for you, and I completely understand. "
-            else:
-                acknowledgment = "I understand your frustration. "
-        elif "thank" in customer_message.lower():
-            acknowledgment = "You're very welcome! "
+            ack_tag = "frustrated"
+        elif "thank" in msg:
+            ack_tag = "thanks"
         else:
-            acknowledgment = "I see. "
+            ack_tag = None
+        acknowledgment = _FOLLOW_UP_ACK.get((ack_tag, personality)) or _FOLLOW_UP_ACK[(ack_tag, None)]
 
         # Generate solution or next step
-        if "still not working" in customer_message.lower():
-            solution = "Let me try a different approach. I'm going to escalate this internally to get additional technical resources involved."
-        elif "question" in customer_message.lower() or "?" in customer_message:
-            solution = "Great question. Let me explain that in more detail and make sure it's clear."
-        elif "works" in customer_message.lower() or "fixed" in customer_message.lower():
-            solution = "Excellent! I'm glad we got that resolved. Let me just confirm everything is working as expected."
-        else:
-            solution = "Based on what you've shared, let me provide you with the next steps to resolve this."
+        solution_tag = next(
+            (tag for tag, keywords in _FOLLOW_UP_SOLUTION_KEYWORDS if any(kw in msg for kw in keywords)),
+            None,
+        )
 
-        return acknowledgment + solution
+        return f"{acknowledgment}{_FOLLOW_UP_SOLUTION[solution_tag]}"
 
     def _calculate_resolution_metrics(
         self, employee: dict[str, Any], case_analysis: dict[str, Any]
@@ -491,34 +716,25 @@ class EmployeeSimulator:
         base_time = employee["avg_resolution_time"]
 
         # Adjust for case complexity
-        if case_analysis["complexity"] == "high":
-            estimated_time = base_time * 1.5
-        elif case_analysis["complexity"] == "medium":
-            estimated_time = base_time * 1.2
-        else:
-            estimated_time = base_time
+        estimated_time = base_time * _COMPLEXITY_TIME_FACTOR.get(case_analysis["complexity"], 1.0)
 
         # Adjust for customer frustration
         if case_analysis["customer_frustration"] > 7:
             estimated_time *= 1.3  # Frustrated customers take longer
 
         # Adjust for employee experience
-        if employee["skill_level"] == "senior":
-            estimated_time *= 0.8
-        elif employee["skill_level"] == "junior":
-            estimated_time *= 1.4
+        estimated_time *= employee["_skill_level_factor"]
 
         # Calculate success probability
         success_probability = 0.9  # Base success rate
 
         # Adjust for skill match
         required_skills = case_analysis["required_skills"]
-        employee_skills = employee["skills"]
-        skill_match = len(set(required_skills) & set(employee_skills)) / len(required_skills)
+        skill_match = len(employee["_skills_set"].intersection(required_skills)) / len(required_skills)
         success_probability *= (0.7 + 0.3 * skill_match)
 
         # Adjust for employee experience
-        success_probability *= (0.8 + 0.2 * (employee["years_experience"] / 10))
+        success_probability *= employee["_experience_factor"]
 
         return {
             "estimated_time": int(estimated_time),
@@ -528,16 +744,11 @@ class EmployeeSimulator:
         }
 
     def _should_resolve_case(
-        self, customer_message: str, customer_frustration: int, case: dict[str, Any]
+        self, customer_message: str, customer_frustration: int, case: _CaseRecord
     ) -> bool:
         """Determine if case should be resolved"""
 
-        resolution_indicators = [
-            "thank you", "that worked", "perfect", "solved", "fixed",
-            "resolved", "that's great", "excellent"
-        ]
-
-        if any(indicator in customer_message.lower() for indicator in resolution_indicators):
+        if _contains_resolution_phrase(customer_message):
             return True
 
         # Low frustration after some time suggests resolution
@@ -545,7 +756,7 @@ class EmployeeSimulator:
             return True
 
         # Simple acknowledgments suggest satisfaction
-        if customer_message.lower() in ["ok", "okay", "thanks", "got it"]:
+        if customer_message.strip().lower() in _SHORT_ACKNOWLEDGMENTS:
             return True
 
         return False
@@ -554,44 +765,45 @@ class EmployeeSimulator:
         """Resolve the case and calculate final metrics"""
 
         case = self.active_cases[case_id]
-        employee = self._get_employee(case["employee_id"])
+        employee = self._get_employee(case.employee_id)
 
-        resolution_time = (datetime.now() - case["start_time"]).total_seconds() / 60  # minutes
+        resolution_time = (time.monotonic() - case.start_monotonic) / 60  # minutes
 
         # Calculate customer satisfaction (simulated)
         base_satisfaction = employee["customer_satisfaction"]
-        complexity_factor = {"low": 0.1, "medium": 0.0, "high": -0.2}[case["case_analysis"]["complexity"]]
-        satisfaction = min(5.0, base_satisfaction + complexity_factor + random.uniform(-0.2, 0.2))
+        complexity_factor = _SATISFACTION_COMPLEXITY_ADJUSTMENT[case.case_analysis["complexity"]]
+        satisfaction = min(5.0, base_satisfaction + complexity_factor + self._rng.uniform(-0.2, 0.2))
+
+        # Free the employee's slot and remove from active cases
+        with self._lock:
+            del self.active_cases[case_id]
+            self._update_employee_workload(employee["id"], -1)
+            self._cases_per_employee[case.employee_id] -= 1
+            if self._cases_per_employee[case.employee_id] <= 0:
+                del self._cases_per_employee[case.employee_id]
 
-        # Update employee workload (both simulation and database)
-        self._update_employee_workload(employee["id"], -1)
-        
         # Try to update database workload too
         try:
-            asyncio.create_task(self.agent_service.complete_conversation(
+            _run_or_schedule(self.agent_service.complete_conversation(
                 employee["id"], 
-                case["customer_context"].get("session_id", f"sim_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
+                case.customer_context.get("session_id", f"sim_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
             ))
         except Exception as e:
-            self.logger.warning(f"Could not update database completion: {e}")
-
-        # Remove from active cases
-        del self.active_cases[case_id]
+            _LOGGER.warning(f"Could not update database completion: {e}")
 
         return {
             "resolution_time_minutes": resolution_time,
             "customer_satisfaction": round(satisfaction, 1),
-            "case_complexity": case["case_analysis"]["complexity"],
+            "case_complexity": case.case_analysis["complexity"],
             "employee_performance": "excellent" if satisfaction > 4.5 else "good" if satisfaction > 4.0 else "acceptable",
             "resolution_method": "direct_resolution",
         }
 
     def _update_employee_workload(self, employee_id: str, change: int):
         """Update employee workload in simulation roster"""
-        for employee in self.fallback_employees:
-            if employee["id"] == employee_id:
-                employee["current_workload"] = max(0, employee["current_workload"] + change)
-                break
+        employee = self._by_id.get(employee_id)
+        if employee:
+            employee["current_workload"] = max(0, employee["current_workload"] + change)
 
     def _handle_employee_not_available(self, customer_context: dict[str, Any]) -> dict[str, Any]:
         """Handle case when assigned employee is not available"""
@@ -602,15 +814,25 @@ class EmployeeSimulator:
             "estimated_wait_time": 15,  # minutes
         }
 
+    def _handle_employee_at_capacity(self, employee: dict[str, Any]) -> dict[str, Any]:
+        """Handle case when assigned employee has no free conversation slots"""
+        queued_cases = self._cases_per_employee.get(employee["id"], 0)
+        return {
+            "error": "Employee at capacity",
+            "escalation_handled": False,
+            "recommendation": "Queue for this agent or route to another available agent",
+            "queue_position": max(1, queued_cases - employee["max_concurrent"] + 1),
+            "estimated_wait_time": employee["avg_resolution_time"],  # minutes
+        }
+
     def get_employee_status(self) -> list[dict[str, Any]]:
         """Get current status of all employees (database + fallback)"""
         employees = []
         
         # Try to get from database first
         try:
-            loop = asyncio.get_event_loop()
-            if not loop.is_running():
-                db_agents = loop.run_until_complete(self.get_database_agents())
+            if not _in_running_loop():
+                db_agents = _run_blocking(self.get_database_agents())
                 for agent in db_agents:
                     employees.append({
                         "id": agent.id,
@@ -622,35 +844,37 @@ class EmployeeSimulator:
                         "utilization": agent.workload.active_conversations / agent.max_concurrent_conversations,
                     })
         except Exception as e:
-            self.logger.warning(f"Could not get database agents for status: {e}")
+            _LOGGER.warning(f"Could not get database agents for status: {e}")
         
         # Fallback to simulation employees if database is empty
         if not employees:
-            employees = [
-                {
+            for emp in self.fallback_employees:
+                workload = emp["current_workload"]
+                max_concurrent = emp["max_concurrent"]
+                employees.append({
                     "id": emp["id"],
                     "name": emp["name"],
-                    "type": emp["type"].value,
-                    "current_workload": emp["current_workload"],
-                    "max_concurrent": emp["max_concurrent"],
-                    "availability": "available" if emp["current_workload"] < emp["max_concurrent"] else "busy",
-                    "utilization": emp["current_workload"] / emp["max_concurrent"],
-                }
-                for emp in self.fallback_employees
-            ]
+                    "type": emp["_type_value"],
+                    "current_workload": workload,
+                    "max_concurrent": max_concurrent,
+                    "availability": "available" if workload < max_concurrent else "busy",
+                    "utilization": workload * emp["_inv_max"],
+                })
         
         return employees
 
     def get_active_cases_summary(self) -> dict[str, Any]:
         """Get summary of active cases"""
-        return {
-            "total_active_cases": len(self.active_cases),
-            "cases_by_employee": {
-                emp["id"]: len([case for case in self.active_cases.values() if case["employee_id"] == emp["id"]])
-                for emp in self.employees
-            },
-            "average_case_duration": sum(
-                (datetime.now() - case["start_time"]).total_seconds() / 60
-                for case in self.active_cases.values()
-            ) / max(len(self.active_cases), 1),
-        }
+        now = time.monotonic()
+        with self._lock:
+            return {
+                "total_active_cases": len(self.active_cases),
+                "cases_by_employee": {
+                    emp["id"]: self._cases_per_employee.get(emp["id"], 0)
+                    for emp in self.fallback_employees
+                },
+                "average_case_duration": sum(
+                    now - case.start_monotonic for case in self.active_cases.values()
+                ) / 60 / max(len(self.active_cases), 1),
+            }
+
@@ -3,13 +3,24 @@ Human Customer Simulator
 Simulates various types of customer interactions for testing the system
 """
 
+import functools
+import itertools
 import random
-from datetime import datetime
+import re
+import time
+from collections import deque
 from enum import Enum
-from typing import Any
+from typing import Any, Callable, Optional
+
+import numpy as np
 
 from ..core.logging import get_logger
 
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick is optional; fall back to per-category scans
+    ahocorasick = None
+
 
 class CustomerPersonality(Enum):
     POLITE = "polite"
@@ -30,12 +41,339 @@ class CustomerScenario(Enum):
     ESCALATION_REQUEST = "escalation_request"
 
 
+# Customer goals by scenario
+_GOALS: dict[CustomerScenario, tuple[str, ...]] = {
+    CustomerScenario.SIMPLE_QUESTION: ("Get clear answer", "Quick resolution"),
+    CustomerScenario.TECHNICAL_ISSUE: ("Fix the problem", "Understand root cause", "Prevent recurrence"),
+    CustomerScenario.BILLING_PROBLEM: ("Correct billing", "Understand charges", "Update payment info"),
+    CustomerScenario.ACCOUNT_ACCESS: ("Regain access", "Secure account", "Prevent future lockouts"),
+    CustomerScenario.COMPLEX_INTEGRATION: ("Complete integration", "Get expert guidance", "Ensure best practices"),
+    CustomerScenario.REPEAT_ISSUE: ("Permanent fix", "Escalate to prevent recurrence", "Get explanation"),
+    CustomerScenario.ESCALATION_REQUEST: ("Speak to manager", "File complaint", "Get executive attention"),
+}
+_DEFAULT_GOALS = ("Resolve issue",)
+
+# Scenarios that should always end in escalation
+_ESCALATION_SCENARIOS = frozenset({
+    CustomerScenario.COMPLEX_INTEGRATION,
+    CustomerScenario.REPEAT_ISSUE,
+    CustomerScenario.ESCALATION_REQUEST,
+})
+
+# Scenarios where technical customers expect technical vocabulary
+_TECHNICAL_SCENARIOS = frozenset({CustomerScenario.TECHNICAL_ISSUE, CustomerScenario.COMPLEX_INTEGRATION})
+
+# Base queries by scenario - Insurance specific questions
+_BASE_QUERIES = {
+    CustomerScenario.SIMPLE_QUESTION: (
+        "How do deductibles work exactly?",
+        "What's the difference between comprehensive and collision coverage?",
+        "Can you explain how my premiums are calculated?",
+        "What factors affect my insurance rates?",
+    ),
+    CustomerScenario.TECHNICAL_ISSUE: (
+        "I'm trying to understand my coverage limits but the policy language is confusing",
+        "The terms in my policy document don't match what I was told when I signed up",
+        "I need help interpreting the exclusions section of my policy",
+        "Can you explain what 'actual cash value' means versus replacement cost?",
+    ),
+    CustomerScenario.BILLING_PROBLEM: (
+        "My premium went up significantly and I don't understand why",
+        "I think there's an error in how my multi-policy discount was applied",
+        "I was promised a good driver discount but don't see it on my bill",
+        "Can you explain all these fees on my insurance statement?",
+    ),
+    CustomerScenario.ACCOUNT_ACCESS: (
+        "I need to add my teenage driver to my policy but have questions about coverage",
+        "How do I properly report changes to my vehicle's usage?",
+        "I want to adjust my coverage but need to understand the implications first",
+        "Can you help me understand what happens if I change my deductible?",
+    ),
+    CustomerScenario.COMPLEX_INTEGRATION: (
+        "I have multiple properties and vehicles - how should I structure my coverage?",
+        "I'm starting a home business and need to understand liability implications",
+        "I have a classic car collection - what special considerations are there?",
+        "Can you help me understand umbrella insurance and whether I need it?",
+    ),
+    CustomerScenario.REPEAT_ISSUE: (
+        "I filed a claim weeks ago and still haven't heard about the status",
+        "This is the third time I'm calling about my claim reimbursement",
+        "My adjuster hasn't returned my calls and I'm getting frustrated",
+        "I was told my claim would be processed but nothing has happened",
+    ),
+    CustomerScenario.ESCALATION_REQUEST: (
+        "I'm not satisfied with how my claim is being handled - I need a manager",
+        "This claim settlement offer seems unfair, I need to speak to someone in charge",
+        "I want to file a complaint about my agent's service",
+        "I'm considering switching insurers due to poor service - can a supervisor call me?",
+    ),
+}
+
+# Conversation context per scenario; range/tuple values are drawn per customer
+_CONTEXT_TEMPLATES = {
+    CustomerScenario.SIMPLE_QUESTION: {
+        "previous_interactions": range(0, 3),
+        "account_type": "basic",
+        "urgency": "low",
+    },
+    CustomerScenario.TECHNICAL_ISSUE: {
+        "previous_interactions": range(1, 4),
+        "account_type": ("pro", "enterprise"),
+        "urgency": "medium",
+        "technical_level": "intermediate",
+    },
+    CustomerScenario.BILLING_PROBLEM: {
+        "previous_interactions": range(0, 2),
+        "account_type": ("basic", "pro"),
+        "urgency": "medium",
+        "involves_money": True,
+    },
+    CustomerScenario.ACCOUNT_ACCESS: {
+        "previous_interactions": range(0, 3),
+        "account_type": "any",
+        "urgency": "high",
+        "blocking_work": True,
+    },
+    CustomerScenario.COMPLEX_INTEGRATION: {
+        "previous_interactions": range(2, 6),
+        "account_type": "enterprise",
+        "urgency": "medium",
+        "technical_level": "advanced",
+        "requires_specialist": True,
+    },
+    CustomerScenario.REPEAT_ISSUE: {
+        "previous_interactions": range(3, 9),
+        "account_type": "any",
+        "urgency": "high",
+        "previous_escalations": range(1, 3),
+        "customer_patience": "low",
+    },
+    CustomerScenario.ESCALATION_REQUEST: {
+        "previous_interactions": range(2, 7),
+        "account_type": "any",
+        "urgency": "high",
+        "previous_escalations": range(0, 2),
+        "explicit_escalation": True,
+    },
+}
+
+_URGENCY_PHRASES = ("I need this fixed ASAP", "This is urgent", "I need an immediate response")
+
+
+def _q_polite(query: str, frustration: int, rng: random.Random) -> str:
+    return f"Hello, I hope you can help me. {query} Thank you for your time."
+
+
+def _q_impatient(query: str, frustration: int, rng: random.Random) -> str:
+    if frustration > 3:
+        return f"{query} {rng.choice(_URGENCY_PHRASES)}!"
+    return f"{query} Please respond quickly."
+
+
+def _q_technical(query: str, frustration: int, rng: random.Random) -> str:
+    return f"{query} I've already checked the documentation and tried basic troubleshooting."
+
+
+def _q_frustrated(query: str, frustration: int, rng: random.Random) -> str:
+    if frustration > 5:
+        return f"This is ridiculous! {query} Why is this so complicated?!"
+    return f"I'm getting frustrated here. {query}"
+
+
+def _q_confused(query: str, frustration: int, rng: random.Random) -> str:
+    return f"I'm really confused about something. {query} Can you explain this in simple terms?"
+
+
+def _q_business(query: str, frustration: int, rng: random.Random) -> str:
+    return f"Hello, I'm reaching out regarding a business matter. {query} Please advise on the appropriate next steps."
+
+
+# Personality -> query rewriter(query, frustration, rng)
+_PERSONALITY_DISPATCH: dict[CustomerPersonality, Callable[[str, int, random.Random], str]] = {
+    CustomerPersonality.POLITE: _q_polite,
+    CustomerPersonality.IMPATIENT: _q_impatient,
+    CustomerPersonality.TECHNICAL: _q_technical,
+    CustomerPersonality.FRUSTRATED: _q_frustrated,
+    CustomerPersonality.CONFUSED: _q_confused,
+    CustomerPersonality.BUSINESS: _q_business,
+}
+
+# Decision bits packed per (personality, scenario, frustration)
+_SHOULD_ESCALATE = 1
+_WANTS_ESCALATION = 2
+
+
+def _escalation_decision_bits(
+    personality: CustomerPersonality, scenario: CustomerScenario, frustration: int
+) -> int:
+    """Reference escalation rules that do not depend on the chatbot reply"""
+    bits = 0
+    if (
+        scenario in _ESCALATION_SCENARIOS
+        or frustration > 6
+        or (personality == CustomerPersonality.IMPATIENT and frustration > 4)
+    ):
+        bits |= _SHOULD_ESCALATE
+    # Explicit escalation requests and very high frustration always escalate
+    if scenario == CustomerScenario.ESCALATION_REQUEST or frustration > 7:
+        bits |= _WANTS_ESCALATION
+    return bits
+
+
+def _escalation_satisfaction_floor(personality: CustomerPersonality, scenario: CustomerScenario) -> float:
+    """Satisfaction score below which the customer asks for escalation"""
+    floor = 0.0  # Scores are clamped to >= 1.0, so 0.0 never escalates
+    if personality == CustomerPersonality.IMPATIENT:
+        floor = 5.0
+    if scenario == CustomerScenario.REPEAT_ISSUE:
+        floor = max(floor, 6.0)
+    elif scenario == CustomerScenario.COMPLEX_INTEGRATION:
+        floor = max(floor, 7.0)
+    return floor
+
+
+# Frustration is on a 0-10 scale; the rules above are constant outside it
+_DECISION_TABLE = {
+    (personality, scenario, frustration): _escalation_decision_bits(personality, scenario, frustration)
+    for personality in CustomerPersonality
+    for scenario in CustomerScenario
+    for frustration in range(11)
+}
+
+_ESCALATION_SATISFACTION_FLOOR = {
+    (personality, scenario): _escalation_satisfaction_floor(personality, scenario)
+    for personality in CustomerPersonality
+    for scenario in CustomerScenario
+}
+
+
+def _decision_bits(personality: CustomerPersonality, scenario: CustomerScenario, frustration: int) -> int:
+    """Look up the escalation bits, falling back to the rules for unset state"""
+    bits = _DECISION_TABLE.get((personality, scenario, min(max(frustration, 0), 10)))
+    if bits is None:
+        return _escalation_decision_bits(personality, scenario, frustration)
+    return bits
+
+
+# Customer replies by satisfaction bucket, lowest (and most frustrated) first
+_RESPONSE_BUCKETS = (
+    (
+        "This is not helpful at all! I need to speak to someone else.",
+        "I'm getting more frustrated. Can you escalate this please?",
+        "This isn't working. I want to talk to a human agent.",
+    ),
+    (
+        "I don't think this is going to work for my situation.",
+        "I'm still having trouble. Is there someone else who can help?",
+        "This doesn't seem right. Can you double-check?",
+    ),
+    (
+        "I'm still not sure I understand. Can you explain more?",
+        "That doesn't quite address my specific issue.",
+        "I tried something similar before. Is there another option?",
+    ),
+    (
+        "Thanks, that's helpful. Let me try that.",
+        "Okay, I think I understand. Thank you.",
+        "That makes sense, I'll give it a try.",
+    ),
+    (
+        "Perfect, thank you so much for the help!",
+        "That's exactly what I needed, thanks!",
+        "Great, that solved my problem. I appreciate it!",
+    ),
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _apply_deterministic(base_query: str, personality: CustomerPersonality, very_frustrated: bool) -> str:
+    """Memoized rewrite for the personality/frustration cases that draw no random phrase
+
+    Only ``frustration > 5`` changes these outputs, so a representative level is
+    passed through and no RNG is needed.
+    """
+    return _PERSONALITY_DISPATCH[personality](base_query, 6 if very_frustrated else 0, None)
+
+
+# All members, materialized once for random draws; order also indexes batched draws
+_PERSONALITIES = tuple(CustomerPersonality)
+_SCENARIOS = tuple(CustomerScenario)
+
+# One uniform draw for the base query plus one per context key
+_DRAWS_PER_INTERACTION = 1 + max(len(template) for template in _CONTEXT_TEMPLATES.values())
+
+# Last formatted session second, reused while the wall-clock second is unchanged
+_SESSION_STAMP = [0, ""]
+# Process-wide suffix keeping session ids unique within the same second
+_SESSION_COUNTER = itertools.count(1)
+# Process-wide customer numbering; unique without spending RNG draws
+_CUSTOMER_COUNTER = itertools.count(1000)
+
+
+def _session_prefix() -> str:
+    """Return the ``%Y%m%d_%H%M%S`` stamp for the current second, formatted once per second"""
+    now = int(time.time())
+    if now != _SESSION_STAMP[0]:
+        _SESSION_STAMP[1] = time.strftime("%Y%m%d_%H%M%S", time.localtime(now))
+        _SESSION_STAMP[0] = now
+    return _SESSION_STAMP[1]
+
+
+# Phrase categories the customer looks for in a chatbot response
+_RESPONSE_PHRASES = {
+    "polite": ("thank you", "please", "i understand", "i apologize", "i'm sorry"),
+    "solution": ("here's how", "you can", "try this", "step by step", "solution"),
+    "empathy": ("understand", "frustration", "sorry", "apologize"),
+    "tech": ("api", "integration", "configuration", "technical"),
+}
+
+
+def _build_phrase_automaton() -> Optional["ahocorasick.Automaton"]:
+    """Build one Aho-Corasick automaton over all response phrases if available"""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for category, phrases in _RESPONSE_PHRASES.items():
+        for phrase in phrases:
+            automaton.add_word(phrase, category)
+    automaton.make_automaton()
+    return automaton
+
+
+_PHRASE_AUTOMATON = _build_phrase_automaton()
+
+# Per-category alternations used when pyahocorasick is not installed
+_PHRASE_PATTERNS = {
+    category: re.compile("|".join(map(re.escape, phrases)))
+    for category, phrases in _RESPONSE_PHRASES.items()
+}
+
+
+def _matched_phrase_categories(low: str) -> set[str]:
+    """Return the phrase categories present in an already-lowercased response"""
+    if _PHRASE_AUTOMATON is not None:
+        return {category for _, category in _PHRASE_AUTOMATON.iter(low)}
+    return {category for category, pattern in _PHRASE_PATTERNS.items() if pattern.search(low)}
+
+
 class HumanCustomerSimulator:
     """Simulates human customer interactions with various personalities and scenarios"""
 
-    def __init__(self):
+    __slots__ = (
+        "logger",
+        "_rng",
+        "conversation_history",
+        "current_personality",
+        "current_scenario",
+        "frustration_level",
+    )
+
+    def __init__(self, seed: Optional[int] = None, history_limit: Optional[int] = 1024):
         self.logger = get_logger(__name__)
-        self.conversation_history = []
+        # Private RNG so simulations can be seeded reproducibly per instance
+        self._rng = random.Random(seed)
+        # Only the most recent interactions are kept; None keeps everything
+        self.conversation_history: deque[dict[str, Any]] = deque(maxlen=history_limit)
         self.current_personality = None
         self.current_scenario = None
         self.frustration_level = 0  # 0-10 scale
@@ -50,11 +388,11 @@ class HumanCustomerSimulator:
 
         # Randomize if not specified
         if personality is None:
-            personality = random.choice(list(CustomerPersonality))
+            personality = self._rng.choice(_PERSONALITIES)
         if scenario is None:
-            scenario = random.choice(list(CustomerScenario))
+            scenario = self._rng.choice(_SCENARIOS)
         if frustration_level is None:
-            frustration_level = random.randint(0, 3)  # Most customers start with low frustration
+            frustration_level = self._rng.randint(0, 3)  # Most customers start with low frustration
 
         self.current_personality = personality
         self.current_scenario = scenario
@@ -64,8 +402,8 @@ class HumanCustomerSimulator:
         initial_query = self._generate_initial_query(personality, scenario, frustration_level)
 
         interaction = {
-            "customer_id": f"sim_customer_{random.randint(1000, 9999)}",
-            "session_id": f"sim_session_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+            "customer_id": "sim_customer_" + str(next(_CUSTOMER_COUNTER)),
+            "session_id": f"sim_session_{_session_prefix()}_{next(_SESSION_COUNTER)}",
             "personality": personality.value,
             "scenario": scenario.value,
             "initial_frustration_level": frustration_level,
@@ -78,11 +416,57 @@ class HumanCustomerSimulator:
         self.conversation_history.append(interaction)
         return interaction
 
+    def create_customer_interactions(self, n: int) -> list[dict[str, Any]]:
+        """Create n randomized customer interactions with batched random draws"""
+
+        rng = np.random.default_rng(self._rng.getrandbits(64))
+        personality_idx = rng.integers(0, len(_PERSONALITIES), n).tolist()
+        scenario_idx = rng.integers(0, len(_SCENARIOS), n).tolist()
+        frustrations = rng.integers(0, 4, n).tolist()  # Most customers start with low frustration
+        draws = rng.random((n, _DRAWS_PER_INTERACTION)).tolist()
+        session_prefix = f"sim_session_{_session_prefix()}"
+
+        interactions = []
+        for i in range(n):
+            personality = _PERSONALITIES[personality_idx[i]]
+            scenario = _SCENARIOS[scenario_idx[i]]
+            frustration_level = frustrations[i]
+            row = draws[i]
+
+            queries = _BASE_QUERIES[scenario]
+            base_query = queries[int(row[0] * len(queries))]
+
+            context = {}
+            for j, (key, value) in enumerate(_CONTEXT_TEMPLATES[scenario].items(), 1):
+                if isinstance(value, (range, tuple)):
+                    value = value[int(row[j] * len(value))]
+                context[key] = value
+
+            interactions.append({
+                "customer_id": "sim_customer_" + str(next(_CUSTOMER_COUNTER)),
+                "session_id": f"{session_prefix}_{next(_SESSION_COUNTER)}",
+                "personality": personality.value,
+                "scenario": scenario.value,
+                "initial_frustration_level": frustration_level,
+                "initial_query": self._apply_personality_to_query(base_query, personality, frustration_level),
+                "conversation_context": context,
+                "expected_escalation": self._should_escalate(personality, scenario, frustration_level),
+                "customer_goals": self._get_customer_goals(scenario),
+            })
+
+        if interactions:
+            self.current_personality = personality
+            self.current_scenario = scenario
+            self.frustration_level = frustration_level
+        self.conversation_history.extend(interactions)
+        return interactions
+
     def respond_to_chatbot(self, chatbot_response: str, current_interaction: dict[str, Any]) -> dict[str, Any]:
         """Generate customer response to chatbot message"""
 
         # Analyze chatbot response quality from customer perspective
-        response_quality = self._analyze_response_quality(chatbot_response, current_interaction)
+        low = chatbot_response.lower()
+        response_quality = self._analyze_response_quality(chatbot_response, low, current_interaction)
 
         # Update frustration level based on response
         frustration_change = self._calculate_frustration_change(response_quality, current_interaction)
@@ -110,54 +494,8 @@ class HumanCustomerSimulator:
     ) -> str:
         """Generate initial customer query based on personality and scenario"""
 
-        # Base queries by scenario - Insurance specific questions
-        base_queries = {
-            CustomerScenario.SIMPLE_QUESTION: [
-                "How do deductibles work exactly?",
-                "What's the difference between comprehensive and collision coverage?",
-                "Can you explain how my premiums are calculated?",
-                "What factors affect my insurance rates?",
-            ],
-            CustomerScenario.TECHNICAL_ISSUE: [
-                "I'm trying to understand my coverage limits but the policy language is confusing",
-                "The terms in my policy document don't match what I was told when I signed up",
-                "I need help interpreting the exclusions section of my policy",
-                "Can you explain what 'actual cash value' means versus replacement cost?",
-            ],
-            CustomerScenario.BILLING_PROBLEM: [
-                "My premium went up significantly and I don't understand why",
-                "I think there's an error in how my multi-policy discount was applied",
-                "I was promised a good driver discount but don't see it on my bill",
-                "Can you explain all these fees on my insurance statement?",
-            ],
-            CustomerScenario.ACCOUNT_ACCESS: [
-                "I need to add my teenage driver to my policy but have questions about coverage",
-                "How do I properly report changes to my vehicle's usage?",
-                "I want to adjust my coverage but need to understand the implications first",
-                "Can you help me understand what happens if I change my deductible?",
-            ],
-            CustomerScenario.COMPLEX_INTEGRATION: [
-                "I have multiple properties and vehicles - how should I structure my coverage?",
-                "I'm starting a home business and need to understand liability implications",
-                "I have a classic car collection - what special considerations are there?",
-                "Can you help me understand umbrella insurance and whether I need it?",
-            ],
-            CustomerScenario.REPEAT_ISSUE: [
-                "I filed a claim weeks ago and still haven't heard about the status",
-                "This is the third time I'm calling about my claim reimbursement",
-                "My adjuster hasn't returned my calls and I'm getting frustrated",
-                "I was told my claim would be processed but nothing has happened",
-            ],
-            CustomerScenario.ESCALATION_REQUEST: [
-                "I'm not satisfied with how my claim is being handled - I need a manager",
-                "This claim settlement offer seems unfair, I need to speak to someone in charge",
-                "I want to file a complaint about my agent's service",
-                "I'm considering switching insurers due to poor service - can a supervisor call me?",
-            ],
-        }
-
         # Select base query
-        base_query = random.choice(base_queries[scenario])
+        base_query = self._rng.choice(_BASE_QUERIES[scenario])
 
         # Modify based on personality and frustration level
         query = self._apply_personality_to_query(base_query, personality, frustration)
@@ -169,122 +507,40 @@ class HumanCustomerSimulator:
     ) -> str:
         """Apply personality traits to the query"""
 
-        if personality == CustomerPersonality.POLITE:
-            return f"Hello, I hope you can help me. {base_query} Thank you for your time."
-
-        elif personality == CustomerPersonality.IMPATIENT:
-            urgency_phrases = ["I need this fixed ASAP", "This is urgent", "I need an immediate response"]
-            if frustration > 3:
-                return f"{base_query} {random.choice(urgency_phrases)}!"
-            return f"{base_query} Please respond quickly."
-
-        elif personality == CustomerPersonality.TECHNICAL:
-            return f"{base_query} I've already checked the documentation and tried basic troubleshooting."
-
-        elif personality == CustomerPersonality.FRUSTRATED:
-            if frustration > 5:
-                return f"This is ridiculous! {base_query} Why is this so complicated?!"
-            return f"I'm getting frustrated here. {base_query}"
-
-        elif personality == CustomerPersonality.CONFUSED:
-            return f"I'm really confused about something. {base_query} Can you explain this in simple terms?"
-
-        elif personality == CustomerPersonality.BUSINESS:
-            return f"Hello, I'm reaching out regarding a business matter. {base_query} Please advise on the appropriate next steps."
-
-        return base_query
+        rewrite = _PERSONALITY_DISPATCH.get(personality)
+        if rewrite is None:
+            return base_query
+        if personality == CustomerPersonality.IMPATIENT and frustration > 3:
+            # Urgency phrase is drawn fresh for every query
+            return rewrite(base_query, frustration, self._rng)
+        return _apply_deterministic(base_query, personality, frustration > 5)
 
     def _get_conversation_context(self, scenario: CustomerScenario) -> dict[str, Any]:
         """Get conversation context for the scenario"""
 
-        contexts = {
-            CustomerScenario.SIMPLE_QUESTION: {
-                "previous_interactions": random.randint(0, 2),
-                "account_type": "basic",
-                "urgency": "low",
-            },
-            CustomerScenario.TECHNICAL_ISSUE: {
-                "previous_interactions": random.randint(1, 3),
-                "account_type": random.choice(["pro", "enterprise"]),
-                "urgency": "medium",
-                "technical_level": "intermediate",
-            },
-            CustomerScenario.BILLING_PROBLEM: {
-                "previous_interactions": random.randint(0, 1),
-                "account_type": random.choice(["basic", "pro"]),
-                "urgency": "medium",
-                "involves_money": True,
-            },
-            CustomerScenario.ACCOUNT_ACCESS: {
-                "previous_interactions": random.randint(0, 2),
-                "account_type": "any",
-                "urgency": "high",
-                "blocking_work": True,
-            },
-            CustomerScenario.COMPLEX_INTEGRATION: {
-                "previous_interactions": random.randint(2, 5),
-                "account_type": "enterprise",
-                "urgency": "medium",
-                "technical_level": "advanced",
-                "requires_specialist": True,
-            },
-            CustomerScenario.REPEAT_ISSUE: {
-                "previous_interactions": random.randint(3, 8),
-                "account_type": "any",
-                "urgency": "high",
-                "previous_escalations": random.randint(1, 2),
-                "customer_patience": "low",
-            },
-            CustomerScenario.ESCALATION_REQUEST: {
-                "previous_interactions": random.randint(2, 6),
-                "account_type": "any",
-                "urgency": "high",
-                "previous_escalations": random.randint(0, 1),
-                "explicit_escalation": True,
-            },
+        return {
+            key: self._rng.choice(value) if isinstance(value, (range, tuple)) else value
+            for key, value in _CONTEXT_TEMPLATES[scenario].items()
         }
 
-        return contexts.get(scenario, {"previous_interactions": 0, "urgency": "low"})
-
     def _should_escalate(
         self, personality: CustomerPersonality, scenario: CustomerScenario, frustration: int
     ) -> bool:
         """Determine if this interaction should result in escalation"""
 
-        escalation_scenarios = [
-            CustomerScenario.COMPLEX_INTEGRATION,
-            CustomerScenario.REPEAT_ISSUE,
-            CustomerScenario.ESCALATION_REQUEST,
-        ]
-
-        if scenario in escalation_scenarios:
-            return True
-
-        if frustration > 6:
-            return True
-
-        if personality == CustomerPersonality.IMPATIENT and frustration > 4:
-            return True
-
-        return False
+        return bool(_decision_bits(personality, scenario, frustration) & _SHOULD_ESCALATE)
 
     def _get_customer_goals(self, scenario: CustomerScenario) -> list[str]:
         """Get customer goals for the scenario"""
 
-        goals = {
-            CustomerScenario.SIMPLE_QUESTION: ["Get clear answer", "Quick resolution"],
-            CustomerScenario.TECHNICAL_ISSUE: ["Fix the problem", "Understand root cause", "Prevent recurrence"],
-            CustomerScenario.BILLING_PROBLEM: ["Correct billing", "Understand charges", "Update payment info"],
-            CustomerScenario.ACCOUNT_ACCESS: ["Regain access", "Secure account", "Prevent future lockouts"],
-            CustomerScenario.COMPLEX_INTEGRATION: ["Complete integration", "Get expert guidance", "Ensure best practices"],
-            CustomerScenario.REPEAT_ISSUE: ["Permanent fix", "Escalate to prevent recurrence", "Get explanation"],
-            CustomerScenario.ESCALATION_REQUEST: ["Speak to manager", "File complaint", "Get executive attention"],
-        }
+        # Fresh list per interaction so callers can edit their own goals
+        return list(_GOALS.get(scenario, _DEFAULT_GOALS))
 
-        return goals.get(scenario, ["Resolve issue"])
+    def _analyze_response_quality(self, response: str, low: str, interaction: dict[str, Any]) -> dict[str, Any]:
+        """Analyze chatbot response quality from customer perspective
 
-    def _analyze_response_quality(self, response: str, interaction: dict[str, Any]) -> dict[str, Any]:
-        """Analyze chatbot response quality from customer perspective"""
+        ``low`` is ``response.lower()``, computed once by the caller.
+        """
 
         quality_score = 7.0  # Base score
         satisfaction_score = 7.0
@@ -296,38 +552,37 @@ class HumanCustomerSimulator:
         elif len(response) > 500:
             quality_score -= 0.5
 
+        hits = _matched_phrase_categories(low)
+        addresses_concern = "solution" in low or "help" in low
+
         # Politeness indicators
-        polite_phrases = ["thank you", "please", "i understand", "i apologize", "i'm sorry"]
-        if any(phrase in response.lower() for phrase in polite_phrases):
+        if "polite" in hits:
             satisfaction_score += 1.0
 
         # Solution indicators
-        solution_phrases = ["here's how", "you can", "try this", "step by step", "solution"]
-        if any(phrase in response.lower() for phrase in solution_phrases):
+        if "solution" in hits:
             quality_score += 1.5
             satisfaction_score += 1.0
 
         # Empathy indicators
-        empathy_phrases = ["understand", "frustration", "sorry", "apologize"]
         if self.current_personality == CustomerPersonality.FRUSTRATED:
-            if any(phrase in response.lower() for phrase in empathy_phrases):
+            if "empathy" in hits:
                 satisfaction_score += 2.0
             else:
                 satisfaction_score -= 1.0
 
         # Technical appropriateness
         if self.current_personality == CustomerPersonality.TECHNICAL:
-            tech_phrases = ["api", "integration", "configuration", "technical"]
-            if any(phrase in response.lower() for phrase in tech_phrases):
+            if "tech" in hits:
                 quality_score += 1.0
-            elif self.current_scenario in [CustomerScenario.TECHNICAL_ISSUE, CustomerScenario.COMPLEX_INTEGRATION]:
+            elif self.current_scenario in _TECHNICAL_SCENARIOS:
                 quality_score -= 1.0
 
         return {
             "quality_score": max(1.0, min(10.0, quality_score)),
             "satisfaction_score": max(1.0, min(10.0, satisfaction_score)),
             "meets_expectations": quality_score >= 6.0,
-            "addresses_concern": "solution" in response.lower() or "help" in response.lower(),
+            "addresses_concern": addresses_concern,
         }
 
     def _calculate_frustration_change(
@@ -364,72 +619,30 @@ class HumanCustomerSimulator:
     ) -> str:
         """Generate customer response to chatbot"""
 
-        if quality["satisfaction_score"] > 8.0:
-            responses = [
-                "Perfect, thank you so much for the help!",
-                "That's exactly what I needed, thanks!",
-                "Great, that solved my problem. I appreciate it!",
-            ]
-            return random.choice(responses)
-
-        elif quality["satisfaction_score"] > 6.0:
-            responses = [
-                "Thanks, that's helpful. Let me try that.",
-                "Okay, I think I understand. Thank you.",
-                "That makes sense, I'll give it a try.",
-            ]
-            return random.choice(responses)
-
-        elif quality["satisfaction_score"] > 4.0:
-            responses = [
-                "I'm still not sure I understand. Can you explain more?",
-                "That doesn't quite address my specific issue.",
-                "I tried something similar before. Is there another option?",
-            ]
-            return random.choice(responses)
-
+        satisfaction = quality["satisfaction_score"]
+        if satisfaction > 8.0:
+            bucket = 4
+        elif satisfaction > 6.0:
+            bucket = 3
+        elif satisfaction > 4.0:
+            bucket = 2
         else:
-            if self.frustration_level > 6:
-                responses = [
-                    "This is not helpful at all! I need to speak to someone else.",
-                    "I'm getting more frustrated. Can you escalate this please?",
-                    "This isn't working. I want to talk to a human agent.",
-                ]
-            else:
-                responses = [
-                    "I don't think this is going to work for my situation.",
-                    "I'm still having trouble. Is there someone else who can help?",
-                    "This doesn't seem right. Can you double-check?",
-                ]
-            return random.choice(responses)
+            bucket = 0 if self.frustration_level > 6 else 1
+        return self._rng.choice(_RESPONSE_BUCKETS[bucket])
 
     def _wants_escalation(self, interaction: dict[str, Any], quality: dict[str, Any]) -> bool:
         """Determine if customer wants escalation"""
 
-        # Explicit escalation scenarios
-        if self.current_scenario == CustomerScenario.ESCALATION_REQUEST:
-            return True
-
-        # High frustration leads to escalation
-        if self.frustration_level > 7:
-            return True
-
-        # Poor quality responses with impatient customers
-        if (self.current_personality == CustomerPersonality.IMPATIENT and
-            quality["satisfaction_score"] < 5.0):
-            return True
-
-        # Repeat issues with no clear solution
-        if (self.current_scenario == CustomerScenario.REPEAT_ISSUE and
-            quality["satisfaction_score"] < 6.0):
-            return True
-
-        # Complex scenarios that need specialist help
-        if (self.current_scenario == CustomerScenario.COMPLEX_INTEGRATION and
-            quality["satisfaction_score"] < 7.0):
+        personality = self.current_personality
+        scenario = self.current_scenario
+        if _decision_bits(personality, scenario, self.frustration_level) & _WANTS_ESCALATION:
             return True
 
-        return False
+        # Poor replies push impatient, repeat-issue and complex-integration customers to escalate
+        floor = _ESCALATION_SATISFACTION_FLOOR.get((personality, scenario))
+        if floor is None:
+            floor = _escalation_satisfaction_floor(personality, scenario)
+        return quality["satisfaction_score"] < floor
 
     def _is_satisfied(self, quality: dict[str, Any]) -> bool:
         """Determine if customer is satisfied and conversation should end"""
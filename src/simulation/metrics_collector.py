@@ -3,17 +3,62 @@ Metrics Collector for Simulation Testing
 Collects and analyzes key performance metrics from simulation runs
 """
 
+import io
 import json
+import logging
+import sys
+import threading
 import time
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
-from dataclasses import dataclass, asdict
+from typing import Any, Dict, List, Optional, Tuple
+from dataclasses import dataclass, field, fields
 from pathlib import Path
 
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
 from ..core.logging import get_logger
+from ._kernels import (
+    NUMBA_MIN_DECISIONS,
+    QUALITY_ADEQUATE,
+    QUALITY_HUMAN_INTERVENTION,
+    QUALITY_NEEDS_ADJUSTMENT,
+    QUALITY_UNKNOWN,
+    frustration_intervention_counts,
+    quality_accuracy_count,
+    routing_success_count,
+)
+
+_DEBUG = logging.DEBUG
+_INFO = logging.INFO
+
+# Completed cycles are logged in batches of this size, or at least this often
+_CYCLE_LOG_BATCH_SIZE = 1024
+_CYCLE_LOG_FLUSH_INTERVAL = 5.0
+
+# orjson options matching json.dump's handling of non-str keys; numpy scalars
+# are written as numbers rather than through default=str
+_ORJSON_EXPORT_OPTIONS = (
+    orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY if orjson is not None else 0
+)
+
+# Decision kinds tagging the rows a cycle buffers until it completes
+_QUALITY_DECISION = "quality"
+_FRUSTRATION_DECISION = "frustration"
+_ROUTING_DECISION = "routing"
 
+_QUALITY_DECISION_CODES = {
+    "adequate": QUALITY_ADEQUATE,
+    "needs_adjustment": QUALITY_NEEDS_ADJUSTMENT,
+    "human_intervention": QUALITY_HUMAN_INTERVENTION,
+}
 
-@dataclass
+
+@dataclass(slots=True)
 class AgentMetrics:
     """Metrics for individual agent performance"""
     agent_id: str
@@ -33,10 +78,20 @@ class AgentMetrics:
     
     # Quality metrics
     successful_resolutions: int = 0
-    total_resolution_attempts: int = 0
+
+    @property
+    def total_resolution_attempts(self) -> int:
+        """Every handled case is one resolution attempt"""
+        return self.cases_handled
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Shallow field dict for JSON export (fields are all scalars)"""
+        data = {name: getattr(self, name) for name in self.__dataclass_fields__}
+        data["total_resolution_attempts"] = self.cases_handled
+        return data
 
 
-@dataclass
+@dataclass(slots=True)
 class SystemMetrics:
     """Overall system performance metrics"""
     
@@ -65,8 +120,15 @@ class SystemMetrics:
     quality_interventions: int = 0
     frustration_interventions: int = 0
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Field dict for JSON export with timestamps as ISO strings"""
+        data = {name: getattr(self, name) for name in self.__dataclass_fields__}
+        data["start_time"] = self.start_time.isoformat()
+        data["end_time"] = self.end_time.isoformat()
+        return data
 
-@dataclass
+
+@dataclass(slots=True)
 class CycleResult:
     """Results from a single simulation cycle"""
     cycle_id: str
@@ -91,11 +153,94 @@ class CycleResult:
     
     # Issues
     errors: List[str] = None
+
+    # time.monotonic() at cycle start, used for the duration; not exported
+    start_monotonic: float = field(default=0.0, repr=False, metadata={"export": False})
+
+    # (decision kind, row, counts as an intervention) buffered until
+    # record_cycle_completion; not exported
+    pending_decisions: List[Tuple[str, tuple, bool]] = field(
+        default_factory=list, repr=False, metadata={"export": False}
+    )
     
     def __post_init__(self):
         if self.errors is None:
             self.errors = []
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Field dict for JSON export with timestamps as ISO strings"""
+        data = {name: getattr(self, name) for name in _CYCLE_RESULT_EXPORT_FIELDS}
+        data["start_time"] = self.start_time.isoformat()
+        data["end_time"] = self.end_time.isoformat()
+        data["errors"] = list(self.errors)
+        return data
+
+
+_CYCLE_RESULT_EXPORT_FIELDS = tuple(f.name for f in fields(CycleResult) if f.metadata.get("export", True))
+
+
+# (predicate, message) pairs checked in order by _generate_recommendations
+_RECOMMENDATION_RULES = (
+    # Customer satisfaction
+    (lambda m: m.avg_customer_satisfaction < 7.0,
+     "🔴 Customer satisfaction below target (7.0). Consider tuning chatbot quality or agent training."),
+    (lambda m: m.avg_customer_satisfaction > 9.0,
+     "🟡 Very high satisfaction - may indicate insufficient challenge in test scenarios."),
+    # Escalation rate
+    (lambda m: m.escalation_rate > 0.6,
+     "🔴 High escalation rate. Consider improving chatbot responses or quality thresholds."),
+    (lambda m: m.escalation_rate < 0.2,
+     "🟡 Low escalation rate - ensure quality and frustration agents are properly calibrated."),
+    # Agent accuracy
+    (lambda m: m.quality_agent_accuracy < 0.7,
+     "🔴 Quality agent accuracy low. Review quality assessment thresholds."),
+    (lambda m: m.frustration_detection_precision < 0.7,
+     "🔴 Frustration detection precision low. Review frustration indicators and thresholds."),
+    (lambda m: m.routing_success_rate < 0.8,
+     "🔴 Routing success rate low. Review agent specialization matching."),
+    # System efficiency
+    (lambda m: m.avg_resolution_time > 60,
+     "🟡 Average resolution time high. Consider optimizing agent response generation."),
+)
+
+
+def _intern(value: Any) -> Any:
+    """Intern small-vocabulary labels so repeated cycles share one string object"""
+    return sys.intern(value) if type(value) is str else value
+
+
+class _ColumnBuffer:
+    """Growable, equal-length NumPy columns for per-record numeric data"""
+
+    def __init__(self, dtypes: Dict[str, Any], capacity: int = 0):
+        self.size = 0
+        self._columns = {name: np.zeros(capacity, dtype=dtype) for name, dtype in dtypes.items()}
+
+    def append(self, *values) -> None:
+        """Append one row; values follow the column order given at construction"""
+        index = self.size
+        columns = self._columns.values()
+        if index >= self._capacity:
+            self._grow()
+        for column, value in zip(columns, values, strict=True):
+            column[index] = value
+        self.size = index + 1
+
+    @property
+    def _capacity(self) -> int:
+        return next(iter(self._columns.values())).shape[0]
+
+    def _grow(self) -> None:
+        """Double every column, keeping recorded values"""
+        capacity = max(2 * self._capacity, 64)
+        for name, column in self._columns.items():
+            grown = np.zeros(capacity, dtype=column.dtype)
+            grown[:self.size] = column[:self.size]
+            self._columns[name] = grown
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self._columns[name][:self.size]
+
 
 class MetricsCollector:
     """Collects and analyzes metrics from simulation runs"""
@@ -111,105 +256,257 @@ class MetricsCollector:
         self.cycle_results: List[CycleResult] = []
         self.agent_metrics: Dict[str, AgentMetrics] = {}
         
-        # Tracking data
-        self.quality_decisions = []
-        self.frustration_decisions = []
-        self.routing_decisions = []
-        
+        # Tracking data, stored column-wise; see the *_decisions properties for records
+        self._quality_columns = _ColumnBuffer({
+            "cycle_id": object,
+            "decision": object,
+            "score": np.float64,
+            "confidence": np.float64,
+            "next_action": object,
+            "code": np.int8,
+        })
+        self._frustration_columns = _ColumnBuffer({
+            "cycle_id": object,
+            "score": np.float64,
+            "level": object,
+            "intervention": np.bool_,
+            "confidence": np.float64,
+        })
+        self._routing_columns = _ColumnBuffer({
+            "cycle_id": object,
+            "strategy": object,
+            "agent_id": object,
+            "match_score": np.float64,
+            "confidence": np.float64,
+        })
+
+        # Running intervention counts over the decisions above
+        self._quality_intervention_count = 0
+        self._frustration_intervention_count = 0
+        self._failed_route_count = 0
+
+        # Running per-run cycle totals for finish_run
+        self._reset_cycle_totals()
+
+        # Guards the record_* methods when cycles run concurrently
+        self._lock = threading.Lock()
+
+        # Completed cycles not yet covered by a debug log line
+        self._cycle_log_buffer: List[CycleResult] = []
+        self._last_cycle_log = time.monotonic()
+
+    @property
+    def quality_decisions(self) -> List[Dict[str, Any]]:
+        """Recorded quality decisions as one dict per decision"""
+        columns = self._quality_columns
+        return [
+            {"cycle_id": cycle_id, "decision": decision, "score": score, "confidence": confidence, "next_action": next_action}
+            for cycle_id, decision, score, confidence, next_action in zip(
+                columns["cycle_id"].tolist(),
+                columns["decision"].tolist(),
+                columns["score"].tolist(),
+                columns["confidence"].tolist(),
+                columns["next_action"].tolist(),
+                strict=True,
+            )
+        ]
+
+    @property
+    def frustration_decisions(self) -> List[Dict[str, Any]]:
+        """Recorded frustration decisions as one dict per decision"""
+        columns = self._frustration_columns
+        return [
+            {"cycle_id": cycle_id, "score": score, "level": level, "intervention_needed": intervention, "confidence": confidence}
+            for cycle_id, score, level, intervention, confidence in zip(
+                columns["cycle_id"].tolist(),
+                columns["score"].tolist(),
+                columns["level"].tolist(),
+                columns["intervention"].tolist(),
+                columns["confidence"].tolist(),
+                strict=True,
+            )
+        ]
+
+    @property
+    def routing_decisions(self) -> List[Dict[str, Any]]:
+        """Recorded routing decisions as one dict per decision"""
+        columns = self._routing_columns
+        return [
+            {"cycle_id": cycle_id, "strategy": strategy, "agent_id": agent_id, "match_score": match_score, "confidence": confidence}
+            for cycle_id, strategy, agent_id, match_score, confidence in zip(
+                columns["cycle_id"].tolist(),
+                columns["strategy"].tolist(),
+                columns["agent_id"].tolist(),
+                columns["match_score"].tolist(),
+                columns["confidence"].tolist(),
+                strict=True,
+            )
+        ]
+        
+    def _reset_cycle_totals(self) -> None:
+        """Zero the running cycle totals"""
+        self._sat_sum = 0.0
+        self._sat_count = 0
+        self._duration_sum = 0.0
+        self._escalation_count = 0
+
     def start_run(self, run_id: str, expected_cycles: int = 0) -> str:
         """Start a new metrics collection run"""
         self.current_run_id = run_id or f"run_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         self.run_start_time = datetime.now()
         self.cycle_results = []
         self.agent_metrics = {}
-        
-        self.logger.info(
-            "Started metrics collection run",
-            extra={
-                "run_id": self.current_run_id,
-                "expected_cycles": expected_cycles,
-                "operation": "start_run"
-            }
-        )
+        self._reset_cycle_totals()
+        
+        if self.logger.is_enabled_for(_INFO):
+            self.logger.info(
+                "Started metrics collection run",
+                extra={
+                    "run_id": self.current_run_id,
+                    "expected_cycles": expected_cycles,
+                    "operation": "start_run"
+                }
+            )
         
         return self.current_run_id
     
     def record_cycle_start(self, cycle_id: str, scenario_name: str, customer_personality: str) -> CycleResult:
         """Record the start of a simulation cycle"""
+        now = datetime.now()
         cycle_result = CycleResult(
             cycle_id=cycle_id,
-            scenario_name=scenario_name,
-            customer_personality=customer_personality,
-            start_time=datetime.now(),
-            end_time=datetime.now(),  # Will be updated
-            duration_seconds=0.0
+            scenario_name=_intern(scenario_name),
+            customer_personality=_intern(customer_personality),
+            start_time=now,
+            end_time=now,  # Will be updated
+            duration_seconds=0.0,
+            start_monotonic=time.monotonic()
         )
         
         return cycle_result
     
     def record_quality_decision(self, cycle_result: CycleResult, decision_data: Dict[str, Any]):
-        """Record quality agent decision"""
+        """Record quality agent decision; stored when the cycle completes"""
         cycle_result.quality_score = decision_data.get("overall_score", 0.0)
         
-        self.quality_decisions.append({
-            "cycle_id": cycle_result.cycle_id,
-            "decision": decision_data.get("decision", "unknown"),
-            "score": cycle_result.quality_score,
-            "confidence": decision_data.get("confidence", 0.0),
-            "next_action": decision_data.get("next_action", "unknown")
-        })
+        decision = _intern(decision_data.get("decision", "unknown"))
+        cycle_result.pending_decisions.append((
+            _QUALITY_DECISION,
+            (
+                cycle_result.cycle_id,
+                decision,
+                cycle_result.quality_score,
+                decision_data.get("confidence", 0.0),
+                _intern(decision_data.get("next_action", "unknown")),
+                _QUALITY_DECISION_CODES.get(decision, QUALITY_UNKNOWN),
+            ),
+            decision != "adequate",
+        ))
         
     def record_frustration_decision(self, cycle_result: CycleResult, decision_data: Dict[str, Any]):
-        """Record frustration agent decision"""
+        """Record frustration agent decision; stored when the cycle completes"""
         cycle_result.frustration_score = decision_data.get("overall_score", 0.0)
         
-        self.frustration_decisions.append({
-            "cycle_id": cycle_result.cycle_id,
-            "score": cycle_result.frustration_score,
-            "level": decision_data.get("overall_level", "unknown"),
-            "intervention_needed": decision_data.get("intervention_needed", False),
-            "confidence": decision_data.get("confidence", 0.0)
-        })
+        intervention_needed = bool(decision_data.get("intervention_needed", False))
+        cycle_result.pending_decisions.append((
+            _FRUSTRATION_DECISION,
+            (
+                cycle_result.cycle_id,
+                cycle_result.frustration_score,
+                _intern(decision_data.get("overall_level", "unknown")),
+                intervention_needed,
+                decision_data.get("confidence", 0.0),
+            ),
+            intervention_needed,
+        ))
         
     def record_routing_decision(self, cycle_result: CycleResult, decision_data: Dict[str, Any]):
-        """Record routing agent decision"""
+        """Record routing agent decision; stored when the cycle completes"""
         cycle_result.escalated_to_human = True
-        cycle_result.routing_decision = decision_data.get("routing_strategy", "unknown")
+        cycle_result.routing_decision = _intern(decision_data.get("routing_strategy", "unknown"))
         
         if "assigned_employee" in decision_data:
             cycle_result.assigned_agent = decision_data["assigned_employee"]["id"]
         
-        self.routing_decisions.append({
-            "cycle_id": cycle_result.cycle_id,
-            "strategy": cycle_result.routing_decision,
-            "agent_id": cycle_result.assigned_agent,
-            "match_score": decision_data.get("match_score", 0.0),
-            "confidence": decision_data.get("routing_confidence", 0.0)
-        })
+        match_score = decision_data.get("match_score", 0.0)
+        cycle_result.pending_decisions.append((
+            _ROUTING_DECISION,
+            (
+                cycle_result.cycle_id,
+                cycle_result.routing_decision,
+                cycle_result.assigned_agent,
+                match_score,
+                decision_data.get("routing_confidence", 0.0),
+            ),
+            match_score < 0.7,
+        ))
         
     def record_cycle_completion(self, cycle_result: CycleResult, resolution_data: Dict[str, Any]):
         """Record completion of a simulation cycle"""
-        cycle_result.end_time = datetime.now()
-        cycle_result.duration_seconds = (cycle_result.end_time - cycle_result.start_time).total_seconds()
-        
-        # Extract resolution metrics
-        if "resolution_result" in resolution_data:
-            res_data = resolution_data["resolution_result"]
-            cycle_result.final_satisfaction = res_data.get("customer_satisfaction", 0.0)
-            cycle_result.resolution_method = res_data.get("resolution_method", "unknown")
-        
-        self.cycle_results.append(cycle_result)
-        
-        # Update agent metrics if agent was involved
-        if cycle_result.assigned_agent:
-            self._update_agent_metrics(cycle_result, resolution_data)
+        with self._lock:
+            # Store the cycle's buffered decisions under a single lock acquisition
+            for kind, row, intervention in cycle_result.pending_decisions:
+                if kind == _QUALITY_DECISION:
+                    self._quality_columns.append(*row)
+                    self._quality_intervention_count += intervention
+                elif kind == _FRUSTRATION_DECISION:
+                    self._frustration_columns.append(*row)
+                    self._frustration_intervention_count += intervention
+                else:
+                    self._routing_columns.append(*row)
+                    self._failed_route_count += intervention
+            cycle_result.pending_decisions.clear()
+        
+            if cycle_result.start_monotonic:
+                # Derive the wall-clock end from the monotonic duration instead of a second datetime.now()
+                cycle_result.duration_seconds = time.monotonic() - cycle_result.start_monotonic
+                cycle_result.end_time = cycle_result.start_time + timedelta(seconds=cycle_result.duration_seconds)
+            else:
+                cycle_result.end_time = datetime.now()
+                cycle_result.duration_seconds = (cycle_result.end_time - cycle_result.start_time).total_seconds()
+        
+            # Extract resolution metrics
+            if "resolution_result" in resolution_data:
+                res_data = resolution_data["resolution_result"]
+                cycle_result.final_satisfaction = res_data.get("customer_satisfaction", 0.0)
+                cycle_result.resolution_method = _intern(res_data.get("resolution_method", "unknown"))
+        
+            self.cycle_results.append(cycle_result)
+            if cycle_result.final_satisfaction > 0:
+                self._sat_sum += cycle_result.final_satisfaction
+                self._sat_count += 1
+            self._duration_sum += cycle_result.duration_seconds
+            self._escalation_count += cycle_result.escalated_to_human
+        
+            # Update agent metrics if agent was involved
+            if cycle_result.assigned_agent:
+                self._update_agent_metrics(cycle_result, resolution_data)
             
+            self._cycle_log_buffer.append(cycle_result)
+            if (
+                len(self._cycle_log_buffer) >= _CYCLE_LOG_BATCH_SIZE
+                or time.monotonic() - self._last_cycle_log >= _CYCLE_LOG_FLUSH_INTERVAL
+            ):
+                self._flush_cycle_log()
+
+    def _flush_cycle_log(self) -> None:
+        """Emit one debug line summarizing the buffered cycle completions"""
+        buffered = self._cycle_log_buffer
+        self._last_cycle_log = time.monotonic()
+        if not buffered:
+            return
+        self._cycle_log_buffer = []
+        if not self.logger.is_enabled_for(_DEBUG):
+            return
+
         self.logger.debug(
-            "Recorded cycle completion",
+            "Recorded cycle completions",
             extra={
-                "cycle_id": cycle_result.cycle_id,
-                "duration": cycle_result.duration_seconds,
-                "satisfaction": cycle_result.final_satisfaction,
+                "cycle_count": len(buffered),
+                "first_cycle_id": buffered[0].cycle_id,
+                "last_cycle_id": buffered[-1].cycle_id,
+                "avg_duration": sum(c.duration_seconds for c in buffered) / len(buffered),
+                "avg_satisfaction": sum(c.final_satisfaction for c in buffered) / len(buffered),
                 "operation": "record_cycle_completion"
             }
         )
@@ -228,34 +525,19 @@ class MetricsCollector:
         agent = self.agent_metrics[agent_id]
         agent.cases_handled += 1
         
-        # Update resolution time
-        if agent.cases_handled == 1:
-            agent.avg_resolution_time = cycle_result.duration_seconds
-        else:
-            agent.avg_resolution_time = (
-                (agent.avg_resolution_time * (agent.cases_handled - 1) + cycle_result.duration_seconds) 
-                / agent.cases_handled
-            )
-        
-        # Update satisfaction
-        if agent.cases_handled == 1:
-            agent.customer_satisfaction = cycle_result.final_satisfaction
-        else:
-            agent.customer_satisfaction = (
-                (agent.customer_satisfaction * (agent.cases_handled - 1) + cycle_result.final_satisfaction)
-                / agent.cases_handled
-            )
+        # Incremental means; the first case sets the mean to its own value
+        agent.avg_resolution_time += (cycle_result.duration_seconds - agent.avg_resolution_time) / agent.cases_handled
+        agent.customer_satisfaction += (cycle_result.final_satisfaction - agent.customer_satisfaction) / agent.cases_handled
         
         # Track successful resolutions
-        agent.total_resolution_attempts += 1
-        if cycle_result.final_satisfaction >= 7.0:  # Threshold for success
-            agent.successful_resolutions += 1
+        agent.successful_resolutions += cycle_result.final_satisfaction >= 7.0  # Threshold for success
     
     def finish_run(self) -> SystemMetrics:
         """Complete the metrics collection run and calculate final metrics"""
         if not self.current_run_id or not self.run_start_time:
             raise ValueError("No active run to finish")
         
+        self._flush_cycle_log()
         end_time = datetime.now()
         
         # Calculate system metrics
@@ -267,16 +549,16 @@ class MetricsCollector:
         )
         
         if self.cycle_results:
+            total_cycles = len(self.cycle_results)
+
             # Customer experience metrics
-            satisfactions = [c.final_satisfaction for c in self.cycle_results if c.final_satisfaction > 0]
-            system_metrics.avg_customer_satisfaction = sum(satisfactions) / len(satisfactions) if satisfactions else 0.0
+            system_metrics.avg_customer_satisfaction = self._sat_sum / self._sat_count if self._sat_count else 0.0
             
-            system_metrics.total_escalations = sum(1 for c in self.cycle_results if c.escalated_to_human)
-            system_metrics.escalation_rate = system_metrics.total_escalations / len(self.cycle_results)
+            system_metrics.total_escalations = self._escalation_count
+            system_metrics.escalation_rate = system_metrics.total_escalations / total_cycles
             
             # System performance metrics
-            durations = [c.duration_seconds for c in self.cycle_results]
-            system_metrics.avg_resolution_time = sum(durations) / len(durations)
+            system_metrics.avg_resolution_time = self._duration_sum / total_cycles
             
             # Agent decision accuracy
             system_metrics.quality_agent_accuracy = self._calculate_quality_accuracy()
@@ -284,68 +566,77 @@ class MetricsCollector:
             system_metrics.routing_success_rate = self._calculate_routing_success()
             
             # Count interventions
-            system_metrics.quality_interventions = len([d for d in self.quality_decisions if d["decision"] != "adequate"])
-            system_metrics.frustration_interventions = len([d for d in self.frustration_decisions if d["intervention_needed"]])
-            system_metrics.failed_routes = len([d for d in self.routing_decisions if d["match_score"] < 0.7])
-        
-        self.logger.info(
-            "Finished metrics collection run",
-            extra={
-                "run_id": self.current_run_id,
-                "total_cycles": system_metrics.total_cycles,
-                "avg_satisfaction": system_metrics.avg_customer_satisfaction,
-                "escalation_rate": system_metrics.escalation_rate,
-                "operation": "finish_run"
-            }
-        )
+            system_metrics.quality_interventions = self._quality_intervention_count
+            system_metrics.frustration_interventions = self._frustration_intervention_count
+            system_metrics.failed_routes = self._failed_route_count
+        
+        if self.logger.is_enabled_for(_INFO):
+            self.logger.info(
+                "Finished metrics collection run",
+                extra={
+                    "run_id": self.current_run_id,
+                    "total_cycles": system_metrics.total_cycles,
+                    "avg_satisfaction": system_metrics.avg_customer_satisfaction,
+                    "escalation_rate": system_metrics.escalation_rate,
+                    "operation": "finish_run"
+                }
+            )
         
         return system_metrics
     
     def _calculate_quality_accuracy(self) -> float:
         """Calculate quality agent decision accuracy"""
-        if not self.quality_decisions:
+        columns = self._quality_columns
+        if not columns.size:
             return 0.0
         
-        # Simple heuristic: good decisions have confidence > 0.7 and appropriate scores
-        good_decisions = 0
-        for decision in self.quality_decisions:
-            confidence = decision.get("confidence", 0.0)
-            score = decision.get("score", 0.0)
-            
-            # Consider it accurate if high confidence and score aligns with decision
-            if confidence > 0.7:
-                if (score >= 7.0 and decision["decision"] == "adequate") or \
-                   (score < 7.0 and decision["decision"] in ["needs_adjustment", "human_intervention"]):
-                    good_decisions += 1
+        # Simple heuristic: good decisions have confidence > 0.7 and a decision that
+        # agrees with the score (adequate at >= 7.0, otherwise an intervention)
+        scores, confidences, codes = columns["score"], columns["confidence"], columns["code"]
+        if quality_accuracy_count is not None and columns.size >= NUMBA_MIN_DECISIONS:
+            good_decisions = quality_accuracy_count(scores, confidences, codes)
+        else:
+            agrees = np.where(
+                scores >= 7.0,
+                codes == QUALITY_ADEQUATE,
+                (codes == QUALITY_NEEDS_ADJUSTMENT) | (codes == QUALITY_HUMAN_INTERVENTION),
+            )
+            good_decisions = int(np.count_nonzero((confidences > 0.7) & agrees))
         
-        return good_decisions / len(self.quality_decisions)
+        return good_decisions / columns.size
     
     def _calculate_frustration_precision(self) -> float:
         """Calculate frustration detection precision"""
-        if not self.frustration_decisions:
+        columns = self._frustration_columns
+        if not columns.size:
             return 0.0
         
-        # Precision: interventions that were likely needed
-        interventions = [d for d in self.frustration_decisions if d["intervention_needed"]]
-        if not interventions:
+        # Precision: interventions that were likely needed, i.e. high frustration scores (>6)
+        scores, interventions = columns["score"], columns["intervention"]
+        if frustration_intervention_counts is not None and columns.size >= NUMBA_MIN_DECISIONS:
+            total_interventions, correct_interventions = frustration_intervention_counts(scores, interventions)
+        else:
+            total_interventions = int(np.count_nonzero(interventions))
+            correct_interventions = int(np.count_nonzero(interventions & (scores > 6.0)))
+        if not total_interventions:
             return 1.0  # No false positives
         
-        # High frustration scores (>6) with intervention are likely correct
-        correct_interventions = len([d for d in interventions if d["score"] > 6.0])
-        return correct_interventions / len(interventions)
+        return correct_interventions / total_interventions
     
     def _calculate_routing_success(self) -> float:
         """Calculate routing decision success rate"""
-        if not self.routing_decisions:
+        columns = self._routing_columns
+        if not columns.size:
             return 0.0
         
         # Success: high match scores and confidence
-        successful = len([
-            d for d in self.routing_decisions 
-            if d["match_score"] >= 0.8 and d["confidence"] >= 0.7
-        ])
+        match_scores, confidences = columns["match_score"], columns["confidence"]
+        if routing_success_count is not None and columns.size >= NUMBA_MIN_DECISIONS:
+            successful = routing_success_count(match_scores, confidences)
+        else:
+            successful = int(np.count_nonzero((match_scores >= 0.8) & (confidences >= 0.7)))
         
-        return successful / len(self.routing_decisions)
+        return successful / columns.size
     
     def export_results(self, system_metrics: SystemMetrics, filename: Optional[str] = None) -> str:
         """Export metrics to JSON file"""
@@ -353,11 +644,12 @@ class MetricsCollector:
             filename = f"simulation_results_{system_metrics.run_id}.json"
         
         output_file = self.output_dir / filename
+        output_path = str(output_file)
         
         export_data = {
-            "system_metrics": asdict(system_metrics),
-            "agent_metrics": {aid: asdict(metrics) for aid, metrics in self.agent_metrics.items()},
-            "cycle_results": [asdict(cycle) for cycle in self.cycle_results],
+            "system_metrics": system_metrics.to_dict(),
+            "agent_metrics": {aid: metrics.to_dict() for aid, metrics in self.agent_metrics.items()},
+            "cycle_results": [cycle.to_dict() for cycle in self.cycle_results],
             "decision_details": {
                 "quality_decisions": self.quality_decisions,
                 "frustration_decisions": self.frustration_decisions,
@@ -365,102 +657,84 @@ class MetricsCollector:
             }
         }
         
-        with open(output_file, 'w') as f:
-            json.dump(export_data, f, indent=2, default=str)
-        
-        self.logger.info(
-            "Exported simulation results",
-            extra={
-                "output_file": str(output_file),
-                "total_cycles": len(self.cycle_results),
-                "operation": "export_results"
-            }
-        )
+        if orjson is not None:
+            # Mirrors json.dump's key and default handling; NaN/Inf still become null
+            output_file.write_bytes(orjson.dumps(export_data, default=str, option=_ORJSON_EXPORT_OPTIONS))
+        else:
+            with open(output_file, 'w') as f:
+                # Decision dicts are caller-supplied and may hold datetimes or enums
+                json.dump(export_data, f, indent=2, default=str)
+        
+        if self.logger.is_enabled_for(_INFO):
+            self.logger.info(
+                "Exported simulation results",
+                extra={
+                    "output_file": output_path,
+                    "total_cycles": len(self.cycle_results),
+                    "operation": "export_results"
+                }
+            )
         
-        return str(output_file)
+        return output_path
     
     def generate_summary_report(self, system_metrics: SystemMetrics) -> str:
         """Generate a human-readable summary report"""
-        report = []
-        report.append(f"# Simulation Test Results - {system_metrics.run_id}")
-        report.append(f"Run Time: {system_metrics.start_time} to {system_metrics.end_time}")
-        report.append(f"Duration: {(system_metrics.end_time - system_metrics.start_time).total_seconds():.1f} seconds")
-        report.append("")
+        buf = io.StringIO()
+        w = buf.write
+        w(f"# Simulation Test Results - {system_metrics.run_id}\n")
+        w(f"Run Time: {system_metrics.start_time} to {system_metrics.end_time}\n")
+        w(f"Duration: {(system_metrics.end_time - system_metrics.start_time).total_seconds():.1f} seconds\n")
+        w("\n")
         
         # System Performance
-        report.append("## System Performance")
-        report.append(f"- Total Cycles: {system_metrics.total_cycles}")
-        report.append(f"- Average Customer Satisfaction: {system_metrics.avg_customer_satisfaction:.2f}/10")
-        report.append(f"- Escalation Rate: {system_metrics.escalation_rate:.1%}")
-        report.append(f"- Average Resolution Time: {system_metrics.avg_resolution_time:.1f} seconds")
-        report.append("")
+        w("## System Performance\n")
+        w(f"- Total Cycles: {system_metrics.total_cycles}\n")
+        w(f"- Average Customer Satisfaction: {system_metrics.avg_customer_satisfaction:.2f}/10\n")
+        w(f"- Escalation Rate: {system_metrics.escalation_rate:.1%}\n")
+        w(f"- Average Resolution Time: {system_metrics.avg_resolution_time:.1f} seconds\n")
+        w("\n")
         
         # Agent Performance
-        report.append("## Agent Decision Quality")
-        report.append(f"- Quality Agent Accuracy: {system_metrics.quality_agent_accuracy:.1%}")
-        report.append(f"- Frustration Detection Precision: {system_metrics.frustration_detection_precision:.1%}")
-        report.append(f"- Routing Success Rate: {system_metrics.routing_success_rate:.1%}")
-        report.append("")
+        w("## Agent Decision Quality\n")
+        w(f"- Quality Agent Accuracy: {system_metrics.quality_agent_accuracy:.1%}\n")
+        w(f"- Frustration Detection Precision: {system_metrics.frustration_detection_precision:.1%}\n")
+        w(f"- Routing Success Rate: {system_metrics.routing_success_rate:.1%}\n")
+        w("\n")
         
         # Intervention Counts
-        report.append("## System Interventions")
-        report.append(f"- Quality Interventions: {system_metrics.quality_interventions}")
-        report.append(f"- Frustration Interventions: {system_metrics.frustration_interventions}")
-        report.append(f"- Failed Routes: {system_metrics.failed_routes}")
-        report.append("")
+        w("## System Interventions\n")
+        w(f"- Quality Interventions: {system_metrics.quality_interventions}\n")
+        w(f"- Frustration Interventions: {system_metrics.frustration_interventions}\n")
+        w(f"- Failed Routes: {system_metrics.failed_routes}\n")
+        w("\n")
         
         # Individual Agent Performance
         if self.agent_metrics:
-            report.append("## Individual Agent Performance")
+            w("## Individual Agent Performance\n")
             for agent_id, metrics in self.agent_metrics.items():
-                report.append(f"### {metrics.agent_name} ({agent_id})")
-                report.append(f"- Cases Handled: {metrics.cases_handled}")
-                report.append(f"- Avg Resolution Time: {metrics.avg_resolution_time:.1f} seconds")
-                report.append(f"- Customer Satisfaction: {metrics.customer_satisfaction:.2f}/10")
-                if metrics.total_resolution_attempts > 0:
-                    success_rate = metrics.successful_resolutions / metrics.total_resolution_attempts
-                    report.append(f"- Success Rate: {success_rate:.1%}")
-                report.append("")
+                w(f"### {metrics.agent_name} ({agent_id})\n")
+                w(f"- Cases Handled: {metrics.cases_handled}\n")
+                w(f"- Avg Resolution Time: {metrics.avg_resolution_time:.1f} seconds\n")
+                w(f"- Customer Satisfaction: {metrics.customer_satisfaction:.2f}/10\n")
+                if metrics.cases_handled > 0:
+                    success_rate = metrics.successful_resolutions / metrics.cases_handled
+                    w(f"- Success Rate: {success_rate:.1%}\n")
+                w("\n")
         
         # Recommendations
-        report.append("## Recommendations")
+        w("## Recommendations\n")
         recommendations = self._generate_recommendations(system_metrics)
         for rec in recommendations:
-            report.append(f"- {rec}")
+            w(f"- {rec}\n")
         
-        return "\n".join(report)
+        # No trailing newline after the last recommendation
+        return buf.getvalue().removesuffix("\n")
     
     def _generate_recommendations(self, system_metrics: SystemMetrics) -> List[str]:
         """Generate recommendations based on metrics"""
-        recommendations = []
-        
-        # Customer satisfaction
-        if system_metrics.avg_customer_satisfaction < 7.0:
-            recommendations.append("🔴 Customer satisfaction below target (7.0). Consider tuning chatbot quality or agent training.")
-        elif system_metrics.avg_customer_satisfaction > 9.0:
-            recommendations.append("🟡 Very high satisfaction - may indicate insufficient challenge in test scenarios.")
-        
-        # Escalation rate
-        if system_metrics.escalation_rate > 0.6:
-            recommendations.append("🔴 High escalation rate. Consider improving chatbot responses or quality thresholds.")
-        elif system_metrics.escalation_rate < 0.2:
-            recommendations.append("🟡 Low escalation rate - ensure quality and frustration agents are properly calibrated.")
-        
-        # Agent accuracy
-        if system_metrics.quality_agent_accuracy < 0.7:
-            recommendations.append("🔴 Quality agent accuracy low. Review quality assessment thresholds.")
-        
-        if system_metrics.frustration_detection_precision < 0.7:
-            recommendations.append("🔴 Frustration detection precision low. Review frustration indicators and thresholds.")
-        
-        if system_metrics.routing_success_rate < 0.8:
-            recommendations.append("🔴 Routing success rate low. Review agent specialization matching.")
-        
-        # System efficiency
-        if system_metrics.avg_resolution_time > 60:
-            recommendations.append("🟡 Average resolution time high. Consider optimizing agent response generation.")
+        recommendations = [message for applies, message in _RECOMMENDATION_RULES if applies(system_metrics)]
         
         if not recommendations:
             recommendations.append("✅ All metrics within acceptable ranges!")
         
-        return recommendations
\ No newline at end of file
+        return recommendations
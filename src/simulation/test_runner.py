@@ -4,13 +4,26 @@ Runs configurable simulation cycles with metrics collection for agent tuning
 """
 
 import asyncio
-import random
+import functools
+import io
+import json
+import logging
+import queue
+import threading
 import time
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 from pathlib import Path
+
+import numpy as np
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -18,7 +31,38 @@ from ..core.config import ConfigManager
 from ..core.logging import get_logger
 from ..core.context_manager import SQLiteContextProvider
 from .demo_orchestrator import DemoOrchestrator
-from .metrics_collector import MetricsCollector, SystemMetrics
+from .employee_simulator import close_thread_loops
+from .metrics_collector import CycleResult, MetricsCollector, SystemMetrics
+
+_INFO = logging.INFO
+
+# Inter-cycle delays shorter than this (seconds) are skipped
+_MIN_CYCLE_DELAY = 0.005
+
+# Cycle path keys: (frustration outcome, quality next_action)
+_FRUSTRATED_PATH = ("frustrated", None)
+_QUALITY_ESCALATION_PATH = ("ok", "escalate_to_human")
+
+# Agents reported by get_agent_settings_summary, in summary order
+_SUMMARY_AGENTS = ("chatbot_agent", "quality_agent", "frustration_agent", "routing_agent")
+
+# Per-file write buffer size for exported traces
+_TRACE_WRITE_BUFFER = 1 << 16
+
+
+@functools.cache
+def _scenario_slug(scenario_name: str) -> str:
+    """Lowercase, underscore-separated form of a scenario name for cycle ids"""
+    return scenario_name.replace(' ', '_').lower()
+
+
+@dataclass(slots=True)
+class _TraceExport:
+    """Background trace writer for one test run"""
+    trace_queue: queue.Queue
+    writer: threading.Thread
+    results: Dict[str, Any]
+    directory: Path
 
 
 class TestRunConfig:
@@ -32,7 +76,9 @@ class TestRunConfig:
         randomize_scenarios: bool = True,
         delay_between_cycles: float = 0.1,
         max_concurrent_cycles: int = 1,
-        output_dir: str = "simulation_results"
+        output_dir: str = "simulation_results",
+        write_summary_report: bool = True,
+        scenario_weights: Optional[List[float]] = None
     ):
         self.name = name
         self.cycles = cycles
@@ -41,6 +87,8 @@ class TestRunConfig:
         self.delay_between_cycles = delay_between_cycles
         self.max_concurrent_cycles = max_concurrent_cycles
         self.output_dir = output_dir
+        self.write_summary_report = write_summary_report  # False skips the text report, keeping only JSON
+        self.scenario_weights = scenario_weights  # Relative weights per scenario when randomizing; None is uniform
 
 
 class SimulationTestRunner:
@@ -62,6 +110,11 @@ class SimulationTestRunner:
         # Test configurations
         self.test_configs = self._create_default_test_configs()
         
+        # One pooled reader per concurrent cycle plus one for the runner itself
+        self.context_provider.configure_for_simulation(
+            pool_size=max(config.max_concurrent_cycles for config in self.test_configs.values()) + 1
+        )
+        
     def _create_default_test_configs(self) -> Dict[str, TestRunConfig]:
         """Create default test configurations for different phases"""
         return {
@@ -99,6 +152,11 @@ class SimulationTestRunner:
             )
         }
     
+    def close(self) -> None:
+        """Close the context provider's pooled database connections and the simulator's event loops"""
+        self.context_provider.close()
+        close_thread_loops()
+    
     def list_test_configs(self) -> Dict[str, str]:
         """List available test configurations"""
         return {
@@ -108,6 +166,14 @@ class SimulationTestRunner:
     
     def run_test_suite(self, config_name: str = "quick_validation") -> Dict[str, Any]:
         """Run a complete test suite with the specified configuration"""
+        try:
+            return asyncio.run(self._run_test_suite_async(config_name))
+        finally:
+            # The cycle worker threads have exited; close the loops they used for repository calls
+            close_thread_loops()
+    
+    async def _run_test_suite_async(self, config_name: str) -> Dict[str, Any]:
+        """Run the test suite, keeping up to max_concurrent_cycles cycles in flight"""
         if config_name not in self.test_configs:
             raise ValueError(f"Unknown test config: {config_name}. Available: {list(self.test_configs.keys())}")
         
@@ -124,73 +190,85 @@ class SimulationTestRunner:
         
         # Initialize metrics collector
         metrics_collector = MetricsCollector(config.output_dir)
-        run_id = f"{config_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        run_id = f"{config_name}_{time.strftime('%Y%m%d_%H%M%S')}"
         metrics_collector.start_run(run_id, config.cycles)
         
         # Get available scenarios
-        available_scenarios = self.orchestrator.list_available_scenarios()
-        test_scenarios = config.scenarios if config.scenarios else [s["name"] for s in available_scenarios]
+        test_scenarios = config.scenarios if config.scenarios else self.orchestrator.scenario_names
+        
+        # Traces are exported by a background writer as each cycle completes
+        trace_export = self._start_trace_export(run_id)
         
         # Run simulation cycles
         start_time = time.time()
-        completed_cycles = []
-        errors = []
-        
-        try:
-            for cycle_num in range(config.cycles):
-                cycle_start = time.time()
-                
+        completed_cycles: List[Optional[Dict[str, Any]]] = [None] * config.cycles
+        errors: List[Optional[str]] = [None] * config.cycles
+        semaphore = asyncio.Semaphore(max(1, config.max_concurrent_cycles))
+        progress_step = max(1, config.cycles // 10)
+        finished_cycles = 0
+        
+        async def _bounded_cycle(cycle_num: int, scenario_name: str) -> None:
+            nonlocal finished_cycles
+            async with semaphore:
                 try:
-                    # Select scenario
-                    if config.randomize_scenarios:
-                        scenario_name = random.choice(test_scenarios)
-                    else:
-                        scenario_name = test_scenarios[cycle_num % len(test_scenarios)]
-                    
-                    # Run simulation cycle
-                    cycle_result = self._run_single_cycle(
+                    # Cycles make blocking LLM/DB calls, so run each one in a worker thread
+                    cycle = completed_cycles[cycle_num] = await asyncio.to_thread(
+                        self._run_single_cycle,
                         cycle_num, 
                         scenario_name, 
                         metrics_collector
                     )
-                    
-                    completed_cycles.append(cycle_result)
+                    finished_cycles += 1
+                    if cycle.get("success", False) and "demo_id" in cycle:
+                        trace_export.trace_queue.put((cycle.get("cycle_id", cycle["demo_id"]), cycle["demo_id"]))
                     
                     # Progress logging
-                    if cycle_num % max(1, config.cycles // 10) == 0:
-                        progress = (cycle_num + 1) / config.cycles
+                    if (finished_cycles - 1) % progress_step == 0:
+                        progress = finished_cycles / config.cycles
                         elapsed = time.time() - start_time
                         eta = elapsed / progress - elapsed if progress > 0 else 0
                         
                         self.logger.info(
-                            f"Progress: {cycle_num + 1}/{config.cycles} cycles ({progress:.1%}), ETA: {eta:.1f}s"
+                            "Progress: %d/%d cycles (%.1f%%), ETA: %.1fs",
+                            finished_cycles, config.cycles, progress * 100, eta
                         )
                     
-                    # Delay between cycles
-                    if config.delay_between_cycles > 0:
-                        time.sleep(config.delay_between_cycles)
+                    # Delay between cycles; sub-granularity delays only cost a timer wakeup
+                    if config.delay_between_cycles >= _MIN_CYCLE_DELAY:
+                        await asyncio.sleep(config.delay_between_cycles)
                         
                 except Exception as e:
                     error_msg = f"Cycle {cycle_num} failed: {str(e)}"
-                    errors.append(error_msg)
+                    errors[cycle_num] = error_msg
                     self.logger.error(error_msg, extra={"cycle_num": cycle_num})
-                    continue
+        
+        try:
+            # Select every cycle's scenario up front
+            scenario_names = self._pick_scenarios(config, test_scenarios)
+            
+            await asyncio.gather(*(
+                _bounded_cycle(cycle_num, scenario_name)
+                for cycle_num, scenario_name in enumerate(scenario_names)
+            ))
+            completed_cycles = [cycle for cycle in completed_cycles if cycle is not None]
+            errors = [error for error in errors if error is not None]
             
             # Finish metrics collection
             system_metrics = metrics_collector.finish_run()
             
-            # Export traces if trace collection is enabled
-            traces_exported = self._export_traces(completed_cycles, run_id)
+            # Wait for the remaining trace exports
+            traces_exported = self._finish_trace_export(trace_export, len(completed_cycles))
             
             # Generate reports
             results_file = metrics_collector.export_results(system_metrics)
-            summary_report = metrics_collector.generate_summary_report(system_metrics)
-            
-            # Save summary report to file
-            summary_file = Path(config.output_dir) / f"summary_{run_id}.txt"
-            summary_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(summary_file, 'w') as f:
-                f.write(summary_report)
+            summary_report = None
+            summary_file = None
+            if config.write_summary_report:
+                summary_report = metrics_collector.generate_summary_report(system_metrics)
+                
+                # Save summary report to file; MetricsCollector already created output_dir
+                summary_file = Path(config.output_dir) / f"summary_{run_id}.txt"
+                summary_file.write_text(summary_report, encoding='utf-8')
             
             total_time = time.time() - start_time
             
@@ -216,12 +294,14 @@ class SimulationTestRunner:
                 "errors": errors,
                 "total_time": total_time,
                 "results_file": results_file,
-                "summary_file": str(summary_file),
+                "summary_file": str(summary_file) if summary_file else None,
                 "summary_report": summary_report,
                 "traces_exported": traces_exported
             }
             
         except Exception as e:
+            # Release the trace writer if the run failed before draining it
+            trace_export.trace_queue.put(None)
             self.logger.error(
                 "Test suite failed",
                 extra={
@@ -232,6 +312,23 @@ class SimulationTestRunner:
             )
             raise
     
+    def _pick_scenarios(self, config: TestRunConfig, test_scenarios: Sequence[str]) -> List[str]:
+        """Pick the scenario for every cycle in one vectorized draw (or round-robin)"""
+        if not config.randomize_scenarios:
+            return [test_scenarios[i % len(test_scenarios)] for i in range(config.cycles)]
+        
+        weights = None
+        if config.scenario_weights is not None:
+            if len(config.scenario_weights) != len(test_scenarios):
+                raise ValueError(
+                    f"scenario_weights has {len(config.scenario_weights)} entries for {len(test_scenarios)} scenarios"
+                )
+            weights = np.asarray(config.scenario_weights, dtype=np.float64)
+            weights = weights / weights.sum()
+        
+        indices = np.random.default_rng().choice(len(test_scenarios), size=config.cycles, p=weights)
+        return [test_scenarios[i] for i in indices.tolist()]
+    
     def _run_single_cycle(
         self, 
         cycle_num: int, 
@@ -240,7 +337,7 @@ class SimulationTestRunner:
     ) -> Dict[str, Any]:
         """Run a single simulation cycle following the complete workflow from simulations.txt"""
         
-        cycle_id = f"cycle_{cycle_num:04d}_{scenario_name.replace(' ', '_').lower()}"
+        cycle_id = f"cycle_{cycle_num:04d}_{_scenario_slug(scenario_name)}"
         
         # Start cycle metrics
         cycle_result = metrics_collector.record_cycle_start(
@@ -252,66 +349,50 @@ class SimulationTestRunner:
         try:
             # 1. Start demo scenario - simulated user asks a support question
             demo_result = self.orchestrator.start_demo_scenario(scenario_name)
+            demo_id = demo_result["demo_id"]
             cycle_result.customer_personality = demo_result["customer_context"]["personality"]
             
             # 2. Frustration agent evaluates the question looking for signs of too much frustration
-            frustration_result = self.orchestrator.simulate_frustration_analysis(demo_result["demo_id"])
+            frustration_result = self.orchestrator.simulate_frustration_analysis(demo_id)
             metrics_collector.record_frustration_decision(cycle_result, frustration_result["frustration_analysis"])
             
             # If frustration threshold is surpassed, send to escalation router rather than chatbot
             if frustration_result["intervention_needed"]:
-                self.logger.info(f"Cycle {cycle_id}: Escalating due to frustration threshold")
-                
-                routing_result = self.orchestrator.simulate_routing_decision(demo_result["demo_id"])
-                metrics_collector.record_routing_decision(cycle_result, routing_result["routing_decision"])
-                
-                if "assigned_employee" in routing_result["routing_decision"]:
-                    human_result = self.orchestrator.simulate_human_agent_response(demo_result["demo_id"])
-                    customer_response = self.orchestrator.simulate_customer_response_to_human(demo_result["demo_id"])
-                
-                # Complete with human resolution
-                resolution_result = self.orchestrator.simulate_resolution(demo_result["demo_id"])
+                if self.logger.is_enabled_for(_INFO):
+                    self.logger.info("Cycle %s: Escalating due to frustration threshold", cycle_id)
+                path_key = _FRUSTRATED_PATH
                 
             else:
                 # 3. Chatbot generates a reply to the query (skip automation for simulation focus)
-                self.logger.info(f"Cycle {cycle_id}: Processing via chatbot")
-                chatbot_result = self.orchestrator.simulate_chatbot_response(demo_result["demo_id"])
+                if self.logger.is_enabled_for(_INFO):
+                    self.logger.info("Cycle %s: Processing via chatbot", cycle_id)
+                self.orchestrator.simulate_chatbot_response(demo_id)
                 
                 # 4. Quality agent evaluates the reply before sending back to user
-                quality_result = self.orchestrator.simulate_quality_assessment(demo_result["demo_id"])
-                metrics_collector.record_quality_decision(cycle_result, quality_result["quality_assessment"])
+                quality_assessment = self.orchestrator.simulate_quality_assessment(demo_id)["quality_assessment"]
+                metrics_collector.record_quality_decision(cycle_result, quality_assessment)
+                path_key = ("ok", quality_assessment["next_action"])
                 
                 # If quality agent detects a problem, direct to escalation agent instead
-                if quality_result["quality_assessment"]["next_action"] == "escalate_to_human":
-                    self.logger.info(f"Cycle {cycle_id}: Escalating due to quality issues")
-                    
-                    routing_result = self.orchestrator.simulate_routing_decision(demo_result["demo_id"])
-                    metrics_collector.record_routing_decision(cycle_result, routing_result["routing_decision"])
-                    
-                    if "assigned_employee" in routing_result["routing_decision"]:
-                        human_result = self.orchestrator.simulate_human_agent_response(demo_result["demo_id"])
-                        customer_response = self.orchestrator.simulate_customer_response_to_human(demo_result["demo_id"])
-                    
-                    resolution_result = self.orchestrator.simulate_resolution(demo_result["demo_id"])
-                
-                else:
-                    # 5. Quality is adequate - continue with chatbot interaction
-                    # TODO: Implement multi-turn conversation capability here
-                    # For now, assume single interaction resolves the issue
-                    resolution_result = self.orchestrator.simulate_resolution(demo_result["demo_id"])
+                if path_key == _QUALITY_ESCALATION_PATH and self.logger.is_enabled_for(_INFO):
+                    self.logger.info("Cycle %s: Escalating due to quality issues", cycle_id)
+            
+            # 5. Escalate to a human or, when quality is adequate, resolve via the chatbot
+            handler = self._CYCLE_PATH_HANDLERS.get(path_key, SimulationTestRunner._handle_chatbot_resolution)
+            resolution_result = handler(self, demo_id, cycle_result, metrics_collector)
             
             # Record cycle completion
             metrics_collector.record_cycle_completion(cycle_result, resolution_result)
             
             return {
                 "cycle_id": cycle_id,
-                "demo_id": demo_result["demo_id"],
+                "demo_id": demo_id,
                 "scenario_name": scenario_name,
                 "success": True,
                 "final_satisfaction": cycle_result.final_satisfaction,
                 "escalated": cycle_result.escalated_to_human,
                 "duration": cycle_result.duration_seconds,
-                "resolution_method": self._determine_resolution_method(demo_result["demo_id"])
+                "resolution_method": self._determine_resolution_method(demo_id)
             }
             
         except Exception as e:
@@ -336,6 +417,35 @@ class SimulationTestRunner:
                 "duration": cycle_result.duration_seconds
             }
 
+    def _handle_escalation(
+        self, demo_id: str, cycle_result: CycleResult, metrics_collector: MetricsCollector
+    ) -> Dict[str, Any]:
+        """Route the customer to a human agent and complete with human resolution"""
+        routing_decision = self.orchestrator.simulate_routing_decision(demo_id)["routing_decision"]
+        metrics_collector.record_routing_decision(cycle_result, routing_decision)
+        
+        if "assigned_employee" in routing_decision:
+            handoff = self.orchestrator.simulate_human_agent_response(demo_id)
+            # An employee at capacity leaves the case queued rather than handled
+            if handoff["next_step"] == "customer_response_to_human":
+                self.orchestrator.simulate_customer_response_to_human(demo_id)
+        
+        return self.orchestrator.simulate_resolution(demo_id)
+    
+    def _handle_chatbot_resolution(
+        self, demo_id: str, cycle_result: CycleResult, metrics_collector: MetricsCollector
+    ) -> Dict[str, Any]:
+        """Resolve the cycle with the chatbot's reply"""
+        # TODO: Implement multi-turn conversation capability here
+        # For now, assume single interaction resolves the issue
+        return self.orchestrator.simulate_resolution(demo_id)
+    
+    # (frustration outcome, quality next_action) -> handler; other quality actions resolve via the chatbot
+    _CYCLE_PATH_HANDLERS = {
+        _FRUSTRATED_PATH: _handle_escalation,
+        _QUALITY_ESCALATION_PATH: _handle_escalation,
+    }
+    
     def _determine_resolution_method(self, demo_id: str) -> str:
         """Determine how the query was resolved based on demo state"""
         demo = self.orchestrator.active_demonstrations.get(demo_id, {})
@@ -360,19 +470,18 @@ class SimulationTestRunner:
         )
         
         for config_name in config_names:
-            self.logger.info(f"Running test configuration: {config_name}")
+            self.logger.info("Running test configuration: %s", config_name)
             results[config_name] = self.run_test_suite(config_name)
         
         # Generate comparison report
         comparison_report = self._generate_comparison_report(results)
         
         # Save comparison report
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        timestamp = time.strftime('%Y%m%d_%H%M%S')
         comparison_file = Path("simulation_results") / f"comparison_{timestamp}.txt"
         comparison_file.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(comparison_file, 'w') as f:
-            f.write(comparison_report)
+        comparison_file.write_text(comparison_report, encoding='utf-8')
         
         return {
             "results": results,
@@ -382,64 +491,69 @@ class SimulationTestRunner:
     
     def _generate_comparison_report(self, results: Dict[str, Any]) -> str:
         """Generate a comparison report across multiple test runs"""
-        report = []
-        report.append("# Comparative Test Results")
-        report.append(f"Generated: {datetime.now()}")
-        report.append("")
+        # (config name, system metrics) pairs, extracted once for the table and recommendation
+        rows = [(config_name, result["system_metrics"]) for config_name, result in results.items()]
         
-        # Summary table
-        report.append("## Summary Comparison")
-        report.append("| Config | Cycles | Satisfaction | Escalation Rate | Quality Accuracy | Avg Resolution Time |")
-        report.append("|--------|--------|--------------|-----------------|------------------|---------------------|")
+        buf = io.StringIO()
+        w = buf.write
+        w("# Comparative Test Results\n")
+        w(f"Generated: {datetime.now()}\n")
+        w("\n")
         
-        for config_name, result in results.items():
-            metrics = result["system_metrics"]
-            report.append(
-                f"| {config_name} | {metrics.total_cycles} | "
-                f"{metrics.avg_customer_satisfaction:.2f} | "
-                f"{metrics.escalation_rate:.1%} | "
-                f"{metrics.quality_agent_accuracy:.1%} | "
-                f"{metrics.avg_resolution_time:.1f}s |"
-            )
-        
-        report.append("")
+        # Summary table
+        w("## Summary Comparison\n")
+        w("| Config | Cycles | Satisfaction | Escalation Rate | Quality Accuracy | Avg Resolution Time |\n")
+        w("|--------|--------|--------------|-----------------|------------------|---------------------|\n")
+        w("".join(
+            f"| {config_name} | {metrics.total_cycles} | "
+            f"{metrics.avg_customer_satisfaction:.2f} | "
+            f"{metrics.escalation_rate:.1%} | "
+            f"{metrics.quality_agent_accuracy:.1%} | "
+            f"{metrics.avg_resolution_time:.1f}s |\n"
+            for config_name, metrics in rows
+        ))
+        w("\n")
         
         # Detailed analysis
-        report.append("## Detailed Analysis")
+        w("## Detailed Analysis\n")
         
         for config_name, result in results.items():
-            report.append(f"### {config_name}")
-            report.append(f"- Run ID: {result['run_id']}")
-            report.append(f"- Completed: {result['completed_cycles']}/{result['total_cycles']} cycles")
-            report.append(f"- Total Time: {result['total_time']:.1f} seconds")
-            report.append(f"- Errors: {len(result['errors'])}")
+            errors = result['errors']
+            w(f"### {config_name}\n")
+            w(f"- Run ID: {result['run_id']}\n")
+            w(f"- Completed: {result['completed_cycles']}/{result['total_cycles']} cycles\n")
+            w(f"- Total Time: {result['total_time']:.1f} seconds\n")
+            w(f"- Errors: {len(errors)}\n")
             
-            if result['errors']:
-                report.append("- Error Details:")
-                for error in result['errors'][:5]:  # Show first 5 errors
-                    report.append(f"  - {error}")
-                if len(result['errors']) > 5:
-                    report.append(f"  - ... and {len(result['errors']) - 5} more")
+            if errors:
+                w("- Error Details:\n")
+                for error in errors[:5]:  # Show first 5 errors
+                    w(f"  - {error}\n")
+                if len(errors) > 5:
+                    w(f"  - ... and {len(errors) - 5} more\n")
             
-            report.append("")
+            w("\n")
         
         # Recommendations
-        report.append("## Recommendations")
-        best_config = max(results.items(), key=lambda x: x[1]["system_metrics"].avg_customer_satisfaction)
-        report.append(f"- Best performing configuration: **{best_config[0]}**")
-        report.append(f"  - Customer Satisfaction: {best_config[1]['system_metrics'].avg_customer_satisfaction:.2f}/10")
-        report.append(f"  - Escalation Rate: {best_config[1]['system_metrics'].escalation_rate:.1%}")
+        w("## Recommendations\n")
+        best_name, best_metrics = max(rows, key=lambda row: row[1].avg_customer_satisfaction)
+        w(f"- Best performing configuration: **{best_name}**\n")
+        w(f"  - Customer Satisfaction: {best_metrics.avg_customer_satisfaction:.2f}/10\n")
+        w(f"  - Escalation Rate: {best_metrics.escalation_rate:.1%}")
         
-        return "\n".join(report)
+        return buf.getvalue()
     
     def get_agent_settings_summary(self) -> Dict[str, Any]:
         """Get current agent settings for reference"""
         try:
-            # Get current agent configurations
-            chatbot_config = self.config_manager.get_agent_config("chatbot_agent")
-            quality_config = self.config_manager.get_agent_config("quality_agent") 
-            frustration_config = self.config_manager.get_agent_config("frustration_agent")
-            routing_config = self.config_manager.get_agent_config("routing_agent")
+            # Get current agent configurations in one pass over the summarized agents
+            get_agent_config = self.config_manager.get_agent_config
+            chatbot_config, quality_config, frustration_config, routing_config = (
+                get_agent_config(agent_name) for agent_name in _SUMMARY_AGENTS
+            )
+            quality_settings = quality_config.settings
+            frustration_settings = frustration_config.settings
+            routing_settings = routing_config.settings
             
             return {
                 "chatbot_agent": {
@@ -447,29 +561,66 @@ class SimulationTestRunner:
                     "prompts_available": bool(hasattr(chatbot_config, 'prompts'))
                 },
                 "quality_agent": {
-                    "settings": quality_config.settings,
-                    "thresholds": quality_config.settings.get("thresholds", {})
+                    "settings": quality_settings,
+                    "thresholds": quality_settings.get("thresholds", {})
                 },
                 "frustration_agent": {
-                    "settings": frustration_config.settings,
-                    "thresholds": frustration_config.settings.get("thresholds", {})
+                    "settings": frustration_settings,
+                    "thresholds": frustration_settings.get("thresholds", {})
                 },
                 "routing_agent": {
-                    "settings": routing_config.settings,
-                    "strategies": routing_config.settings.get("routing_strategies", {})
+                    "settings": routing_settings,
+                    "strategies": routing_settings.get("routing_strategies", {})
                 }
             }
             
         except Exception as e:
-            self.logger.warning(f"Could not get agent settings: {e}")
+            self.logger.warning("Could not get agent settings: %s", e)
             return {"error": str(e)}
     
-    def _export_traces(self, completed_cycles: list, run_id: str) -> dict:
-        """Export traces from completed simulation cycles"""
+    def _export_one_trace(self, cycle_id: str, demo_id: str, run_traces_dir: Path) -> Tuple[List[str], bool]:
+        """Export the detailed JSON and CSV timeline traces for one cycle"""
+        exported_files = []
+        try:
+            # Export detailed JSON trace
+            trace_json = self.orchestrator.export_demo_trace(
+                demo_id=demo_id,
+                format="detailed_json"
+            )
+            
+            if "error" in trace_json:
+                self.logger.warning("Failed to export trace for %s: %s", demo_id, trace_json)
+                return exported_files, False
+            
+            json_file = run_traces_dir / f"{cycle_id}_detailed.json"
+            with open(json_file, 'w', encoding='utf-8', buffering=_TRACE_WRITE_BUFFER) as f:
+                f.write(trace_json)
+            exported_files.append(str(json_file))
+            
+            # Also export CSV timeline
+            trace_csv = self.orchestrator.export_demo_trace(
+                demo_id=demo_id,
+                format="csv_timeline"
+            )
+            
+            if "error" not in trace_csv:
+                csv_file = run_traces_dir / f"{cycle_id}_timeline.csv"
+                with open(csv_file, 'w', encoding='utf-8', buffering=_TRACE_WRITE_BUFFER) as f:
+                    f.write(trace_csv)
+                exported_files.append(str(csv_file))
+            
+            return exported_files, True
+            
+        except Exception as e:
+            self.logger.error("Error exporting trace for cycle %s: %s", cycle_id, e)
+            return exported_files, False
+    
+    def _start_trace_export(self, run_id: str) -> _TraceExport:
+        """Start the background writer that exports cycle traces while cycles run"""
         from ..interfaces.core.trace import OutputFormat
         
         trace_results = {
-            "total_cycles": len(completed_cycles),
+            "total_cycles": 0,
             "traces_exported": 0,
             "traces_failed": 0,
             "export_directory": "test_traces",
@@ -484,58 +635,49 @@ class SimulationTestRunner:
         run_traces_dir = traces_dir / run_id
         run_traces_dir.mkdir(exist_ok=True)
         
-        for cycle in completed_cycles:
-            if not cycle.get("success", False) or "demo_id" not in cycle:
-                continue
-                
-            demo_id = cycle["demo_id"]
-            cycle_id = cycle.get("cycle_id", demo_id)
-            
-            try:
-                # Export detailed JSON trace
-                trace_json = self.orchestrator.export_demo_trace(
-                    demo_id=demo_id,
-                    format="detailed_json"
-                )
-                
-                if "error" not in trace_json:
-                    json_file = run_traces_dir / f"{cycle_id}_detailed.json"
-                    with open(json_file, 'w', encoding='utf-8') as f:
-                        f.write(trace_json)
-                    trace_results["exported_files"].append(str(json_file))
-                    
-                    # Also export CSV timeline
-                    trace_csv = self.orchestrator.export_demo_trace(
-                        demo_id=demo_id,
-                        format="csv_timeline"
-                    )
-                    
-                    if "error" not in trace_csv:
-                        csv_file = run_traces_dir / f"{cycle_id}_timeline.csv"
-                        with open(csv_file, 'w', encoding='utf-8') as f:
-                            f.write(trace_csv)
-                        trace_results["exported_files"].append(str(csv_file))
-                    
-                    trace_results["traces_exported"] += 1
-                    
-                else:
-                    self.logger.warning(f"Failed to export trace for {demo_id}: {trace_json}")
-                    trace_results["traces_failed"] += 1
-                    
-            except Exception as e:
-                self.logger.error(f"Error exporting trace for cycle {cycle_id}: {e}")
+        trace_queue: queue.Queue = queue.Queue()
+        writer = threading.Thread(
+            target=self._trace_writer_worker,
+            args=(trace_queue, run_traces_dir, trace_results),
+            name=f"trace-writer-{run_id}",
+            daemon=True
+        )
+        writer.start()
+        return _TraceExport(trace_queue, writer, trace_results, run_traces_dir)
+    
+    def _trace_writer_worker(self, trace_queue: queue.Queue, run_traces_dir: Path, trace_results: dict) -> None:
+        """Export queued (cycle_id, demo_id) traces until the None sentinel arrives"""
+        while (item := trace_queue.get()) is not None:
+            exported_files, success = self._export_one_trace(*item, run_traces_dir)
+            trace_results["exported_files"].extend(exported_files)
+            if success:
+                trace_results["traces_exported"] += 1
+            else:
                 trace_results["traces_failed"] += 1
+    
+    def _finish_trace_export(self, trace_export: _TraceExport, total_cycles: int) -> dict:
+        """Drain the trace writer and write the export summary"""
+        trace_export.trace_queue.put(None)
+        trace_export.writer.join()
+        
+        trace_results = trace_export.results
+        run_traces_dir = trace_export.directory
+        trace_results["total_cycles"] = total_cycles
         
         # Create summary file
         if trace_results["traces_exported"] > 0:
             summary_file = run_traces_dir / "trace_export_summary.json"
-            with open(summary_file, 'w', encoding='utf-8') as f:
-                import json
-                json.dump(trace_results, f, indent=2)
+            if orjson is not None:
+                summary_file.write_bytes(orjson.dumps(trace_results, option=orjson.OPT_INDENT_2))
+            else:
+                with open(summary_file, 'w', encoding='utf-8') as f:
+                    json.dump(trace_results, f, indent=2)
             trace_results["summary_file"] = str(summary_file)
             
             self.logger.info(
-                f"Exported {trace_results['traces_exported']} traces to {run_traces_dir}",
+                "Exported %d traces to %s",
+                trace_results["traces_exported"],
+                run_traces_dir,
                 extra={
                     "traces_exported": trace_results["traces_exported"],
                     "traces_failed": trace_results["traces_failed"],
@@ -563,28 +705,31 @@ def main():
     
     runner = SimulationTestRunner()
     
-    if args.list_configs:
-        print("Available test configurations:")
-        for name, desc in runner.list_test_configs().items():
-            print(f"  {name}: {desc}")
-        return
-    
-    if args.compare:
-        print(f"Running comparative test with configs: {args.compare}")
-        results = runner.run_comparative_test(args.compare)
-        print(f"Comparison report saved to: {results['comparison_file']}")
-        print("\nComparison Summary:")
-        print(results['comparison_report'])
-    else:
-        print(f"Running test configuration: {args.config}")
-        result = runner.run_test_suite(args.config)
-        print(f"Test completed! Results saved to: {result['results_file']}")
-        print(f"Summary report: {result['summary_file']}")
-        print("\nQuick Summary:")
-        print(f"- Cycles: {result['completed_cycles']}/{result['total_cycles']}")
-        print(f"- Customer Satisfaction: {result['system_metrics'].avg_customer_satisfaction:.2f}/10")
-        print(f"- Escalation Rate: {result['system_metrics'].escalation_rate:.1%}")
-        print(f"- Total Time: {result['total_time']:.1f} seconds")
+    try:
+        if args.list_configs:
+            print("Available test configurations:")
+            for name, desc in runner.list_test_configs().items():
+                print(f"  {name}: {desc}")
+            return
+        
+        if args.compare:
+            print(f"Running comparative test with configs: {args.compare}")
+            results = runner.run_comparative_test(args.compare)
+            print(f"Comparison report saved to: {results['comparison_file']}")
+            print("\nComparison Summary:")
+            print(results['comparison_report'])
+        else:
+            print(f"Running test configuration: {args.config}")
+            result = runner.run_test_suite(args.config)
+            print(f"Test completed! Results saved to: {result['results_file']}")
+            print(f"Summary report: {result['summary_file']}")
+            print("\nQuick Summary:")
+            print(f"- Cycles: {result['completed_cycles']}/{result['total_cycles']}")
+            print(f"- Customer Satisfaction: {result['system_metrics'].avg_customer_satisfaction:.2f}/10")
+            print(f"- Escalation Rate: {result['system_metrics'].escalation_rate:.1%}")
+            print(f"- Total Time: {result['total_time']:.1f} seconds")
+    finally:
+        runner.close()
 
 
 if __name__ == "__main__":
@@ -6,6 +6,6 @@ This package contains complete workflows that combine multiple nodes:
 - Evaluation Workflow: Offline evaluation and testing
 """
 
-from .hybrid_workflow import HybridSystemWorkflow
+from .hybrid_workflow import HybridSystemWorkflow, get_workflow
 
-__all__ = ["HybridSystemWorkflow"]
+__all__ = ["HybridSystemWorkflow", "get_workflow"]
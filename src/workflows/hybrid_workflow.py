@@ -2,9 +2,23 @@
 Main workflow orchestration combining all nodes
 """
 
+import asyncio
+import copy
+import hashlib
+import itertools
+import operator
+import os
+import threading
+import time
 import uuid
+import weakref
+from collections import OrderedDict
 from datetime import datetime
-from typing import Any
+from functools import lru_cache, partial
+from typing import Annotated, Any, NotRequired
+
+from langchain_core.runnables import RunnableLambda
+from langgraph.graph import END, StateGraph
 
 from ..core.config import ConfigManager
 from ..core.context_manager import SQLiteContextProvider
@@ -15,11 +29,120 @@ from ..nodes.evaluator_agent import EvaluatorAgentNode
 from ..nodes.mock_automation_agent import MockAutomationAgent
 
 
+# Query ids are a per-process random prefix plus a counter, so minting one
+# needs no urandom read; forked workers draw a fresh prefix
+_query_id_base = uuid.uuid4().hex[:16]
+_query_id_counter = itertools.count()
+
+
+def _reset_query_ids() -> None:
+    global _query_id_base, _query_id_counter
+    _query_id_base = uuid.uuid4().hex[:16]
+    _query_id_counter = itertools.count()
+
+
+os.register_at_fork(after_in_child=_reset_query_ids)
+
+
+def _next_query_id() -> str:
+    """Return a process-unique query id"""
+    return f"{_query_id_base}-{next(_query_id_counter)}"
+
+
+class WorkflowState(HybridSystemState):
+    """Graph state: HybridSystemState plus the keys nodes hand to each other
+
+    LangGraph only carries keys declared on the state schema, so the routing
+    agent's inputs and outputs are declared here.
+    """
+
+    escalation_reason: NotRequired[str]
+    frustration_analysis: NotRequired[dict[str, Any]]
+    quality_assessment: NotRequired[dict[str, Any]]
+    enriched_context: NotRequired[dict[str, Any]]
+    routing_requirements: NotRequired[dict[str, Any]]
+    routing_decision: NotRequired[dict[str, Any]]
+    assigned_human_agent: NotRequired[dict[str, Any]]
+
+    # Canonical escalation outcome, set once after evaluation; OR-merged so a
+    # concurrent writer can never clear it
+    escalate: NotRequired[Annotated[bool, operator.or_]]
+
+
+def _automation_resolved(state: WorkflowState) -> bool:
+    """Whether automation produced a response that needs no escalation"""
+    return bool(state.get("automation_response")) and not state.get("requires_escalation", False)
+
+
+def _normalize_escalation(state: WorkflowState) -> WorkflowState:
+    """Collapse the automation and evaluator escalation flags into escalate"""
+    state["escalate"] = bool(state.get("escalation_decision", False) or state.get("requires_escalation", False))
+    return state
+
+
+# Next node after automation, indexed by
+# (chatbot already answered << 2) | (automation answered << 1) | escalation flagged
+_AFTER_AUTOMATION = (
+    "answer", "answer", "automation_response", "answer",
+    # A speculative chatbot run has already answered
+    "evaluator", "evaluator", "automation_response", "evaluator",
+)
+
+# Next node after evaluation, indexed by (escalation needed << 1) | already routed
+_AFTER_EVALUATION = (
+    "ai_response", "ai_response",
+    # A speculative routing run has already assigned a human
+    "human_routing", "end",
+)
+
+
+def _after_automation(state: WorkflowState) -> str:
+    """Deliver an automated response, or continue to the chatbot"""
+    route = (
+        ("ai_response" in state) << 2
+        | bool(state.get("automation_response")) << 1
+        | bool(state.get("requires_escalation", False))
+    )
+    return _AFTER_AUTOMATION[route]
+
+
+def _after_evaluation(state: WorkflowState) -> str:
+    """Escalate to a human, or deliver the AI response"""
+    return _AFTER_EVALUATION[state["escalate"] << 1 | ("routing_decision" in state)]
+
+
+async def _ainvoke(node, state: HybridSystemState) -> HybridSystemState:
+    """Await a node's native ainvoke when it has one, else run it in a worker thread"""
+    ainvoke = getattr(node, "ainvoke", None)
+    if ainvoke is not None:
+        return await ainvoke(state)
+    return await asyncio.to_thread(node, state)
+
+
+def _merge_updates(snapshot: HybridSystemState, *results: HybridSystemState) -> HybridSystemState:
+    """Apply what each concurrent node changed relative to snapshot, in argument order"""
+    merged = dict(snapshot)
+    for result in results:
+        merged.update(
+            (key, value) for key, value in result.items()
+            if key not in snapshot or snapshot[key] is not value
+        )
+    return merged
+
+
 class HybridSystemWorkflow:
     """Complete hybrid AI system workflow using LangGraph"""
 
     def __init__(
-        self, config_dir: str = "config", context_db: str = "hybrid_system.db"
+        self,
+        config_dir: str = "config",
+        context_db: str = "hybrid_system.db",
+        max_concurrent_queries: int = 8,
+        speculative_routing: bool = False,
+        speculative_chatbot: bool = False,
+        checkpointer=None,
+        response_cache_size: int = 0,
+        response_cache_ttl: float = 3600.0,
     ):
         # Initialize providers
         self.config_provider = ConfigManager(config_dir)
@@ -33,75 +156,156 @@ class HybridSystemWorkflow:
         )
         self.human_routing_agent = HumanRoutingAgentNode(self.config_provider, self.context_provider)
 
+        # Bound on queries in flight through aprocess_query, per event loop;
+        # keyed by loop so threads sharing this workflow each get their own
+        self.max_concurrent_queries = max_concurrent_queries
+        self._query_semaphores: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Semaphore
+        ] = weakref.WeakKeyDictionary()
+
+        # Route in parallel with evaluation when escalation is already certain.
+        # Routing assigns a human agent, so it is opt-in.
+        self.speculative_routing = speculative_routing
+
+        # Start the chatbot alongside automation and drop its answer when
+        # automation resolves the query; costs an LLM call per automated query
+        self.speculative_chatbot = speculative_chatbot
+
+        # Optional LangGraph checkpointer (e.g. SqliteSaver) so interrupted
+        # queries can be resumed by query id
+        self.checkpointer = checkpointer
+
+        # Opt-in LRU cache of non-escalated results keyed by normalized query
+        # text. Hits skip every node and are shared across users, so only
+        # enable it where answers do not depend on the user's context.
+        self.response_cache_size = response_cache_size
+        self.response_cache_ttl = response_cache_ttl
+        self._response_cache: OrderedDict[bytes, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._response_cache_lock = threading.Lock()
+
         # Build workflow
         self.workflow = self._build_workflow()
 
     def _build_workflow(self):
-        """Build the complete workflow (simplified for now)"""
-        # This would use LangGraph StateGraph in a real implementation
-        # For now, we'll use a simple sequential workflow
-        return self._sequential_workflow
-
-    def _sequential_workflow(self, state: HybridSystemState) -> HybridSystemState:
-        """Sequential workflow implementation with automation-first approach"""
-
-        # Step 1: Try automation first
-        state = self.automation_agent(state)
-
-        # Step 2: Check if automation handled the request
-        if state.get("automation_response") and not state.get("requires_escalation", False):
-            # Automation succeeded - use automated response
-            state = self._automation_response_handler(state)
-        else:
-            # Step 3: Fall back to AI chatbot for complex queries
-            state = self.answer_agent(state)
-
-            # Step 4: Evaluate response
-            state = self.evaluator_agent(state)
-
-            # Step 5: Route escalation if needed
-            if state.get("escalation_decision", False) or state.get("requires_escalation", False):
-                state = self.human_routing_agent(state)
-            else:
-                # Step 6: Handle final AI response
-                state = self._ai_response_handler(state)
-
-        return state
-
-    def _automation_response_handler(self, state: HybridSystemState) -> HybridSystemState:
-        """Handle successful automation response delivery"""
-        automation_response = state.get("automation_response", "")
-        automation_metadata = state.get("automation_metadata", {})
+        """Build the complete workflow as a compiled LangGraph StateGraph
+
+        Every node has a sync implementation for invoke() and an async one for
+        ainvoke(); the async ones await nodes through _ainvoke and apply the
+        optional speculative steps.
+        """
+        automate = self.automation_agent
+        answer = self.answer_agent
+        evaluate = self.evaluator_agent
+        route = self.human_routing_agent
+        speculative_routing = self.speculative_routing
+        speculative_chatbot = self.speculative_chatbot
+
+        async def aautomation(state: WorkflowState) -> WorkflowState:
+            if not speculative_chatbot:
+                return await _ainvoke(automate, state)
+
+            # Answer from the same snapshot while automation runs; the answer is
+            # dropped if automation resolves the query
+            answer_task = asyncio.create_task(_ainvoke(answer, state.copy()))
+            try:
+                automated = await _ainvoke(automate, state.copy())
+            except BaseException:
+                answer_task.cancel()
+                raise
+
+            if _automation_resolved(automated):
+                answer_task.cancel()
+                return automated
+            return _merge_updates(state, automated, await answer_task)
+
+        def evaluation(state: WorkflowState) -> WorkflowState:
+            return _normalize_escalation(evaluate(state))
 
+        async def aevaluation(state: WorkflowState) -> WorkflowState:
+            if not (speculative_routing and state.get("requires_escalation", False)):
+                return _normalize_escalation(await _ainvoke(evaluate, state))
+
+            # requires_escalation is ORed into escalate, so the query escalates
+            # whatever the evaluator decides: route while the evaluator runs,
+            # each on its own snapshot, and merge the updates in order
+            evaluated, routed = await asyncio.gather(
+                _ainvoke(evaluate, state.copy()), _ainvoke(route, state.copy())
+            )
+            return _merge_updates(state, _normalize_escalation(evaluated), routed)
+
+        graph = StateGraph(WorkflowState)
+        graph.add_node("automation", RunnableLambda(automate, afunc=aautomation, name="automation"))
+        graph.add_node("answer", RunnableLambda(answer, afunc=partial(_ainvoke, answer), name="answer"))
+        graph.add_node("evaluator", RunnableLambda(evaluation, afunc=aevaluation, name="evaluator"))
+        graph.add_node("human_routing", RunnableLambda(route, afunc=partial(_ainvoke, route), name="human_routing"))
+        graph.add_node("automation_response", self._automation_response_handler)
+        graph.add_node("ai_response", self._ai_response_handler)
+
+        graph.set_entry_point("automation")
+        graph.add_conditional_edges(
+            "automation",
+            _after_automation,
+            {"automation_response": "automation_response", "answer": "answer", "evaluator": "evaluator"},
+        )
+        graph.add_edge("answer", "evaluator")
+        graph.add_conditional_edges(
+            "evaluator",
+            _after_evaluation,
+            {"human_routing": "human_routing", "ai_response": "ai_response", "end": END},
+        )
+        graph.add_edge("automation_response", END)
+        graph.add_edge("ai_response", END)
+        graph.add_edge("human_routing", END)
+
+        return graph.compile(checkpointer=self.checkpointer)
+
+    def close(self) -> None:
+        """Close the context provider's pooled database connections"""
+        self.context_provider.close()
+
+    def _run_config(self, state: WorkflowState) -> dict[str, Any] | None:
+        """Per-query graph config; checkpointed runs are keyed by query id"""
+        if self.checkpointer is None:
+            return None
+        return {"configurable": {"thread_id": state["query_id"]}}
+
+    def _query_slots(self) -> asyncio.Semaphore:
+        """Semaphore bounding in-flight async queries on the running event loop"""
+        loop = asyncio.get_running_loop()
+        semaphore = self._query_semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._query_semaphores.setdefault(
+                loop, asyncio.Semaphore(max(1, self.max_concurrent_queries))
+            )
+        return semaphore
+
+    def _automation_response_handler(self, state: HybridSystemState) -> dict[str, Any]:
+        """Handle successful automation response delivery"""
+        # Return only the changed keys; the graph merges them into its state
         return {
-            **state,
-            "final_response": automation_response,
+            "final_response": state.get("automation_response", ""),
             "response_source": "automation",
-            "automation_metadata": automation_metadata,
+            "automation_metadata": state.get("automation_metadata", {}),
             "workflow_complete": True,
         }
 
-    def _ai_response_handler(self, state: HybridSystemState) -> HybridSystemState:
+    def _ai_response_handler(self, state: HybridSystemState) -> dict[str, Any]:
         """Handle final AI response delivery"""
-
         return {
-            **state,
             "final_response": state.get("ai_response", "No response generated"),
             "response_source": "ai_chatbot",
             "workflow_complete": True,
         }
 
-    def process_query(
-        self, query: str, user_id: str, session_id: str | None = None
-    ) -> dict[str, Any]:
-        """Process a complete query through the hybrid system"""
-
+    def _initial_state(
+        self, query: str, user_id: str, session_id: str | None
+    ) -> HybridSystemState:
+        """Create the initial workflow state for a query"""
         if session_id is None:
-            session_id = f"session_{user_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            session_id = f"session_{user_id}_{time.time_ns()}"
 
-        # Create initial state
-        initial_state = HybridSystemState(
-            query_id=str(uuid.uuid4()),
+        return HybridSystemState(
+            query_id=_next_query_id(),
             user_id=user_id,
             session_id=session_id,
             query=query,
@@ -109,12 +313,11 @@ class HybridSystemWorkflow:
             messages=[],
         )
 
-        # Execute workflow
-        result = self.workflow(initial_state)
-
+    def _query_result(self, result: HybridSystemState) -> dict[str, Any]:
+        """Summarize a finished workflow state for callers"""
         return {
             "query_id": result["query_id"],
-            "escalated": result.get("escalation_decision", False) or result.get("requires_escalation", False),
+            "escalated": result.get("escalate", False),
             "final_response": result.get("final_response"),
             "response_source": result.get("response_source", "unknown"),
             "automation_metadata": result.get("automation_metadata"),
@@ -122,3 +325,94 @@ class HybridSystemWorkflow:
             "escalation_data": result.get("escalation_data"),
             "workflow_complete": result.get("workflow_complete", False),
         }
+
+    def _cached_response(self, query: str) -> tuple[bytes | None, dict[str, Any] | None]:
+        """Return (cache key, cached result) for a query; both None when caching is off"""
+        if self.response_cache_size <= 0:
+            return None, None
+
+        key = hashlib.blake2b(" ".join(query.lower().split()).encode(), digest_size=16).digest()
+        with self._response_cache_lock:
+            entry = self._response_cache.get(key)
+            if entry is None:
+                return key, None
+            stored_at, result = entry
+            if time.monotonic() - stored_at > self.response_cache_ttl:
+                del self._response_cache[key]
+                return key, None
+            self._response_cache.move_to_end(key)
+
+        cached = copy.deepcopy(result)
+        cached["query_id"] = _next_query_id()
+        return key, cached
+
+    def _cache_response(self, key: bytes | None, result: dict[str, Any]) -> None:
+        """Remember a completed, non-escalated result under its query key
+
+        A private copy is stored so callers mutating the result they were
+        returned cannot change what later hits see.
+        """
+        if key is None or result["escalated"] or not result["workflow_complete"]:
+            return
+        snapshot = copy.deepcopy(result)
+        with self._response_cache_lock:
+            self._response_cache[key] = (time.monotonic(), snapshot)
+            self._response_cache.move_to_end(key)
+            if len(self._response_cache) > self.response_cache_size:
+                self._response_cache.popitem(last=False)
+
+    def process_query(
+        self, query: str, user_id: str, session_id: str | None = None
+    ) -> dict[str, Any]:
+        """Process a complete query through the hybrid system"""
+        cache_key, cached = self._cached_response(query)
+        if cached is not None:
+            return cached
+
+        initial_state = self._initial_state(query, user_id, session_id)
+        result = self._query_result(
+            self.workflow.invoke(initial_state, config=self._run_config(initial_state))
+        )
+        self._cache_response(cache_key, result)
+        return result
+
+    async def aprocess_query(
+        self, query: str, user_id: str, session_id: str | None = None
+    ) -> dict[str, Any]:
+        """Process a query without blocking the event loop
+
+        At most max_concurrent_queries queries run the workflow at once; the
+        rest wait their turn.
+        """
+        cache_key, cached = self._cached_response(query)
+        if cached is not None:
+            return cached
+
+        initial_state = self._initial_state(query, user_id, session_id)
+        async with self._query_slots():
+            final_state = await self.workflow.ainvoke(initial_state, config=self._run_config(initial_state))
+        result = self._query_result(final_state)
+        self._cache_response(cache_key, result)
+        return result
+
+    async def aprocess_queries(
+        self, items: list[tuple[str, str, str | None]]
+    ) -> list[dict[str, Any]]:
+        """Process (query, user_id, session_id) items concurrently, in input order
+
+        Concurrency is bounded by the same per-loop limit as aprocess_query.
+        """
+        return await asyncio.gather(
+            *(self.aprocess_query(query, user_id, session_id) for query, user_id, session_id in items)
+        )
+
+
+@lru_cache(maxsize=8)
+def get_workflow(config_dir: str = "config", context_db: str = "hybrid_system.db") -> HybridSystemWorkflow:
+    """Return the process-wide workflow for this configuration
+
+    Building a workflow parses configuration, opens the context database and
+    compiles the graph; the compiled graph holds no per-query state, so one
+    instance is shared by every caller (and thread) using the same arguments.
+    """
+    return HybridSystemWorkflow(config_dir, context_db)
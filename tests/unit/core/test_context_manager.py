@@ -0,0 +1,101 @@
+"""
+Tests for the SQLite context provider's pooled connections.
+"""
+
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import pytest
+
+from src.core.context_manager import SQLiteContextProvider
+from src.interfaces.core.context import ContextEntry
+
+
+def make_entry(index: int, entry_type: str = "query") -> ContextEntry:
+    return ContextEntry(
+        entry_id=f"entry_{index}",
+        user_id="user_1",
+        session_id="session_1",
+        timestamp=datetime.now(),
+        entry_type=entry_type,
+        content=f"content {index}",
+        metadata={"index": index},
+    )
+
+
+class TestSQLiteContextProvider:
+    """Test reads, writes and connection lifecycle"""
+
+    @pytest.fixture
+    def provider(self, tmp_path):
+        with SQLiteContextProvider(str(tmp_path / "context.db")) as provider:
+            yield provider
+
+    def test_save_and_read_back(self, provider):
+        """Saved entries are visible to pooled readers"""
+        assert provider.save_context_entry(make_entry(1))
+        assert provider.save_context_entry(make_entry(2, "escalation"))
+
+        entries = provider.get_context(user_id="user_1", session_id="session_1")
+        summary = provider.get_context_summary("user_1", "session_1")
+
+        assert {entry.entry_id for entry in entries} == {"entry_1", "entry_2"}
+        assert entries[0].metadata["index"] in (1, 2)
+        assert summary["escalation_count"] == 1
+
+    def test_concurrent_writes_and_reads(self, provider):
+        """Writers from many threads share the write connection without losing entries"""
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            saved = list(executor.map(provider.save_context_entry, map(make_entry, range(200))))
+            summaries = list(executor.map(lambda _: provider.get_context_summary("user_1", "session_1"), range(50)))
+
+        assert all(saved)
+        assert all("error" not in summary for summary in summaries)
+        assert len(provider.get_context(user_id="user_1", limit=500)) == 200
+
+    def test_read_pool_is_bounded(self, provider):
+        """configure_for_simulation caps the number of reader connections"""
+        provider.configure_for_simulation(pool_size=2)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda _: provider.get_context(user_id="user_1"), range(100)))
+
+        assert provider._read_conns_opened <= 2
+
+    def test_readers_are_read_only(self, provider):
+        """Pooled reader connections reject writes"""
+        with provider._reader() as conn:
+            with pytest.raises(sqlite3.OperationalError):
+                conn.execute("DELETE FROM context_entries")
+
+    def test_connections_are_tuned(self, provider):
+        """Pooled connections use WAL and leave foreign key enforcement at the SQLite default"""
+        with provider._reader() as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+            assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 0
+
+    def test_acquire_conn_is_one_transaction(self, provider):
+        """A failing acquire_conn block rolls back its writes"""
+        provider.save_context_entry(make_entry(1))
+        with pytest.raises(RuntimeError):
+            with provider.acquire_conn() as conn:
+                conn.execute("DELETE FROM context_entries")
+                raise RuntimeError("abort")
+
+        assert len(provider.get_context(user_id="user_1")) == 1
+
+    def test_close_releases_and_reopens(self, provider):
+        """close() closes pooled connections; later calls open new ones"""
+        provider.save_context_entry(make_entry(1))
+        provider.get_context(user_id="user_1")
+        with provider._reader() as reader:
+            pass
+
+        provider.close()
+
+        with pytest.raises(sqlite3.ProgrammingError):
+            reader.execute("SELECT 1")
+        assert provider._write_conn is None
+        assert len(provider.get_context(user_id="user_1")) == 1
+        assert provider.save_context_entry(make_entry(2))
@@ -0,0 +1,114 @@
+"""
+Tests for async response generation in the LLM providers.
+Provider clients are replaced with mocks so no model is loaded.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from langchain_core.messages import HumanMessage, SystemMessage
+
+from src.core.logging import ModelInferenceError
+from src.integrations import llm_providers
+from src.integrations.llm_providers import LLMProvider, LLMProviderWithFallback
+
+
+def make_provider(provider_type="openai", model_name="test-model"):
+    """Provider whose client is a mock with sync and async invoke"""
+    client = Mock()
+    client.invoke.return_value = Mock(content="sync answer")
+    client.ainvoke = AsyncMock(return_value=Mock(content="async answer"))
+    with patch.object(LLMProvider, "_shared_client", return_value=client):
+        return LLMProvider({"type": provider_type, "model_name": model_name})
+
+
+@pytest.fixture
+def no_retry_delay():
+    """Skip the retry backoff sleeps"""
+    with patch.object(llm_providers.asyncio, "sleep", AsyncMock()) as sleep, \
+         patch.object(llm_providers.time, "sleep"):
+        yield sleep
+
+
+class TestAsyncGeneration:
+    """Test LLMProvider.agenerate_response"""
+
+    def test_returns_response_content(self):
+        """The message content is returned as text"""
+        provider = make_provider()
+
+        assert asyncio.run(provider.agenerate_response("Hello", "Be brief")) == "async answer"
+        provider.client.ainvoke.assert_awaited_once_with(
+            [SystemMessage(content="Be brief"), HumanMessage(content="Hello")]
+        )
+
+    @pytest.mark.parametrize("provider_type", ["openai", "deepinfra", "llama"])
+    def test_sends_same_input_as_sync_path(self, provider_type):
+        """Sync and async calls send the provider the same formatted input"""
+        provider = make_provider(provider_type)
+        provider.generate_response("Hello", "Be brief")
+        asyncio.run(provider.agenerate_response("Hello", "Be brief"))
+
+        assert provider.client.ainvoke.await_args == provider.client.invoke.call_args
+
+    def test_plain_string_responses(self):
+        """Clients returning strings rather than messages are supported"""
+        provider = make_provider("deepinfra")
+        provider.client.ainvoke.return_value = "plain answer"
+
+        assert asyncio.run(provider.agenerate_response("Hello")) == "plain answer"
+
+    def test_retries_transient_failures(self, no_retry_delay):
+        """A failed call is retried after an async backoff"""
+        provider = make_provider()
+        provider.client.ainvoke.side_effect = [RuntimeError("timeout"), Mock(content="second try")]
+
+        assert asyncio.run(provider.agenerate_response("Hello")) == "second try"
+        assert provider.client.ainvoke.await_count == 2
+        no_retry_delay.assert_awaited_once_with(1.0)
+
+    def test_raises_inference_error_after_retries(self, no_retry_delay):
+        """Persistent failures surface as ModelInferenceError"""
+        provider = make_provider()
+        provider.client.ainvoke.side_effect = RuntimeError("down")
+
+        with pytest.raises(ModelInferenceError):
+            asyncio.run(provider.agenerate_response("Hello"))
+        assert provider.client.ainvoke.await_count == 3
+
+
+class TestAsyncFallback:
+    """Test LLMProviderWithFallback.agenerate_response"""
+
+    @pytest.fixture
+    def providers(self):
+        return {name: make_provider(model_name=name) for name in ("primary", "backup")}
+
+    @pytest.fixture
+    def chain(self, providers):
+        factory = Mock()
+        factory.create_provider.side_effect = lambda name: providers[name]
+        return LLMProviderWithFallback(factory, ["primary", "backup"])
+
+    def test_uses_first_model(self, chain, providers):
+        """A working first model answers without touching the fallback"""
+        assert asyncio.run(chain.agenerate_response("Hello")) == "async answer"
+        assert chain.model_name == "primary"
+        providers["backup"].client.ainvoke.assert_not_awaited()
+
+    def test_falls_back_to_next_model(self, chain, providers, no_retry_delay):
+        """A model that fails its retries is replaced by the next in the chain"""
+        providers["primary"].client.ainvoke.side_effect = RuntimeError("down")
+        providers["backup"].client.ainvoke.return_value = Mock(content="backup answer")
+
+        assert asyncio.run(chain.agenerate_response("Hello")) == "backup answer"
+        assert chain.model_name == "backup"
+
+    def test_exhausted_chain_raises(self, chain, providers, no_retry_delay):
+        """When every model fails the chain raises ModelInferenceError"""
+        for provider in providers.values():
+            provider.client.ainvoke.side_effect = RuntimeError("down")
+
+        with pytest.raises(ModelInferenceError, match="All models in fallback chain failed"):
+            asyncio.run(chain.agenerate_response("Hello"))
@@ -0,0 +1,135 @@
+"""
+Tests for the demo orchestrator's hand-off from routing to human agents.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.core.config import ConfigManager
+from src.core.context_manager import SQLiteContextProvider
+from src.data.human_agents_repository import SQLiteHumanAgentRepository
+from src.simulation import demo_orchestrator
+from src.simulation.demo_orchestrator import DemoOrchestrator
+from src.simulation.employee_simulator import EmployeeSimulator
+
+CONFIG_DIR = str(Path(__file__).resolve().parents[3] / "config")
+
+
+class TestHumanHandoff:
+    """Test handing escalated cases to simulated employees"""
+
+    @pytest.fixture
+    def orchestrator(self, tmp_path):
+        """Orchestrator without LLM agents, backed by temporary databases"""
+        repository = SQLiteHumanAgentRepository(str(tmp_path / "agents.db"))
+        with patch.object(demo_orchestrator, "EmployeeSimulator", lambda: EmployeeSimulator(repository=repository, seed=7)):
+            orchestrator = DemoOrchestrator(
+                config_manager=ConfigManager(CONFIG_DIR),
+                context_provider=SQLiteContextProvider(str(tmp_path / "context.db")),
+                use_real_agents=False,
+                enable_trace_collection=False,
+            )
+        yield orchestrator
+        orchestrator.context_provider.close()
+
+    @pytest.fixture
+    def routed_demo(self, orchestrator):
+        """A demo routed to a human agent, returning (demo_id, assigned employee id)"""
+        demo_id = orchestrator.start_demo_scenario(orchestrator.scenario_names[0])["demo_id"]
+        routing = orchestrator.simulate_routing_decision(demo_id)
+        return demo_id, routing["assigned_employee"]["id"]
+
+    def _saturate(self, orchestrator, employee_ids):
+        for employee in orchestrator.employee_simulator.fallback_employees:
+            if employee["id"] in employee_ids:
+                employee["current_workload"] = employee["max_concurrent"]
+
+    def test_assigned_employee_handles_case(self, orchestrator, routed_demo):
+        """A free employee takes the case and the conversation continues"""
+        demo_id, employee_id = routed_demo
+        handoff = orchestrator.simulate_human_agent_response(demo_id)
+
+        assert handoff["next_step"] == "customer_response_to_human"
+        assert handoff["employee_response"]["employee"]["id"] == employee_id
+        orchestrator.simulate_customer_response_to_human(demo_id)
+        resolution = orchestrator.simulate_resolution(demo_id)
+        assert resolution["resolution_result"]["case_resolved"] is True
+
+    def test_reroutes_when_assigned_employee_fills_up(self, orchestrator, routed_demo):
+        """An employee reaching capacity after routing hands the case to someone else"""
+        demo_id, employee_id = routed_demo
+        self._saturate(orchestrator, {employee_id})
+
+        handoff = orchestrator.simulate_human_agent_response(demo_id)
+
+        assert handoff["next_step"] == "customer_response_to_human"
+        assert handoff["employee_response"]["employee"]["id"] != employee_id
+        assert "case_id" in orchestrator.active_demonstrations[demo_id]["employee_interaction"]
+
+    def test_queues_when_every_employee_is_at_capacity(self, orchestrator, routed_demo):
+        """With nobody free the case is queued and resolution still completes"""
+        demo_id, _ = routed_demo
+        self._saturate(orchestrator, {emp["id"] for emp in orchestrator.employee_simulator.fallback_employees})
+
+        handoff = orchestrator.simulate_human_agent_response(demo_id)
+        demo = orchestrator.active_demonstrations[demo_id]
+
+        assert handoff["next_step"] == "resolution"
+        assert handoff["employee_response"]["escalation_handled"] is False
+        assert demo["escalation_data"]["status"] == "queued"
+        assert demo["employee_interaction"] is None
+        with pytest.raises(ValueError):
+            orchestrator.simulate_customer_response_to_human(demo_id)
+        assert orchestrator.simulate_resolution(demo_id)["demo_completed"] is True
+
+
+class TestConcurrentDemos:
+    """Test running demos from several threads against one orchestrator"""
+
+    @pytest.fixture
+    def orchestrator(self, tmp_path):
+        repository = SQLiteHumanAgentRepository(str(tmp_path / "agents.db"))
+        with patch.object(demo_orchestrator, "EmployeeSimulator", lambda: EmployeeSimulator(repository=repository)):
+            orchestrator = DemoOrchestrator(
+                config_manager=ConfigManager(CONFIG_DIR),
+                context_provider=SQLiteContextProvider(str(tmp_path / "context.db")),
+                use_real_agents=False,
+            )
+        yield orchestrator
+        orchestrator.context_provider.close()
+
+    def test_demo_ids_are_unique(self, orchestrator):
+        """Demos started in the same second get distinct ids"""
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            demo_ids = list(executor.map(
+                lambda _: orchestrator.start_demo_scenario(orchestrator.scenario_names[0])["demo_id"], range(200)
+            ))
+
+        assert len(set(demo_ids)) == 200
+
+    def test_concurrent_escalations_complete(self, orchestrator):
+        """Escalated demos run in parallel threads are handled, rerouted or queued without errors"""
+        simulator = orchestrator.employee_simulator
+        capacity_seen = []
+
+        def escalate(_):
+            demo_id = orchestrator.start_demo_scenario(orchestrator.scenario_names[1])["demo_id"]
+            routing = orchestrator.simulate_routing_decision(demo_id)["routing_decision"]
+            if "assigned_employee" in routing:
+                handoff = orchestrator.simulate_human_agent_response(demo_id)
+                capacity_seen.append(all(
+                    emp["current_workload"] <= emp["max_concurrent"] for emp in simulator.fallback_employees
+                ))
+                if handoff["next_step"] == "customer_response_to_human":
+                    orchestrator.simulate_customer_response_to_human(demo_id)
+            return orchestrator.simulate_resolution(demo_id)["demo_completed"]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            completed = list(executor.map(escalate, range(40)))
+
+        assert all(completed)
+        assert all(capacity_seen)
+        assert simulator.get_active_cases_summary()["total_active_cases"] == 0
@@ -0,0 +1,186 @@
+"""
+Tests for the employee simulator: resolution phrase detection and case handling.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.data.human_agents_repository import SQLiteHumanAgentRepository
+from src.simulation import employee_simulator
+from src.simulation.employee_simulator import (
+    _RESOLUTION_RE,
+    EmployeeSimulator,
+    _contains_resolution_phrase,
+    close_thread_loops,
+)
+
+
+class TestResolutionPhrases:
+    """Test resolution phrase detection"""
+
+    @pytest.mark.parametrize(
+        "message, expected",
+        [
+            ("Thank you, that resolved my issue!", True),
+            ("PERFECT, it is FIXED now", True),
+            ("That's great", True),
+            ("It is still not working", False),
+            ("", False),
+        ],
+    )
+    def test_matches_stdlib_regex(self, message, expected):
+        """Detection agrees with the stdlib regex fallback"""
+        assert _contains_resolution_phrase(message) is expected
+        assert (_RESOLUTION_RE.search(message) is not None) is expected
+
+    def test_regex_fallback_without_hyperscan(self, monkeypatch):
+        """Without a Hyperscan database the stdlib regex is used"""
+        monkeypatch.setattr(employee_simulator, "_RESOLUTION_DB", None)
+        assert _contains_resolution_phrase("that worked") is True
+        assert _contains_resolution_phrase("nope") is False
+
+    def test_concurrent_scans(self):
+        """Scans from many threads at once all succeed"""
+        messages = ["Thank you so much", "still broken"] * 500
+        expected = [_RESOLUTION_RE.search(message) is not None for message in messages]
+        failures = []
+        barrier = threading.Barrier(8)
+
+        def scan():
+            barrier.wait()
+            try:
+                if [_contains_resolution_phrase(message) for message in messages] != expected:
+                    failures.append("mismatch")
+            except Exception as e:
+                failures.append(repr(e))
+
+        threads = [threading.Thread(target=scan) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert failures == []
+
+
+class TestCaseHandling:
+    """Test escalated case handling against the fallback roster"""
+
+    @pytest.fixture
+    def simulator(self, tmp_path):
+        """Simulator over an empty agents database, so the fallback roster is used"""
+        return EmployeeSimulator(repository=SQLiteHumanAgentRepository(str(tmp_path / "agents.db")), seed=7)
+
+    def _handle(self, simulator, employee_id="emp_001"):
+        return simulator.handle_escalated_case(
+            assigned_employee_id=employee_id,
+            customer_context={"frustration_level": 5, "session_id": "session_1"},
+            escalation_reason="Quality threshold exceeded",
+            customer_query="I need help with my billing statement",
+        )
+
+    def test_case_lifecycle_tracks_workload(self, simulator):
+        """Handling a case takes a slot and resolving it frees the slot"""
+        result = self._handle(simulator)
+        employee = simulator._by_id["emp_001"]
+
+        assert result["escalation_handled"] is True
+        assert employee["current_workload"] == 1
+
+        follow_up = simulator.continue_conversation(result["case_id"], "Thank you, that worked", 2)
+
+        assert follow_up["case_resolved"] is True
+        assert employee["current_workload"] == 0
+        assert simulator.get_active_cases_summary()["total_active_cases"] == 0
+
+    def test_roster_shift_hours_in_minutes(self, simulator):
+        """Working hours are converted to minutes since midnight once, at roster creation"""
+        for employee in simulator.fallback_employees:
+            hours = employee["working_hours"]
+            assert employee["_start_min"] == int(hours["start"][:2]) * 60 + int(hours["start"][3:])
+            assert employee["_end_min"] == int(hours["end"][:2]) * 60 + int(hours["end"][3:])
+        assert simulator._by_id["emp_001"]["_start_min"] == 9 * 60
+        assert simulator._by_id["emp_001"]["_end_min"] == 17 * 60
+
+    def test_employee_at_capacity_is_not_assigned(self, simulator):
+        """A full employee declines the case without taking another slot"""
+        employee = simulator._by_id["emp_001"]
+        for _ in range(employee["max_concurrent"]):
+            assert self._handle(simulator)["escalation_handled"] is True
+
+        result = self._handle(simulator)
+
+        assert result["escalation_handled"] is False
+        assert result["queue_position"] >= 1
+        assert employee["current_workload"] == employee["max_concurrent"]
+
+    def test_concurrent_cases_respect_capacity(self, simulator):
+        """Cases handled from many threads never overfill an employee"""
+        employee = simulator._by_id["emp_005"]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: self._handle(simulator, "emp_005"), range(32)))
+
+        handled = [result for result in results if result["escalation_handled"]]
+        assert len(handled) == employee["max_concurrent"]
+        assert employee["current_workload"] == employee["max_concurrent"]
+        assert len({result["case_id"] for result in handled}) == len(handled)
+        assert simulator.get_active_cases_summary()["cases_by_employee"]["emp_005"] == employee["max_concurrent"]
+
+    def test_database_lookup_from_worker_thread(self, simulator):
+        """Employee lookups query the repository from threads without an event loop"""
+        simulator.repository.get_by_id = AsyncMock(return_value=None)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            employee = executor.submit(simulator._get_employee, "emp_002").result()
+
+        assert employee["id"] == "emp_002"
+        simulator.repository.get_by_id.assert_awaited_once_with("emp_002")
+
+    def test_database_workload_updates_from_worker_thread(self, simulator):
+        """Assignment and completion reach the agent service from threads without an event loop"""
+        simulator.agent_service = Mock(
+            assign_conversation=AsyncMock(return_value=True),
+            complete_conversation=AsyncMock(return_value=True),
+        )
+
+        def lifecycle():
+            case_id = self._handle(simulator)["case_id"]
+            simulator.continue_conversation(case_id, "Thank you, that worked", 2)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            executor.submit(lifecycle).result()
+
+        simulator.agent_service.assign_conversation.assert_awaited_once_with("emp_001", "session_1")
+        simulator.agent_service.complete_conversation.assert_awaited_once_with("emp_001", "session_1")
+
+    def test_database_workload_update_scheduled_in_running_loop(self, simulator):
+        """Inside a running event loop the assignment is scheduled as a task"""
+        simulator.agent_service = Mock(assign_conversation=AsyncMock(return_value=True))
+
+        async def handle():
+            self._handle(simulator)
+            simulator.agent_service.assign_conversation.assert_not_awaited()
+            await asyncio.sleep(0)
+
+        asyncio.run(handle())
+        simulator.agent_service.assign_conversation.assert_awaited_once_with("emp_001", "session_1")
+
+    def test_close_thread_loops(self, simulator):
+        """Loops opened by worker threads are closed once their work is done"""
+        simulator.repository.get_by_id = AsyncMock(return_value=None)
+
+        def lookup():
+            simulator._get_employee("emp_002")
+            return employee_simulator._thread_loops.loop
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            loop = executor.submit(lookup).result()
+
+        assert not loop.is_closed()
+        close_thread_loops()
+
+        assert loop.is_closed()
+        assert loop not in employee_simulator._opened_loops
@@ -0,0 +1,272 @@
+"""
+Tests for the human customer simulator: escalation decisions, response
+analysis, personality rewrites and batched interaction creation.
+"""
+
+import pytest
+
+from src.simulation import human_customer_simulator
+from src.simulation.human_customer_simulator import (
+    _CONTEXT_TEMPLATES,
+    _URGENCY_PHRASES,
+    CustomerPersonality,
+    CustomerScenario,
+    HumanCustomerSimulator,
+    _apply_deterministic,
+    _matched_phrase_categories,
+    _session_prefix,
+)
+
+INTERACTION_KEYS = {
+    "customer_id",
+    "session_id",
+    "personality",
+    "scenario",
+    "initial_frustration_level",
+    "initial_query",
+    "conversation_context",
+    "expected_escalation",
+    "customer_goals",
+}
+
+
+@pytest.fixture(params=["automaton", "regex"])
+def phrase_matcher(request, monkeypatch):
+    """Run a test with the Aho-Corasick automaton and with the regex fallback"""
+    if request.param == "automaton":
+        if human_customer_simulator._PHRASE_AUTOMATON is None:
+            pytest.skip("pyahocorasick is not installed")
+    else:
+        monkeypatch.setattr(human_customer_simulator, "_PHRASE_AUTOMATON", None)
+    return request.param
+
+
+@pytest.fixture
+def simulator():
+    return HumanCustomerSimulator(seed=42)
+
+
+def _set_customer(simulator, personality, scenario, frustration=0):
+    simulator.current_personality = personality
+    simulator.current_scenario = scenario
+    simulator.frustration_level = frustration
+
+
+class TestEscalationDecisions:
+    """Test the precomputed escalation rules"""
+
+    @pytest.mark.parametrize(
+        "personality, scenario, frustration, expected",
+        [
+            (CustomerPersonality.POLITE, CustomerScenario.SIMPLE_QUESTION, 0, False),
+            (CustomerPersonality.POLITE, CustomerScenario.SIMPLE_QUESTION, 6, False),
+            (CustomerPersonality.POLITE, CustomerScenario.SIMPLE_QUESTION, 7, True),
+            (CustomerPersonality.IMPATIENT, CustomerScenario.BILLING_PROBLEM, 4, False),
+            (CustomerPersonality.IMPATIENT, CustomerScenario.BILLING_PROBLEM, 5, True),
+            (CustomerPersonality.TECHNICAL, CustomerScenario.COMPLEX_INTEGRATION, 0, True),
+            (CustomerPersonality.CONFUSED, CustomerScenario.REPEAT_ISSUE, 0, True),
+            (CustomerPersonality.BUSINESS, CustomerScenario.ESCALATION_REQUEST, 0, True),
+            # Outside the 0-10 table the rules still apply
+            (CustomerPersonality.POLITE, CustomerScenario.SIMPLE_QUESTION, -2, False),
+            (CustomerPersonality.POLITE, CustomerScenario.SIMPLE_QUESTION, 15, True),
+        ],
+    )
+    def test_should_escalate(self, simulator, personality, scenario, frustration, expected):
+        assert simulator._should_escalate(personality, scenario, frustration) is expected
+
+    @pytest.mark.parametrize(
+        "personality, scenario, frustration, satisfaction, expected",
+        [
+            # Explicit requests and very high frustration escalate whatever the reply
+            (CustomerPersonality.POLITE, CustomerScenario.ESCALATION_REQUEST, 0, 10.0, True),
+            (CustomerPersonality.POLITE, CustomerScenario.SIMPLE_QUESTION, 8, 10.0, True),
+            (CustomerPersonality.POLITE, CustomerScenario.SIMPLE_QUESTION, 7, 1.0, False),
+            # Otherwise poor replies escalate below a per-customer satisfaction floor
+            (CustomerPersonality.IMPATIENT, CustomerScenario.SIMPLE_QUESTION, 0, 4.9, True),
+            (CustomerPersonality.IMPATIENT, CustomerScenario.SIMPLE_QUESTION, 0, 5.0, False),
+            (CustomerPersonality.POLITE, CustomerScenario.REPEAT_ISSUE, 0, 5.9, True),
+            (CustomerPersonality.IMPATIENT, CustomerScenario.REPEAT_ISSUE, 0, 6.0, False),
+            (CustomerPersonality.IMPATIENT, CustomerScenario.COMPLEX_INTEGRATION, 0, 6.9, True),
+            (CustomerPersonality.TECHNICAL, CustomerScenario.COMPLEX_INTEGRATION, 0, 7.0, False),
+        ],
+    )
+    def test_wants_escalation(self, simulator, personality, scenario, frustration, satisfaction, expected):
+        _set_customer(simulator, personality, scenario, frustration)
+        assert simulator._wants_escalation({}, {"satisfaction_score": satisfaction}) is expected
+
+
+class TestResponseAnalysis:
+    """Test chatbot response scoring on both phrase matchers"""
+
+    @pytest.mark.parametrize(
+        "response, expected",
+        [
+            ("Thank you for waiting. Here's how to fix it.", {"polite", "solution"}),
+            ("I'm sorry about the frustration with the API integration.", {"polite", "empathy", "tech"}),
+            ("I understand.", {"polite", "empathy"}),
+            ("Your policy renews next month.", set()),
+        ],
+    )
+    def test_matched_phrase_categories(self, phrase_matcher, response, expected):
+        assert _matched_phrase_categories(response.lower()) == expected
+
+    @pytest.mark.parametrize(
+        "personality, scenario, response, expected",
+        [
+            (
+                CustomerPersonality.POLITE,
+                CustomerScenario.SIMPLE_QUESTION,
+                "No.",
+                {"quality_score": 5.0, "satisfaction_score": 5.5, "meets_expectations": False, "addresses_concern": False},
+            ),
+            (
+                CustomerPersonality.POLITE,
+                CustomerScenario.SIMPLE_QUESTION,
+                "Thank you for asking. Here's how deductibles work, step by step.",
+                {"quality_score": 8.5, "satisfaction_score": 9.0, "meets_expectations": True, "addresses_concern": False},
+            ),
+            (
+                CustomerPersonality.FRUSTRATED,
+                CustomerScenario.REPEAT_ISSUE,
+                "I'm sorry about the delay. Let me help you check the claim status.",
+                {"quality_score": 7.0, "satisfaction_score": 10.0, "meets_expectations": True, "addresses_concern": True},
+            ),
+            (
+                CustomerPersonality.FRUSTRATED,
+                CustomerScenario.REPEAT_ISSUE,
+                "Your claim is still being processed by the adjuster.",
+                {"quality_score": 7.0, "satisfaction_score": 6.0, "meets_expectations": True, "addresses_concern": False},
+            ),
+            (
+                CustomerPersonality.TECHNICAL,
+                CustomerScenario.TECHNICAL_ISSUE,
+                "The configuration of your policy limits is listed on page two.",
+                {"quality_score": 8.0, "satisfaction_score": 7.0, "meets_expectations": True, "addresses_concern": False},
+            ),
+            (
+                CustomerPersonality.TECHNICAL,
+                CustomerScenario.TECHNICAL_ISSUE,
+                "Your policy limits are listed on page two of the document.",
+                {"quality_score": 6.0, "satisfaction_score": 7.0, "meets_expectations": True, "addresses_concern": False},
+            ),
+        ],
+    )
+    def test_analyze_response_quality(self, simulator, phrase_matcher, personality, scenario, response, expected):
+        _set_customer(simulator, personality, scenario)
+        assert simulator._analyze_response_quality(response, response.lower(), {}) == expected
+
+    def test_respond_to_chatbot_updates_frustration(self, simulator, phrase_matcher):
+        """A poor reply raises frustration and makes a frustrated customer ask for escalation"""
+        interaction = simulator.create_customer_interaction(
+            CustomerPersonality.FRUSTRATED, CustomerScenario.REPEAT_ISSUE, 3
+        )
+        reply = simulator.respond_to_chatbot("No.", interaction)
+
+        assert reply["frustration_change"] == 2
+        assert reply["updated_frustration_level"] == 5
+        assert reply["wants_escalation"] is True
+        assert reply["conversation_should_continue"] is True
+
+
+class TestPersonalityRewrites:
+    """Test query rewriting per personality"""
+
+    @pytest.mark.parametrize(
+        "personality, frustration, expected",
+        [
+            (CustomerPersonality.POLITE, 0, "Hello, I hope you can help me. Help? Thank you for your time."),
+            (CustomerPersonality.IMPATIENT, 2, "Help? Please respond quickly."),
+            (CustomerPersonality.FRUSTRATED, 5, "I'm getting frustrated here. Help?"),
+            (CustomerPersonality.FRUSTRATED, 6, "This is ridiculous! Help? Why is this so complicated?!"),
+            (CustomerPersonality.CONFUSED, 9, "I'm really confused about something. Help? Can you explain this in simple terms?"),
+        ],
+    )
+    def test_apply_personality(self, simulator, personality, frustration, expected):
+        assert simulator._apply_personality_to_query("Help?", personality, frustration) == expected
+
+    def test_deterministic_rewrites_are_memoized(self, simulator):
+        """Rewrites without a random phrase are computed once per query, personality and frustration band"""
+        _apply_deterministic.cache_clear()
+        for frustration in (6, 7, 8):
+            simulator._apply_personality_to_query("Why?", CustomerPersonality.FRUSTRATED, frustration)
+
+        info = _apply_deterministic.cache_info()
+        assert (info.misses, info.hits) == (1, 2)
+
+    def test_impatient_urgency_phrase_is_drawn_per_query(self):
+        """Very impatient customers get a fresh urgency phrase from the seeded RNG"""
+        first = HumanCustomerSimulator(seed=3)
+        second = HumanCustomerSimulator(seed=3)
+        queries = [first._apply_personality_to_query("Help?", CustomerPersonality.IMPATIENT, 5) for _ in range(20)]
+
+        assert {query.removeprefix("Help? ").removesuffix("!") for query in queries} <= set(_URGENCY_PHRASES)
+        assert queries == [second._apply_personality_to_query("Help?", CustomerPersonality.IMPATIENT, 5) for _ in range(20)]
+
+
+class TestInteractions:
+    """Test single and batched interaction creation"""
+
+    def test_batch_count_and_shape(self, simulator):
+        """Batched interactions have the same fields and valid values as single ones"""
+        single = simulator.create_customer_interaction()
+        batch = simulator.create_customer_interactions(50)
+
+        assert len(batch) == 50
+        assert all(interaction.keys() == single.keys() == INTERACTION_KEYS for interaction in batch)
+        assert len({interaction["session_id"] for interaction in batch}) == 50
+        assert len({interaction["customer_id"] for interaction in batch + [single]}) == 51
+
+        for interaction in batch:
+            personality = CustomerPersonality(interaction["personality"])
+            scenario = CustomerScenario(interaction["scenario"])
+            frustration = interaction["initial_frustration_level"]
+            assert 0 <= frustration <= 3
+            assert interaction["expected_escalation"] is simulator._should_escalate(personality, scenario, frustration)
+            assert interaction["conversation_context"].keys() == _CONTEXT_TEMPLATES[scenario].keys()
+            for key, value in interaction["conversation_context"].items():
+                template = _CONTEXT_TEMPLATES[scenario][key]
+                assert value in template if isinstance(template, (range, tuple)) else value == template
+
+    def test_batch_is_reproducible_with_seed(self):
+        """Seeded simulators produce the same batch apart from the process-wide ids"""
+        def strip_ids(interactions):
+            return [{k: v for k, v in interaction.items() if k not in ("customer_id", "session_id")} for interaction in interactions]
+
+        first = HumanCustomerSimulator(seed=7).create_customer_interactions(20)
+        second = HumanCustomerSimulator(seed=7).create_customer_interactions(20)
+
+        assert strip_ids(first) == strip_ids(second)
+
+    def test_empty_batch(self, simulator):
+        """An empty batch leaves the simulator state untouched"""
+        assert simulator.create_customer_interactions(0) == []
+        assert simulator.current_personality is None
+        assert len(simulator.conversation_history) == 0
+
+    def test_history_keeps_most_recent(self):
+        """Only the last history_limit interactions are kept"""
+        simulator = HumanCustomerSimulator(seed=1, history_limit=3)
+        single = simulator.create_customer_interaction()
+        batch = simulator.create_customer_interactions(4)
+
+        assert list(simulator.conversation_history) == batch[-3:]
+        assert single not in simulator.conversation_history
+
+    def test_unbounded_history(self):
+        """history_limit=None keeps every interaction"""
+        simulator = HumanCustomerSimulator(seed=1, history_limit=None)
+        simulator.create_customer_interactions(2000)
+
+        assert len(simulator.conversation_history) == 2000
+
+    def test_session_prefix_formatted_once_per_second(self, monkeypatch):
+        """The session stamp is reused within a second and refreshed after it"""
+        clock = [1_700_000_000.2]
+        monkeypatch.setattr(human_customer_simulator.time, "time", lambda: clock[0])
+        monkeypatch.setattr(human_customer_simulator, "_SESSION_STAMP", [0, ""])
+
+        first = _session_prefix()
+        clock[0] += 0.5
+        assert _session_prefix() is first
+        clock[0] += 1.0
+        assert _session_prefix() != first
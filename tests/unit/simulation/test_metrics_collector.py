@@ -0,0 +1,214 @@
+"""
+Tests for the simulation metrics collector.
+"""
+
+import json
+import threading
+from datetime import datetime
+from enum import Enum
+
+import numpy as np
+import pytest
+
+from src.simulation import _kernels, metrics_collector
+from src.simulation.metrics_collector import MetricsCollector, _ColumnBuffer
+
+
+class Decision(Enum):
+    ADEQUATE = "adequate"
+
+
+class TestExportResults:
+    """Test JSON export of a finished run"""
+
+    @pytest.fixture
+    def collector(self, tmp_path):
+        collector = MetricsCollector(str(tmp_path))
+        collector.start_run("run_1", 1)
+        cycle = collector.record_cycle_start("cycle_1", "Happy Path", "polite")
+        collector.record_quality_decision(cycle, {
+            "decision": Decision.ADEQUATE,
+            "overall_score": np.float32(8.5),
+            "confidence": 0.9,
+            "next_action": datetime(2024, 1, 2, 3, 4, 5),
+        })
+        collector.record_routing_decision(cycle, {
+            "routing_strategy": "skill_based",
+            "assigned_employee": {"id": "emp_001"},
+            "match_score": 0.9,
+            "routing_confidence": 0.8,
+        })
+        collector.record_cycle_completion(cycle, {"resolution_result": {"customer_satisfaction": 8.0}})
+        return collector
+
+    def test_stdlib_export_stringifies_non_json_values(self, collector, monkeypatch):
+        """Without orjson, enums, datetimes and numpy scalars are written with str()"""
+        monkeypatch.setattr(metrics_collector, "orjson", None)
+
+        with open(collector.export_results(collector.finish_run())) as f:
+            exported = json.load(f)
+
+        quality = exported["decision_details"]["quality_decisions"][0]
+        assert quality["decision"] == "Decision.ADEQUATE"
+        assert quality["next_action"] == "2024-01-02 03:04:05"
+        assert exported["cycle_results"][0]["quality_score"] == "8.5"
+        assert exported["agent_metrics"]["emp_001"]["cases_handled"] == 1
+
+    def test_orjson_export_handles_non_json_values(self, collector):
+        """orjson writes enums by value, datetimes as ISO 8601 and numpy scalars as numbers"""
+        pytest.importorskip("orjson")
+
+        with open(collector.export_results(collector.finish_run())) as f:
+            exported = json.load(f)
+
+        quality = exported["decision_details"]["quality_decisions"][0]
+        assert quality["decision"] == "adequate"
+        assert quality["next_action"] == "2024-01-02T03:04:05"
+        assert exported["cycle_results"][0]["quality_score"] == pytest.approx(8.5)
+        assert exported["agent_metrics"]["emp_001"]["cases_handled"] == 1
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_other_values_fall_back_to_str(self, collector, monkeypatch, use_orjson):
+        """Values neither encoder knows, and non-str keys, do not abort the export"""
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(metrics_collector, "orjson", None)
+        system_metrics = collector.finish_run()
+        collector.agent_metrics["emp_001"].agent_type = {1: object()}
+
+        with open(collector.export_results(system_metrics)) as f:
+            exported = json.load(f)
+
+        assert list(exported["agent_metrics"]["emp_001"]["agent_type"]) == ["1"]
+
+
+class TestColumnBuffer:
+    """Test the growable decision columns"""
+
+    def test_growth_keeps_recorded_rows(self):
+        """Appending past capacity grows every column without losing rows"""
+        columns = _ColumnBuffer({"label": object, "score": np.float64})
+        for i in range(200):
+            columns.append(f"row_{i}", float(i))
+
+        assert columns.size == 200
+        assert columns["label"].tolist() == [f"row_{i}" for i in range(200)]
+        assert columns["score"].tolist() == [float(i) for i in range(200)]
+
+    def test_columns_are_sliced_to_size(self):
+        """Unused capacity is not visible through indexing"""
+        columns = _ColumnBuffer({"score": np.float64}, capacity=16)
+        columns.append(1.5)
+
+        assert columns["score"].tolist() == [1.5]
+
+
+class TestRecordCycle:
+    """Test buffered decision recording and run totals"""
+
+    @pytest.fixture
+    def collector(self, tmp_path):
+        collector = MetricsCollector(str(tmp_path))
+        collector.start_run("run_1")
+        return collector
+
+    @staticmethod
+    def record_cycle(collector, cycle_id, quality_score=8.0, match_score=0.9, satisfaction=8.0):
+        cycle = collector.record_cycle_start(cycle_id, "Happy Path", "polite")
+        collector.record_quality_decision(cycle, {
+            "decision": "adequate" if quality_score >= 7.0 else "needs_adjustment",
+            "overall_score": quality_score,
+            "confidence": 0.9,
+        })
+        collector.record_frustration_decision(cycle, {
+            "overall_score": 7.0,
+            "overall_level": "high",
+            "intervention_needed": True,
+            "confidence": 0.8,
+        })
+        collector.record_routing_decision(cycle, {
+            "routing_strategy": "skill_based",
+            "assigned_employee": {"id": "emp_001"},
+            "match_score": match_score,
+            "routing_confidence": 0.8,
+        })
+        collector.record_cycle_completion(cycle, {"resolution_result": {"customer_satisfaction": satisfaction}})
+        return cycle
+
+    def test_decisions_stored_on_completion(self, collector):
+        """Decisions stay with the cycle until it completes"""
+        cycle = collector.record_cycle_start("cycle_1", "Happy Path", "polite")
+        collector.record_quality_decision(cycle, {"decision": "adequate", "overall_score": 8.0, "confidence": 0.9})
+
+        assert collector.quality_decisions == []
+        collector.record_cycle_completion(cycle, {})
+
+        assert [d["cycle_id"] for d in collector.quality_decisions] == ["cycle_1"]
+        assert cycle.pending_decisions == []
+        assert not {"pending_decisions", "start_monotonic"} & cycle.to_dict().keys()
+
+    def test_abandoned_cycle_records_nothing(self, collector):
+        """A cycle that never completes leaves no decisions or interventions"""
+        cycle = collector.record_cycle_start("cycle_1", "Happy Path", "polite")
+        collector.record_routing_decision(cycle, {"routing_strategy": "skill_based", "match_score": 0.1})
+
+        metrics = collector.finish_run()
+
+        assert collector.routing_decisions == []
+        assert metrics.failed_routes == 0
+
+    def test_finish_run_totals_and_accuracies(self, collector):
+        """Run totals and decision accuracies come from the recorded columns"""
+        self.record_cycle(collector, "cycle_1", quality_score=8.0, match_score=0.9, satisfaction=8.0)
+        self.record_cycle(collector, "cycle_2", quality_score=5.0, match_score=0.5, satisfaction=4.0)
+
+        metrics = collector.finish_run()
+
+        assert metrics.total_cycles == 2
+        assert metrics.avg_customer_satisfaction == pytest.approx(6.0)
+        assert metrics.escalation_rate == 1.0
+        assert metrics.quality_agent_accuracy == 1.0
+        assert metrics.frustration_detection_precision == 1.0
+        assert metrics.routing_success_rate == 0.5
+        assert metrics.quality_interventions == 1
+        assert metrics.frustration_interventions == 2
+        assert metrics.failed_routes == 1
+        assert collector.agent_metrics["emp_001"].successful_resolutions == 1
+
+    def test_kernels_match_numpy_reductions(self, collector, monkeypatch):
+        """The kernel reductions give the same accuracies as the NumPy expressions"""
+        for i in range(20):
+            self.record_cycle(collector, f"cycle_{i}", quality_score=i / 2, match_score=i / 20)
+        expected = collector.finish_run()
+
+        monkeypatch.setattr(metrics_collector, "NUMBA_MIN_DECISIONS", 0)
+        monkeypatch.setattr(metrics_collector, "quality_accuracy_count", _kernels._quality_accuracy_count)
+        monkeypatch.setattr(metrics_collector, "frustration_intervention_counts", _kernels._frustration_intervention_counts)
+        monkeypatch.setattr(metrics_collector, "routing_success_count", _kernels._routing_success_count)
+        actual = collector.finish_run()
+
+        assert actual.quality_agent_accuracy == expected.quality_agent_accuracy
+        assert actual.frustration_detection_precision == expected.frustration_detection_precision
+        assert actual.routing_success_rate == expected.routing_success_rate
+
+    def test_concurrent_completions_are_all_recorded(self, collector):
+        """Cycles completed from several threads keep columns and totals consistent"""
+        def worker(thread_index):
+            for i in range(50):
+                self.record_cycle(collector, f"cycle_{thread_index}_{i}")
+
+        threads = [threading.Thread(target=worker, args=(t,)) for t in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        metrics = collector.finish_run()
+
+        assert metrics.total_cycles == 400
+        assert len(collector.quality_decisions) == 400
+        assert len(collector.routing_decisions) == 400
+        assert metrics.frustration_interventions == 400
+        assert collector.agent_metrics["emp_001"].cases_handled == 400
+        assert len({d["cycle_id"] for d in collector.frustration_decisions}) == 400
@@ -0,0 +1,96 @@
+"""
+Tests for the simulation test runner's background trace export.
+"""
+
+import json
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.simulation import test_runner
+from src.simulation.test_runner import SimulationTestRunner
+
+CONFIG_DIR = str(Path(__file__).resolve().parents[3] / "config")
+
+
+class StubOrchestrator:
+    """Orchestrator stand-in that exports canned traces"""
+
+    def __init__(self, failing=(), raising=()):
+        self.failing = set(failing)
+        self.raising = set(raising)
+
+    def export_demo_trace(self, demo_id, format):
+        if demo_id in self.raising:
+            raise RuntimeError("trace store unavailable")
+        if demo_id in self.failing:
+            return json.dumps({"error": "Demo not found"})
+        if format == "detailed_json":
+            return json.dumps({"demo_id": demo_id})
+        return f"timestamp,event\n0,{demo_id}\n"
+
+
+class TestTraceExport:
+    """Test exporting cycle traces on the background writer thread"""
+
+    @pytest.fixture
+    def make_runner(self, tmp_path, monkeypatch):
+        """Build a runner around a stub orchestrator, writing traces under tmp_path"""
+        monkeypatch.chdir(tmp_path)
+
+        def _make(orchestrator):
+            with patch.object(test_runner, "SQLiteContextProvider", lambda **kwargs: Mock()), \
+                 patch.object(test_runner, "DemoOrchestrator", lambda **kwargs: orchestrator):
+                return SimulationTestRunner(CONFIG_DIR, use_real_llm_agents=False)
+
+        return _make
+
+    def test_queued_traces_are_written(self, make_runner):
+        """Every queued cycle gets a JSON trace, a CSV timeline and a summary entry"""
+        runner = make_runner(StubOrchestrator())
+        export = runner._start_trace_export("run_1")
+        for i in range(3):
+            export.trace_queue.put((f"cycle_{i}", f"demo_{i}"))
+
+        results = runner._finish_trace_export(export, 3)
+
+        assert not export.writer.is_alive()
+        assert results["total_cycles"] == 3
+        assert results["traces_exported"] == 3
+        assert results["traces_failed"] == 0
+        assert len(results["exported_files"]) == 6
+        assert json.loads((export.directory / "cycle_1_detailed.json").read_text()) == {"demo_id": "demo_1"}
+        assert (export.directory / "cycle_2_timeline.csv").read_text().endswith("0,demo_2\n")
+
+        summary = json.loads(Path(results["summary_file"]).read_text())
+        assert summary["traces_exported"] == 3
+        assert summary["exported_files"] == results["exported_files"]
+
+    def test_failed_exports_do_not_stop_the_writer(self, make_runner):
+        """Missing and raising traces are counted as failures and later cycles still export"""
+        runner = make_runner(StubOrchestrator(failing={"demo_0"}, raising={"demo_1"}))
+        export = runner._start_trace_export("run_1")
+        for i in range(3):
+            export.trace_queue.put((f"cycle_{i}", f"demo_{i}"))
+
+        results = runner._finish_trace_export(export, 3)
+
+        assert results["traces_exported"] == 1
+        assert results["traces_failed"] == 2
+        assert sorted(path.name for path in export.directory.iterdir()) == [
+            "cycle_2_detailed.json",
+            "cycle_2_timeline.csv",
+            "trace_export_summary.json",
+        ]
+
+    def test_no_summary_without_exported_traces(self, make_runner):
+        """An empty run stops the writer without writing a summary"""
+        runner = make_runner(StubOrchestrator())
+        export = runner._start_trace_export("run_1")
+
+        results = runner._finish_trace_export(export, 0)
+
+        assert not export.writer.is_alive()
+        assert "summary_file" not in results
+        assert list(export.directory.iterdir()) == []
@@ -0,0 +1,264 @@
+"""
+Tests for the hybrid workflow graph: routing, escalation merging and the async path.
+Nodes are replaced with stubs so no LLM provider is needed.
+"""
+
+import asyncio
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.workflows import hybrid_workflow
+from src.workflows.hybrid_workflow import (
+    HybridSystemWorkflow,
+    _merge_updates,
+    _next_query_id,
+    _reset_query_ids,
+    get_workflow,
+)
+
+CONFIG_DIR = str(Path(__file__).resolve().parents[3] / "config")
+
+
+class StubNode:
+    """Node stand-in that records calls and applies a fixed state update"""
+
+    def __init__(self, update=None):
+        self.update = update or {}
+        self.calls = 0
+
+    def __call__(self, state):
+        self.calls += 1
+        return {**state, **self.update}
+
+
+class AsyncStubNode(StubNode):
+    """Stub node with a native ainvoke, like the LLM-backed nodes"""
+
+    def __init__(self, update=None):
+        super().__init__(update)
+        self.async_calls = 0
+
+    async def ainvoke(self, state):
+        self.async_calls += 1
+        return {**state, **self.update}
+
+
+class TestHybridWorkflow:
+    """Test the compiled workflow with stub nodes"""
+
+    @pytest.fixture
+    def nodes(self):
+        """Default stubs: automation defers, the chatbot answers, no escalation"""
+        return {
+            "automation": StubNode({"automation_response": None, "requires_escalation": False}),
+            "answer": StubNode({"ai_response": "chatbot answer"}),
+            "evaluator": StubNode({"escalation_decision": False}),
+            "routing": StubNode({"routing_decision": {"agent": "emp_001"}, "escalation_data": {"priority": "high"}}),
+        }
+
+    @pytest.fixture
+    def make_workflow(self, nodes, tmp_path):
+        """Build a workflow whose nodes are the stubs in ``nodes``"""
+
+        def _make(**kwargs):
+            with patch.object(hybrid_workflow, "MockAutomationAgent", lambda *a: nodes["automation"]), \
+                 patch.object(hybrid_workflow, "ChatbotAgentNode", lambda *a: nodes["answer"]), \
+                 patch.object(hybrid_workflow, "EvaluatorAgentNode", lambda *a: nodes["evaluator"]), \
+                 patch.object(hybrid_workflow, "HumanRoutingAgentNode", lambda *a: nodes["routing"]):
+                return HybridSystemWorkflow(CONFIG_DIR, str(tmp_path / "context.db"), **kwargs)
+
+        return _make
+
+    def test_automation_response_skips_chatbot(self, nodes, make_workflow):
+        """A resolved automation response is delivered without the chatbot or evaluator"""
+        nodes["automation"].update = {"automation_response": "automated", "requires_escalation": False}
+        result = make_workflow().process_query("What is my balance?", "user_1")
+
+        assert result["final_response"] == "automated"
+        assert result["response_source"] == "automation"
+        assert result["escalated"] is False
+        assert nodes["answer"].calls == 0
+        assert nodes["evaluator"].calls == 0
+
+    def test_ai_response_when_not_escalated(self, nodes, make_workflow):
+        """Unresolved queries go through the chatbot and evaluator to an AI response"""
+        result = make_workflow().process_query("Explain my policy", "user_1")
+
+        assert result["final_response"] == "chatbot answer"
+        assert result["response_source"] == "ai_chatbot"
+        assert result["escalated"] is False
+        assert result["workflow_complete"] is True
+        assert nodes["routing"].calls == 0
+
+    def test_evaluator_escalation_routes_to_human(self, nodes, make_workflow):
+        """An evaluator escalation decision ends at human routing"""
+        nodes["evaluator"].update = {"escalation_decision": True}
+        result = make_workflow().process_query("This is unacceptable", "user_1")
+
+        assert result["escalated"] is True
+        assert result["escalation_data"] == {"priority": "high"}
+        assert nodes["routing"].calls == 1
+
+    def test_automation_escalation_survives_evaluation(self, nodes, make_workflow):
+        """An automation escalation flag is kept even when the evaluator does not escalate"""
+        nodes["automation"].update = {"automation_response": None, "requires_escalation": True}
+        result = make_workflow().process_query("Cancel everything", "user_1")
+
+        assert result["escalated"] is True
+        assert nodes["answer"].calls == 1
+        assert nodes["routing"].calls == 1
+
+    @pytest.mark.parametrize(
+        "automation_update, evaluator_update, expected_source, escalated",
+        [
+            ({"automation_response": "automated", "requires_escalation": False}, {}, "automation", False),
+            ({"automation_response": None, "requires_escalation": False}, {"escalation_decision": False}, "ai_chatbot", False),
+            ({"automation_response": None, "requires_escalation": False}, {"escalation_decision": True}, "unknown", True),
+            ({"automation_response": None, "requires_escalation": True}, {"escalation_decision": False}, "unknown", True),
+        ],
+    )
+    def test_async_path_matches_sync(
+        self, nodes, make_workflow, automation_update, evaluator_update, expected_source, escalated
+    ):
+        """aprocess_query routes exactly like process_query"""
+        nodes["automation"].update = automation_update
+        nodes["evaluator"].update = evaluator_update
+        workflow = make_workflow()
+
+        sync_result = workflow.process_query("Help me", "user_1", "session_1")
+        async_result = asyncio.run(workflow.aprocess_query("Help me", "user_1", "session_1"))
+
+        for result in (sync_result, async_result):
+            assert result["response_source"] == expected_source
+            assert result["escalated"] is escalated
+        assert sync_result["query_id"] != async_result["query_id"]
+
+    def test_async_path_awaits_native_ainvoke(self, nodes, make_workflow):
+        """Nodes with an ainvoke are awaited instead of run in a thread"""
+        nodes["answer"] = AsyncStubNode({"ai_response": "async answer"})
+        result = asyncio.run(make_workflow().aprocess_query("Help me", "user_1"))
+
+        assert result["final_response"] == "async answer"
+        assert nodes["answer"].async_calls == 1
+        assert nodes["answer"].calls == 0
+
+    def test_aprocess_queries_keeps_input_order(self, nodes, make_workflow):
+        """Batched queries come back in input order"""
+        workflow = make_workflow(max_concurrent_queries=2)
+        items = [(f"query {i}", f"user_{i}", None) for i in range(5)]
+        results = asyncio.run(workflow.aprocess_queries(items))
+
+        assert len(results) == 5
+        assert len({result["query_id"] for result in results}) == 5
+        assert all(result["response_source"] == "ai_chatbot" for result in results)
+
+    def test_speculative_routing_merges_both_updates(self, nodes, make_workflow):
+        """Speculative routing keeps the evaluator's and the router's updates without routing twice"""
+        nodes["automation"].update = {"automation_response": None, "requires_escalation": True}
+        nodes["evaluator"].update = {"escalation_decision": True, "escalation_reason": "low quality"}
+        result = asyncio.run(make_workflow(speculative_routing=True).aprocess_query("Help", "user_1"))
+
+        assert result["escalated"] is True
+        assert result["escalation_data"] == {"priority": "high"}
+        assert nodes["routing"].calls == 1
+
+    def test_speculative_chatbot_dropped_when_automation_resolves(self, nodes, make_workflow):
+        """The speculative chatbot answer is ignored when automation resolves the query"""
+        nodes["automation"].update = {"automation_response": "automated", "requires_escalation": False}
+        result = asyncio.run(make_workflow(speculative_chatbot=True).aprocess_query("Balance?", "user_1"))
+
+        assert result["response_source"] == "automation"
+        assert nodes["evaluator"].calls == 0
+
+    def test_response_cache_hit_skips_nodes(self, nodes, make_workflow):
+        """A cached answer is returned for the same normalized query without running nodes"""
+        workflow = make_workflow(response_cache_size=4)
+        first = workflow.process_query("Reset my  PASSWORD", "user_1")
+        second = workflow.process_query("reset my password", "user_2")
+
+        assert second["final_response"] == first["final_response"]
+        assert second["query_id"] != first["query_id"]
+        assert nodes["answer"].calls == 1
+
+    def test_response_cache_isolated_from_caller_mutation(self, nodes, make_workflow):
+        """Mutating a returned result, miss or hit, does not change later hits"""
+        nodes["automation"].update = {
+            "automation_response": "automated",
+            "automation_metadata": {"source": "faq"},
+            "requires_escalation": False,
+        }
+        workflow = make_workflow(response_cache_size=4)
+
+        miss = workflow.process_query("Opening hours?", "user_1")
+        miss["extra"] = True
+        miss["automation_metadata"]["source"] = "edited"
+        hit = workflow.process_query("Opening hours?", "user_1")
+        hit["automation_metadata"]["source"] = "edited again"
+        again = workflow.process_query("Opening hours?", "user_1")
+
+        assert "extra" not in again
+        assert again["automation_metadata"] == {"source": "faq"}
+
+    def test_response_cache_skips_escalations(self, nodes, make_workflow):
+        """Escalated results are never cached"""
+        nodes["evaluator"].update = {"escalation_decision": True}
+        workflow = make_workflow(response_cache_size=4)
+        workflow.process_query("Help", "user_1")
+        workflow.process_query("Help", "user_1")
+
+        assert nodes["routing"].calls == 2
+
+    def test_response_cache_evicts_least_recent(self, nodes, make_workflow):
+        """The cache holds at most response_cache_size entries"""
+        workflow = make_workflow(response_cache_size=2)
+        for query in ("one", "two", "one", "three", "one", "two"):
+            workflow.process_query(query, "user_1")
+
+        # "two" was evicted by "three"; "one" stayed recently used
+        assert nodes["answer"].calls == 4
+
+    def test_get_workflow_is_shared_per_configuration(self, nodes, tmp_path):
+        """get_workflow builds one workflow per (config_dir, context_db)"""
+        get_workflow.cache_clear()
+        try:
+            with patch.object(hybrid_workflow, "MockAutomationAgent", lambda *a: nodes["automation"]), \
+                 patch.object(hybrid_workflow, "ChatbotAgentNode", lambda *a: nodes["answer"]), \
+                 patch.object(hybrid_workflow, "EvaluatorAgentNode", lambda *a: nodes["evaluator"]), \
+                 patch.object(hybrid_workflow, "HumanRoutingAgentNode", lambda *a: nodes["routing"]):
+                first = get_workflow(CONFIG_DIR, str(tmp_path / "a.db"))
+                assert get_workflow(CONFIG_DIR, str(tmp_path / "a.db")) is first
+                assert get_workflow(CONFIG_DIR, str(tmp_path / "b.db")) is not first
+        finally:
+            get_workflow.cache_clear()
+
+
+class TestWorkflowHelpers:
+    """Test the module-level workflow helpers"""
+
+    def test_merge_updates_applies_changes_in_order(self):
+        """Only changed keys are merged, later results winning"""
+        shared = {"nested": 1}
+        snapshot = {"query": "q", "shared": shared, "a": 1}
+        first = {"query": "q", "shared": shared, "a": 2, "b": "first"}
+        second = {"query": "q", "shared": shared, "a": 1, "b": "second"}
+
+        merged = _merge_updates(snapshot, first, second)
+
+        assert merged == {"query": "q", "shared": shared, "a": 2, "b": "second"}
+        assert snapshot == {"query": "q", "shared": shared, "a": 1}
+
+    def test_query_ids_are_unique(self):
+        """Query ids do not repeat within a process"""
+        ids = {_next_query_id() for _ in range(1000)}
+        assert len(ids) == 1000
+
+    def test_reset_query_ids_draws_new_prefix(self):
+        """Resetting after a fork changes the query id prefix"""
+        before = _next_query_id().rsplit("-", 1)[0]
+        _reset_query_ids()
+        after = _next_query_id()
+
+        assert after.rsplit("-", 1)[0] != before
+        assert after.endswith("-0")